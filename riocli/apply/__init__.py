@@ -19,10 +19,12 @@ import click
 from click_help_colors import HelpColorsCommand
 
 from riocli.apply.parse import Applier
+from riocli.apply.scheduler import OnError
 from riocli.apply.util import print_context, process_files_values_secrets
 from riocli.config import get_config_from_context
 from riocli.constants import Colors
 from riocli.utils import print_centered_text
+from riocli.utils.namecache import invalidates_names
 
 
 @click.command(
@@ -94,8 +96,37 @@ from riocli.utils import print_centered_text
     default=6,
     help="Interval between retries defaults to 6",
 )
+@click.option(
+    "--critical-path",
+    is_flag=True,
+    default=False,
+    help="Start the resources with the longest chain of dependents first",
+)
+@click.option(
+    "--on-error",
+    type=click.Choice([e.value for e in OnError]),
+    default=OnError.FAIL_FAST.value,
+    show_default=True,
+    help="Stop at the first failure, continue with everything, or skip "
+    + "only the resources that depend on the failed ones",
+)
+@click.option(
+    "--skip-unchanged/--no-skip-unchanged",
+    default=False,
+    show_default=True,
+    help="Skip the resources that have not changed since they were "
+    + "last applied from this computer",
+)
+@click.option(
+    "--parse-workers",
+    type=int,
+    default=None,
+    help="Number of processes used to render and parse large sets of "
+    + "manifests. Defaults to the number of CPUs, 1 disables it",
+)
 @click.argument("files", nargs=-1)
 @click.pass_context
+@invalidates_names()
 def apply(
     ctx: click.Context,
     values: Iterable[str],
@@ -107,6 +138,10 @@ def apply(
     dryrun: bool = False,
     workers: int = 6,
     silent: bool = False,
+    critical_path: bool = False,
+    on_error: str = OnError.FAIL_FAST.value,
+    skip_unchanged: bool = False,
+    parse_workers: int | None = None,
 ) -> None:
     """Apply resource manifests.
 
@@ -128,7 +163,34 @@ def apply(
     manifests before applying them.
 
     You can specify the number of parallel workers with the ``--workers``
-    option. The default value is ``6``.
+    option. The default value is ``6``. A resource is applied as soon as
+    all of its dependencies are applied.
+
+    Large sets of manifests are rendered and parsed in parallel processes.
+    The ``--parse-workers`` option sets the number of processes, and ``1``
+    loads the manifests sequentially.
+
+    The ``--critical-path`` option starts the resources with the longest
+    chain of dependents first, weighted by how long each kind of resource
+    took to apply in the previous runs. This usually shortens the total
+    time on large manifest sets.
+
+    By default, the command stops at the first failure. With
+    ``--on-error=continue`` every resource is still attempted, and with
+    ``--on-error=skip-dependents`` only the resources that depend on a
+    failed one are skipped. A summary of the failed and skipped resources
+    is printed at the end so that a retry only needs to redo those.
+
+    With ``--skip-unchanged``, the command remembers the rendered manifests
+    it applied in each project. A resource is reported as ``Unchanged`` and
+    skipped when its manifest is the same as the last time and the resource
+    has not been modified on rapyuta.io since. This lists every kind in the
+    manifests upfront, so it pays off for large sets of manifests.
+
+    Set RIO_TRACE_SPANS to a file name to save the phases of the run and
+    every resource applied as a Chrome trace, which can be opened in
+    https://ui.perfetto.dev. Set RIO_TRACE_OTLP=1 to also send the spans
+    to the OpenTelemetry collector at OTEL_EXPORTER_OTLP_ENDPOINT.
 
     The ``--silent``, ``--force`` or ``-f`` option lets you skip the confirmation
     prompt before applying the manifests. This is particularly useful
@@ -156,6 +218,22 @@ def apply(
 
             $ rio apply -v values.yaml --delete-existing templates/
 
+        Apply the longest dependency chains first with more workers.
+
+            $ rio apply --critical-path -w 12 templates/
+
+        Apply everything that does not depend on a failed resource.
+
+            $ rio apply --on-error=skip-dependents templates/
+
+        Skip the resources that are unchanged since the last apply.
+
+            $ rio apply --skip-unchanged templates/
+
+        Save a trace of the apply to see where the time goes.
+
+            $ RIO_TRACE_SPANS=apply.json rio apply templates/
+
     """
     if not dryrun:
         print_context(ctx)
@@ -174,18 +252,24 @@ def apply(
 
     config = get_config_from_context(ctx)
 
-    applier = Applier(glob_files, abs_values, abs_secrets, config)
+    applier = Applier(
+        glob_files, abs_values, abs_secrets, config, load_workers=parse_workers
+    )
     applier.print_summary()
 
     if not silent and not dryrun:
         _ = click.confirm("\nDo you want to proceed?", default=True, abort=True)
 
     if delete_existing:
-        deleter = Applier(glob_files, abs_values, abs_secrets, config)
+        deleter = Applier(
+            glob_files, abs_values, abs_secrets, config, load_workers=parse_workers
+        )
         print_centered_text("Deleting Resources")
         deleter.delete(
             dryrun=dryrun,
             workers=workers,
+            critical_path=critical_path,
+            on_error=on_error,
             retry_count=retry_count,
             retry_interval=retry_interval,
         )
@@ -194,6 +278,9 @@ def apply(
     applier.apply(
         dryrun=dryrun,
         workers=workers,
+        critical_path=critical_path,
+        on_error=on_error,
+        skip_unchanged=skip_unchanged,
         retry_count=retry_count,
         retry_interval=retry_interval,
     )
@@ -258,8 +345,30 @@ def apply(
     default=6,
     help="Interval between retries defaults to 6",
 )
+@click.option(
+    "--critical-path",
+    is_flag=True,
+    default=False,
+    help="Start the resources with the longest chain of dependents first",
+)
+@click.option(
+    "--on-error",
+    type=click.Choice([e.value for e in OnError]),
+    default=OnError.FAIL_FAST.value,
+    show_default=True,
+    help="Stop at the first failure, continue with everything, or skip "
+    + "only the resources that depend on the failed ones",
+)
+@click.option(
+    "--parse-workers",
+    type=int,
+    default=None,
+    help="Number of processes used to render and parse large sets of "
+    + "manifests. Defaults to the number of CPUs, 1 disables it",
+)
 @click.argument("files", nargs=-1)
 @click.pass_context
+@invalidates_names()
 def delete(
     ctx: click.Context,
     values: str,
@@ -270,6 +379,9 @@ def delete(
     dryrun: bool = False,
     workers: int = 6,
     silent: bool = False,
+    critical_path: bool = False,
+    on_error: str = OnError.FAIL_FAST.value,
+    parse_workers: int | None = None,
 ) -> None:
     """Removes resources via manifests
 
@@ -292,6 +404,13 @@ def delete(
     You can specify the number of parallel workers with the ``--workers``
     option. The default value is ``6``.
 
+    The ``--critical-path`` option starts deleting the resources with the
+    longest chain of dependencies first.
+
+    The ``--on-error`` option works the same way as in the apply command.
+    With ``skip-dependents``, the resources that a failed resource depends
+    on are left in place.
+
     The ``--silent``, ``--force`` or ``-f`` option lets you skip the confirmation
     prompt before applying the manifests. This is particularly useful
     in CI/CD pipelines.
@@ -332,7 +451,9 @@ def delete(
 
     config = get_config_from_context(ctx)
 
-    applier = Applier(glob_files, abs_values, abs_secrets, config)
+    applier = Applier(
+        glob_files, abs_values, abs_secrets, config, load_workers=parse_workers
+    )
     applier.print_summary()
 
     if not silent and not dryrun:
@@ -342,6 +463,8 @@ def delete(
     applier.delete(
         dryrun=dryrun,
         workers=workers,
+        critical_path=critical_path,
+        on_error=on_error,
         retry_count=retry_count,
         retry_interval=retry_interval,
     )
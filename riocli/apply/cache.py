@@ -0,0 +1,194 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from importlib import metadata
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any
+
+from click import get_app_dir
+from jinja2 import TemplateSyntaxError, nodes
+
+from riocli.apply.util import ANSIBLE_FILTER_MODULES
+from riocli.bootstrap import __version__
+from riocli.config.config import Configuration
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import jinja2
+
+# Filters and functions whose output is not determined by the template
+# and the values alone. Templates using any of them are never cached.
+UNCACHEABLE_NAMES = frozenset(
+    {
+        "get_intf_ip",
+        "getenv",
+        "lipsum",
+        "password_hash",
+        "random",
+        "random_mac",
+        "shuffle",
+        "strftime",
+        "vault",
+    }
+)
+
+# Templates that render other templates. Those are not part of the key, so
+# templates using them are never cached.
+INCLUDING_NODES = (nodes.Extends, nodes.FromImport, nodes.Import, nodes.Include)
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateCache:
+    """On-disk cache of rendered and parsed manifest files.
+
+    Entries are addressed by a hash of the file's content, the values the
+    templates are rendered with, the set of filters available to them and
+    the versions of riocli and Ansible, so any change to those simply
+    results in a different entry:
+
+        cache = TemplateCache(environment, values)
+        key = cache.key(content, ".yaml")
+        documents = cache.get(key)
+        if documents is None:
+            documents = render_and_parse(content)
+            cache.set(key, content, documents)
+
+    Templates that use a filter with an output that depends on anything
+    else, such as an environment variable, or that include other templates
+    are not cached. The documents are stored as JSON, and those that JSON
+    cannot hold as they are, e.g. with dates, are not cached. The cache only
+    holds a bounded number of entries and the least recently used ones are
+    evicted first.
+    """
+
+    DIR_NAME = "template-cache"
+    MAX_ENTRIES = 512
+
+    def __init__(
+        self,
+        environment: jinja2.Environment,
+        values: Mapping[str, Any],
+        path: Path | None = None,
+    ):
+        self.environment = environment
+        self.path = path or Path(get_app_dir(Configuration.APP_NAME)) / self.DIR_NAME
+        self._context = _digest(
+            json.dumps(
+                {
+                    "filters": sorted(environment.filters),
+                    # The Ansible filters are only loaded when used.
+                    "ansible": [ANSIBLE_FILTER_MODULES, _version("ansible-core")],
+                    "riocli": __version__,
+                    "values": values,
+                },
+                sort_keys=True,
+                default=str,
+            )
+        )
+
+    def key(self, content: str, extension: str) -> str:
+        return _digest(f"{self._context}:{extension}:{content}")
+
+    def get(self, key: str) -> list[Any] | None:
+        entry = self.path / key
+
+        try:
+            with open(entry) as f:
+                documents = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring the template cache entry %s: %s", key, e)
+            return None
+
+        try:
+            # Bump the modification time to keep the entry in the cache.
+            os.utime(entry)
+        except OSError:
+            pass
+
+        return documents
+
+    def set(self, key: str, content: str, documents: list[Any] | None) -> None:
+        if documents is None or not self.is_cacheable(content):
+            return
+
+        try:
+            data = json.dumps(documents)
+        except (TypeError, ValueError):
+            return
+
+        # e.g. integer keys come back as strings.
+        if json.loads(data) != documents:
+            return
+
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=self.path, prefix=".entry-", delete=False
+            ) as f:
+                f.write(data)
+
+            os.replace(f.name, self.path / key)
+            self._evict()
+        except OSError as e:
+            logger.debug("Failed to write the template cache entry %s: %s", key, e)
+
+    def is_cacheable(self, content: str) -> bool:
+        """Checks if the template's output depends only on its values."""
+        try:
+            ast = self.environment.parse(content)
+        except TemplateSyntaxError:
+            return False
+
+        if next(ast.find_all(INCLUDING_NODES), None) is not None:
+            return False
+
+        for node in ast.find_all((nodes.Filter, nodes.Call)):
+            name = getattr(node, "name", None)
+            if isinstance(node, nodes.Call) and isinstance(node.node, nodes.Name):
+                name = node.node.name
+
+            if name in UNCACHEABLE_NAMES:
+                return False
+
+        return True
+
+    def _evict(self) -> None:
+        entries = [p for p in self.path.iterdir() if not p.name.startswith(".")]
+        if len(entries) <= self.MAX_ENTRIES:
+            return
+
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for p in entries[: len(entries) - self.MAX_ENTRIES]:
+            p.unlink(missing_ok=True)
+
+
+def _version(distribution: str) -> str | None:
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _digest(data: str) -> str:
+    return hashlib.sha256(data.encode()).hexdigest()
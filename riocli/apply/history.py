@@ -0,0 +1,94 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+from click import get_app_dir
+
+from riocli.config.config import Configuration
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class LatencyHistory:
+    """Keeps the observed time taken to process each kind of resource.
+
+    The history is stored in the CLI's configuration directory as an
+    exponential moving average per operation and kind, for example:
+
+        {"apply": {"deployment": 42.1, "secret": 0.4}, "delete": {...}}
+
+    It is only a hint for the scheduler, so a missing or corrupt file is
+    treated as an empty history.
+    """
+
+    FILE_NAME = "apply-latency.json"
+
+    # Weight of the latest observation in the moving average.
+    SMOOTHING = 0.3
+
+    def __init__(self, operation: str, path: Path | None = None):
+        self.operation = operation
+        self.path = path or Path(get_app_dir(Configuration.APP_NAME)) / self.FILE_NAME
+        self._data = self._load()
+
+    def get(self, kind: str) -> float | None:
+        return self._data.get(self.operation, {}).get(kind)
+
+    def known(self) -> dict[str, float]:
+        return dict(self._data.get(self.operation, {}))
+
+    def record(self, timings: Mapping[str, float]) -> None:
+        """Folds the per-object timings (keyed by object key) into the history."""
+        latencies = self._data.setdefault(self.operation, {})
+
+        for key, elapsed in timings.items():
+            kind = key.split(":", 1)[0]
+            previous = latencies.get(kind)
+            if previous is None:
+                latencies[kind] = elapsed
+            else:
+                latencies[kind] = (
+                    self.SMOOTHING * elapsed + (1 - self.SMOOTHING) * previous
+                )
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and rename it so that concurrent runs
+        # never observe a partially written file.
+        with NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=".apply-latency-", delete=False
+        ) as f:
+            json.dump(self._data, f)
+
+        os.replace(f.name, self.path)
+
+    def _load(self) -> dict[str, dict[str, float]]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+
+        return data
@@ -0,0 +1,134 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any
+
+from click import get_app_dir
+
+from riocli.config.config import Configuration
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Server managed fields that must not affect the hash of a manifest.
+_VOLATILE_METADATA = ("createdAt", "updatedAt")
+
+
+class ApplyLedger:
+    """Remembers what was last applied for every object of a project.
+
+    Each entry is keyed by the object key and holds the hash of the rendered
+    manifest along with the GUID and revision the server reported right
+    after the object was applied, for example:
+
+        {"secret:docker": {"hash": "9f2c...", "guid": "secret-x", "revision": "2"}}
+
+    An object is unchanged when the manifest hashes the same and the server
+    still reports the same GUID and revision, i.e. nobody has recreated or
+    modified it since. The revision is the generation of the object when the
+    kind has one, or the time it was last updated otherwise.
+
+    The ledger is only a cache, so a missing or corrupt file is treated as
+    an empty ledger and every object is applied.
+    """
+
+    DIR_NAME = "apply-ledger"
+
+    def __init__(self, project_guid: str, path: Path | None = None):
+        self.path = path or (
+            Path(get_app_dir(Configuration.APP_NAME))
+            / self.DIR_NAME
+            / f"{project_guid}.json"
+        )
+        self._data = self._load()
+
+    def is_unchanged(self, key: str, digest: str, remote: Any | None) -> bool:
+        """Checks the manifest and the server's copy against the last apply."""
+        entry = self._data.get(key)
+        if entry is None or remote is None:
+            return False
+
+        return entry == {"hash": digest, **server_revision(remote)}
+
+    def record(self, key: str, digest: str, remote: Any) -> None:
+        revision = server_revision(remote)
+        if revision["guid"] is None or revision["revision"] is None:
+            self.forget(key)
+            return
+
+        self._data[key] = {"hash": digest, **revision}
+
+    def forget(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=".apply-ledger-", delete=False
+        ) as f:
+            json.dump(self._data, f)
+
+        os.replace(f.name, self.path)
+
+    def _load(self) -> dict[str, dict[str, str | None]]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+
+        return data
+
+
+def manifest_hash(manifest: Mapping[str, Any]) -> str:
+    """Computes a stable hash of a rendered manifest.
+
+    The hash does not depend on the order of the keys, and ignores the
+    private attributes of the models and the server managed timestamps.
+    """
+    data = {k: v for k, v in manifest.items() if not k.startswith("_")}
+
+    metadata = data.get("metadata")
+    if isinstance(metadata, dict):
+        data["metadata"] = {
+            k: v for k, v in metadata.items() if k not in _VOLATILE_METADATA
+        }
+
+    encoded = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def server_revision(obj: Any) -> dict[str, str | None]:
+    """Extracts the GUID and revision from an object listed on the server."""
+    metadata = getattr(obj, "metadata", None)
+    guid = getattr(metadata, "guid", None)
+
+    revision = getattr(metadata, "generation", None)
+    if revision is None:
+        revision = getattr(metadata, "updatedAt", None)
+
+    return {
+        "guid": guid,
+        "revision": str(revision) if revision is not None else None,
+    }
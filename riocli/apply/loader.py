@@ -0,0 +1,166 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Renders and parses manifest files in a pool of processes.
+
+Both Jinja rendering and YAML parsing are CPU bound and hold the GIL, so
+threads do not help. The work is split in two stages that both preserve
+the order of the input:
+
+    1. Every file is rendered in a worker process.
+    2. The rendered YAML streams are cut into chunks of whole documents,
+       and the chunks are parsed in the worker processes.
+
+The second stage lets a single large multi-document file use every
+worker as well.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from riocli.utils import yaml_backend as yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import jinja2
+
+# Starting a pool of processes costs more than rendering and parsing a
+# handful of small files, so smaller inputs are loaded sequentially.
+PARALLEL_MIN_BYTES = 256 * 1024
+
+# The upper bound of the default number of processes.
+MAX_DEFAULT_WORKERS = 8
+
+# A line starting with a document marker. Such a line can not be a part of
+# a scalar, so cutting the stream before it always leaves whole documents.
+_DOCUMENT_START = re.compile(r"^---(?=\s|$)", re.MULTILINE)
+
+# Per process state of the workers, set up by _init_worker.
+_environment: jinja2.Environment | None = None
+_values: Mapping[str, Any] = {}
+
+
+def default_workers() -> int:
+    return min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+
+
+def load_parallel(
+    files: list[tuple[str, str, str]],
+    values: Mapping[str, Any],
+    workers: int,
+) -> list[list[Any] | None]:
+    """Renders and parses the (file name, extension, content) triples.
+
+    Returns the documents of every file in the same order as the input.
+    Any error is raised with the same message as the sequential path in
+    Applier._parse_content.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(values,)
+    ) as executor:
+        futures = [executor.submit(_render, content) for _, _, content in files]
+
+        rendered: list[str] = []
+        for (file_name, _, _), future in zip(files, futures, strict=True):
+            try:
+                rendered.append(future.result())
+            except Exception as e:
+                raise Exception(f"Error rendering template {file_name}: {e}")
+
+        chunks: list[tuple[int, str]] = []
+        results: list[list[Any] | None] = [None] * len(files)
+
+        for i, ((file_name, extension, _), content) in enumerate(
+            zip(files, rendered, strict=True)
+        ):
+            if extension == ".json":
+                try:
+                    results[i] = [json.loads(content)]
+                except json.JSONDecodeError as e:
+                    raise Exception(f"Failed to parse {file_name}: {e}")
+                continue
+
+            results[i] = []
+            chunks.extend((i, c) for c in split_documents(content, workers))
+
+        parsed = executor.map(_parse_yaml, [c for _, c in chunks])
+
+        failed: set[int] = set()
+        for (i, _), documents in zip(chunks, parsed, strict=True):
+            if documents is None:
+                failed.add(i)
+                continue
+
+            results[i].extend(documents)  # pyright:ignore[reportOptionalMemberAccess]
+
+    for i in sorted(failed):
+        # Parse the whole file again so that the error points at the right
+        # line of the file rather than the line within the chunk.
+        file_name = files[i][0]
+        try:
+            results[i] = list(yaml.safe_load_all(rendered[i]))
+        except yaml.YAMLError as e:
+            raise Exception(f"Failed to parse {file_name}: {e}")
+
+    return results
+
+
+def split_documents(content: str, parts: int) -> list[str]:
+    """Splits a YAML stream into at most `parts` streams of whole documents.
+
+    The chunks are roughly of equal size and parsing them one after the
+    other yields the same documents as parsing the whole stream.
+    """
+    if parts <= 1 or content.startswith("%") or "\n%" in content:
+        # Directives apply to the document that follows, keep them together.
+        return [content]
+
+    target = len(content) / parts
+    chunks: list[str] = []
+    begin = 0
+
+    for m in _DOCUMENT_START.finditer(content):
+        if m.start() - begin >= target:
+            chunks.append(content[begin : m.start()])
+            begin = m.start()
+
+    chunks.append(content[begin:])
+    return chunks
+
+
+def _init_worker(values: Mapping[str, Any]) -> None:
+    # Imported here to keep the module cheap to import in the parent.
+    from riocli.apply.util import init_jinja_environment
+
+    global _environment, _values
+    _environment = init_jinja_environment()
+    _values = values
+
+
+def _render(content: str) -> str:
+    assert _environment is not None
+    return _environment.from_string(content).render(**_values)
+
+
+def _parse_yaml(content: str) -> list[Any] | None:
+    try:
+        return list(yaml.safe_load_all(content))
+    except yaml.YAMLError:
+        return None
@@ -13,18 +13,28 @@
 # limitations under the License.
 from __future__ import annotations
 
-import graphlib
 import json
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import click
-import yaml
 from benedict import benedict
 from munch import munchify
 
+from riocli.apply.cache import TemplateCache
+from riocli.apply.history import LatencyHistory
+from riocli.apply.ledger import ApplyLedger, manifest_hash
+from riocli.apply.loader import PARALLEL_MIN_BYTES, default_workers, load_parallel
+from riocli.apply.scheduler import (
+    DEFAULT_MAX_WORKERS,
+    OnError,
+    Scheduler,
+    critical_path_priorities,
+)
+from riocli.apply.state import PREFETCH_MIN_OBJECTS, ServerState
 from riocli.apply.util import (
     get_resource_class,
     init_jinja_environment,
@@ -39,8 +49,11 @@ from riocli.exceptions import (
     ResourceNotFound,
 )
 from riocli.model.base import Model
-from riocli.utils import dump_all_yaml, print_centered_text, run_bash
+from riocli.utils import dump_all_yaml, print_centered_text, run_bash, tabulate_data
+from riocli.utils import yaml_backend as yaml
 from riocli.utils.graph import GraphVisualizer, Graphviz
+from riocli.utils.http import configure_pool
+from riocli.utils.spans import Span, SpanRecorder
 from riocli.utils.spinner import with_spinner
 
 if TYPE_CHECKING:
@@ -52,9 +65,10 @@ if TYPE_CHECKING:
 
     from riocli.config import Configuration
 
-DEFAULT_MAX_WORKERS = 6
 DELETE_POLICY_LABEL = "rapyuta.io/deletionPolicy"
 
+logger = logging.getLogger(__name__)
+
 
 class Applier:
     def __init__(
@@ -63,13 +77,24 @@ class Applier:
         values: Iterable[str],
         secrets: Iterable[str],
         config: Configuration,
+        load_workers: int | None = None,
     ):
         self.input_file_paths = files
         self.config = config
-        self.environment = init_jinja_environment()
-        self.values = self._load_values_and_secrets(values, secrets)
-        self.objects, self.manifests = self._load_objects(files)
-        self.dependency_graph, self.diagram = self._get_dependency_graph(self.objects)
+        self.load_workers = load_workers or default_workers()
+        # Exported at the end of apply or delete, see riocli.utils.spans.
+        self.spans = SpanRecorder("rio")
+
+        with self.spans.span("load"):
+            self.environment = init_jinja_environment()
+            with self.spans.span("values"):
+                self.values = self._load_values_and_secrets(values, secrets)
+            self.template_cache = self._get_template_cache()
+            self.objects, self.manifests = self._load_objects(files)
+
+        with self.spans.span("graph", objects=len(self.objects)):
+            graph, diagram = self._get_dependency_graph(self.objects)
+            self.dependency_graph, self.diagram = graph, diagram
 
     def print_summary(self) -> None:
         """Prints a summary table with Resource list for the operation."""
@@ -91,6 +116,9 @@ class Applier:
         retry_count: int,
         retry_interval: int,
         workers: int = DEFAULT_MAX_WORKERS,
+        critical_path: bool = False,
+        on_error: OnError | str = OnError.FAIL_FAST,
+        skip_unchanged: bool = False,
         spinner: Yaspin | None = None,
     ):
         """Apply the resources defined in the manifest files"""
@@ -100,9 +128,13 @@ class Applier:
             client = None
             v2_client = None
         else:
+            configure_pool(workers)
             client = self.config.new_client()
             v2_client = self.config.new_v2_client()
 
+        server_state = ServerState()
+        ledger = self._get_ledger() if skip_unchanged and not dryrun else None
+        results: dict[str, ApplyResult] = {}
         apply_func = partial(
             self._apply_manifest,
             client=client,
@@ -110,17 +142,52 @@ class Applier:
             dryrun=dryrun,
             retry_count=retry_count,
             retry_interval=retry_interval,
+            server_state=server_state,
+            ledger=ledger,
+            results=results,
             spinner=spinner,
         )
 
+        graph = self.dependency_graph
+        history = LatencyHistory(operation="apply")
+        scheduler = Scheduler(graph, workers=workers, on_error=on_error)
+        self.spans.root.name = "rio apply"
+
         try:
-            self._start_work(op=apply_func, work=self._get_apply_order(), workers=workers)
+            if not dryrun:
+                # The ledger needs the server's copy of every object to tell
+                # whether it is unchanged, so list every kind in that case.
+                with self.spans.span("prefetch"):
+                    self._prefetch_server_state(
+                        server_state,
+                        v2_client,
+                        workers,
+                        spinner,
+                        min_objects=1 if ledger is not None else PREFETCH_MIN_OBJECTS,
+                    )
+
+            if critical_path:
+                scheduler.priorities = self._get_priorities(graph, history)
+
+            self._run_traced(scheduler, apply_func, "apply")
+            if ledger is not None:
+                with self.spans.span("ledger"):
+                    self._update_ledger(ledger, server_state, v2_client, results)
+            if not dryrun:
+                with spinner.hidden():
+                    self._print_result_summary(scheduler, done_label="Applied")
             spinner.text = click.style("Apply successful.", fg=Colors.BRIGHT_GREEN)
             spinner.green.ok(Symbols.SUCCESS)
         except Exception as e:
+            with spinner.hidden():
+                self._print_result_summary(scheduler, done_label="Applied")
             spinner.text = click.style(f"Apply failed. Error: {e}", fg=Colors.BRIGHT_RED)
             spinner.red.fail(Symbols.ERROR)
             raise SystemExit(1) from e
+        finally:
+            if not dryrun:
+                self._record_latency(history, scheduler.timings)
+            self.spans.export()
 
     @with_spinner(text="Deleting...", timer=True)
     def delete(
@@ -129,6 +196,8 @@ class Applier:
         retry_count: int,
         retry_interval: int,
         workers: int = DEFAULT_MAX_WORKERS,
+        critical_path: bool = False,
+        on_error: OnError | str = OnError.FAIL_FAST,
         spinner: Yaspin | None = None,
     ):
         """Delete resources defined in manifests."""
@@ -138,6 +207,7 @@ class Applier:
             client = None
             v2_client = None
         else:
+            configure_pool(workers)
             client = self.config.new_client()
             v2_client = self.config.new_v2_client()
 
@@ -151,16 +221,127 @@ class Applier:
             spinner=spinner,
         )
 
+        graph = self._get_reverse_graph()
+        history = LatencyHistory(operation="delete")
+        scheduler = Scheduler(graph, workers=workers, on_error=on_error)
+        self.spans.root.name = "rio delete"
+
         try:
-            self._start_work(
-                op=delete_func, work=self._get_delete_order(), workers=workers
-            )
+            if critical_path:
+                scheduler.priorities = self._get_priorities(graph, history)
+
+            self._run_traced(scheduler, delete_func, "delete")
+            if not dryrun:
+                with spinner.hidden():
+                    self._print_result_summary(scheduler, done_label="Deleted")
             spinner.text = click.style("Delete successful.", fg=Colors.BRIGHT_GREEN)
             spinner.green.ok(Symbols.SUCCESS)
         except Exception as e:
+            with spinner.hidden():
+                self._print_result_summary(scheduler, done_label="Deleted")
             spinner.text = click.style(f"Delete failed. Error: {e}", fg=Colors.BRIGHT_RED)
             spinner.red.fail(Symbols.ERROR)
             raise SystemExit(1) from e
+        finally:
+            if not dryrun:
+                self._record_latency(history, scheduler.timings)
+            self.spans.export()
+
+    def _run_traced(
+        self, scheduler: Scheduler, op: Callable[[str], None], label: str
+    ) -> None:
+        """
+        Runs the operation over the graph with a span for every object.
+
+        The time every object waited on its dependencies, and then on a
+        free worker, is added as spans too, so that the critical path and
+        the lack of workers show up in the trace.
+        """
+        with self.spans.span("objects", workers=scheduler.workers) as parent:
+            try:
+                scheduler.run(self.spans.wrap(op, parent, label))
+            finally:
+                self._add_wait_spans(scheduler, parent)
+
+    def _add_wait_spans(self, scheduler: Scheduler, parent: Span) -> None:
+        for key, ready in scheduler.ready_at.items():
+            dependencies = scheduler.graph.get(key)
+            if dependencies:
+                self.spans.add(
+                    f"wait {key}",
+                    parent.start,
+                    ready,
+                    parent=parent,
+                    dependencies=", ".join(sorted(dependencies)),
+                )
+
+            started = scheduler.started_at.get(key)
+            if started is not None and started > ready:
+                self.spans.add(f"queued {key}", ready, started, parent=parent)
+
+    def _prefetch_server_state(
+        self,
+        server_state: ServerState,
+        v2_client: v2Client,
+        workers: int,
+        spinner: Yaspin,
+        min_objects: int = PREFETCH_MIN_OBJECTS,
+    ) -> None:
+        """Lists the existing objects upfront to skip failing creates."""
+        text = spinner.text
+        spinner.text = "Fetching existing resources..."
+        try:
+            server_state.prefetch(
+                self.objects.values(),
+                v2_client,
+                workers=workers,
+                min_objects=min_objects,
+            )
+        finally:
+            spinner.text = text
+
+    def _get_ledger(self) -> ApplyLedger | None:
+        project_guid = self.config.data.get("project_id")
+        if project_guid is None:
+            return None
+
+        return ApplyLedger(project_guid)
+
+    def _update_ledger(
+        self,
+        ledger: ApplyLedger,
+        server_state: ServerState,
+        v2_client: v2Client,
+        results: Mapping[str, ApplyResult],
+    ) -> None:
+        """Records the server's copy of the applied objects in the ledger.
+
+        Only the objects that were created or updated are listed once more,
+        by name, since their GUID and revision changed. The others are
+        recorded from the listing made before the apply. Objects that could
+        not be listed are forgotten.
+        """
+        changed = [
+            k
+            for k, r in results.items()
+            if r in (ApplyResult.CREATED, ApplyResult.UPDATED)
+        ]
+        refreshed = ServerState()
+        refreshed.prefetch([self.objects[k] for k in changed], v2_client, min_objects=1)
+
+        for key in results:
+            obj = self.objects[key]
+            state = refreshed if key in changed else server_state
+            remote = state.get(obj)
+            if remote is None:
+                ledger.forget(key)
+            else:
+                ledger.record(key, manifest_hash(obj), remote)
+
+        try:
+            ledger.save()
+        except OSError as e:
+            logger.debug("Failed to save the apply ledger: %s", e)
 
     def _apply_manifest(
         self,
@@ -170,6 +351,9 @@ class Applier:
         dryrun: bool = False,
         retry_count: int = 0,
         retry_interval: int = 0,
+        server_state: ServerState | None = None,
+        ledger: ApplyLedger | None = None,
+        results: dict[str, ApplyResult] | None = None,
         spinner: Yaspin | None = None,
     ) -> None:
         """Instantiate and apply the object manifest"""
@@ -178,7 +362,8 @@ class Applier:
         if obj_key not in self.objects:
             return
 
-        obj = self.objects[obj_key]
+        key = obj_key
+        obj = self.objects[key]
         obj_key = click.style(obj_key, bold=True)
 
         message_with_prompt(
@@ -187,20 +372,40 @@ class Applier:
             spinner=spinner,
         )
 
+        start = time.monotonic()
+
         try:
             result = ApplyResult.CREATED
-            if not dryrun:
+            if not dryrun and self._is_unchanged(key, obj, server_state, ledger):
+                result = ApplyResult.UNCHANGED
+            elif not dryrun:
                 result = obj.apply(
                     client=client,
                     v2_client=v2_client,
                     config=self.config,
                     retry_count=retry_count,
                     retry_interval=retry_interval,
+                    server_state=server_state,
                 )
 
+            if results is not None:
+                results[key] = result
+
+            elapsed = _format_elapsed(start)
+
+            if result == ApplyResult.UNCHANGED:
+                message_with_prompt(
+                    f"{Symbols.INFO} {obj_key} is unchanged",
+                    right_msg=elapsed,
+                    fg=Colors.WHITE,
+                    spinner=spinner,
+                )
+                return
+
             if result == ApplyResult.EXISTS:
                 message_with_prompt(
                     f"{Symbols.INFO} {obj_key} already exists",
+                    right_msg=elapsed,
                     fg=Colors.WHITE,
                     spinner=spinner,
                 )
@@ -208,6 +413,7 @@ class Applier:
 
             message_with_prompt(
                 f"{Symbols.SUCCESS} {result} {obj_key}",
+                right_msg=elapsed,
                 fg=Colors.GREEN,
                 spinner=spinner,
             )
@@ -219,6 +425,18 @@ class Applier:
             )
             raise Exception(f"{obj_key}: {str(ex)}")
 
+    @staticmethod
+    def _is_unchanged(
+        key: str,
+        obj: Model,
+        server_state: ServerState | None,
+        ledger: ApplyLedger | None,
+    ) -> bool:
+        if ledger is None or server_state is None:
+            return False
+
+        return ledger.is_unchanged(key, manifest_hash(obj), server_state.get(obj))
+
     def _delete_manifest(
         self,
         obj_key: str,
@@ -254,6 +472,8 @@ class Applier:
             )
             return
 
+        start = time.monotonic()
+
         try:
             if not dryrun and can_delete:
                 obj.delete(
@@ -266,6 +486,7 @@ class Applier:
 
             message_with_prompt(
                 f"{Symbols.SUCCESS} Deleted {obj_key}",
+                right_msg=_format_elapsed(start),
                 fg=Colors.GREEN,
                 spinner=spinner,
             )
@@ -286,19 +507,23 @@ class Applier:
 
     def _get_dependency_graph(
         self, objects: dict[str, Model]
-    ) -> tuple[graphlib.TopologicalSorter[str], GraphVisualizer]:
-        graph: graphlib.TopologicalSorter[str] = graphlib.TopologicalSorter()
+    ) -> tuple[dict[str, set[str]], GraphVisualizer]:
+        """
+        Builds the graph mapping every object to its direct dependencies.
+        """
+        graph: dict[str, set[str]] = {}
         diagram = Graphviz(direction="LR", format="svg")
 
         for key, obj in objects.items():
             dependencies = obj.list_dependencies()
 
-            graph.add(key)
+            graph.setdefault(key, set())
             diagram.node(key)
 
             if dependencies is not None:
                 for d in dependencies:
-                    graph.add(key, d)
+                    graph[key].add(d)
+                    graph.setdefault(d, set())
                     diagram.edge(key, d)
 
         return graph, diagram
@@ -306,19 +531,74 @@ class Applier:
     def _load_objects(self, files) -> tuple[dict[str, Model], list[dict[str, Any]]]:
         loaded_objects: dict[str, Model] = {}
         loaded_manifests: list[dict[str, Any]] = []
+        origins: dict[str, str] = {}
+
+        files = list(files)
+        with self.spans.span("render", files=len(files)):
+            all_manifests = self._load_all_manifests(files)
 
-        for f in files:
-            objects = self._load_manifests(f)
+        for f, objects in zip(files, all_manifests, strict=True):
             if objects is not None:
                 for obj in objects:
                     if obj is None:
                         continue
                     key, loaded = self._load_object(obj)
+                    if key in origins:
+                        click.secho(
+                            f"{Symbols.WARNING} {key} in {f} overrides "
+                            f"the one in {origins[key]}",
+                            fg=Colors.YELLOW,
+                            err=True,
+                        )
+                    origins[key] = f
                     loaded_objects[key] = loaded
                     loaded_manifests.append(obj)
 
         return loaded_objects, loaded_manifests
 
+    def _load_all_manifests(self, files: list[str]) -> list[list[dict[str, Any]] | None]:
+        """
+        Loads the manifest files, in parallel processes if they are large
+        enough to make up for the cost of starting the processes.
+        """
+        if self.load_workers <= 1:
+            return [self._load_manifests(f) for f in files]
+
+        results: list[list[dict[str, Any]] | None] = [None] * len(files)
+        pending: list[tuple[int, str, str, str, str | None]] = []
+        cache = self.template_cache
+
+        for i, f in enumerate(files):
+            extension = self._get_file_extension(f)
+            with open(f) as fp:
+                content = fp.read()
+
+            key = cache.key(content, extension) if cache is not None else None
+            cached = cache.get(key) if cache is not None and key else None
+            if cached is not None:
+                results[i] = cached
+                continue
+
+            pending.append((i, f, extension, content, key))
+
+        if sum(len(p[3]) for p in pending) < PARALLEL_MIN_BYTES:
+            for i, f, extension, content, key in pending:
+                results[i] = self._load_content(f, extension, content, key)
+            return results
+
+        loaded = load_parallel(
+            [(f, extension, content) for _, f, extension, content, _ in pending],
+            self.values,
+            self.load_workers,
+        )
+
+        for (i, _, _, content, key), documents in zip(pending, loaded, strict=True):
+            results[i] = documents
+            if cache is not None and key is not None:
+                cache.set(key, content, documents)
+
+        return results
+
     def _load_object(self, obj: Mapping[str, Any]) -> tuple[str, Model]:
         key = Model.object_key(obj)
         kls = get_resource_class(obj)
@@ -336,13 +616,40 @@ class Applier:
         with open(file_name) as f:
             content = f.read()
 
-        return self._parse_content(
+        cache = self.template_cache
+        if cache is None:
+            return self._load_content(file_name, extension, content)
+
+        key = cache.key(content, extension)
+        loaded = cache.get(key)
+        if loaded is None:
+            loaded = self._load_content(file_name, extension, content, key)
+
+        return loaded
+
+    def _load_content(
+        self, file_name: str, extension: str, content: str, key: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        loaded = self._parse_content(
             file_name=file_name,
             extension=extension,
             content=content,
             use_values=True,
         )
 
+        if self.template_cache is not None and key is not None:
+            self.template_cache.set(key, content, loaded)
+
+        return loaded
+
+    def _get_template_cache(self) -> TemplateCache | None:
+        # The rendered manifests would contain the decrypted secrets, and
+        # those must never be written to the disk.
+        if self.values.get("secrets"):
+            return None
+
+        return TemplateCache(self.environment, self.values)
+
     def _load_values_and_secrets(
         self, value_files: Iterable[str] | None, secret_files: Iterable[str] | None
     ) -> benedict:
@@ -484,52 +791,82 @@ class Applier:
 
         return template.render()
 
-    def _get_apply_order(self) -> list[tuple[str, ...]]:
+    def _get_priorities(
+        self, graph: dict[str, set[str]], history: LatencyHistory
+    ) -> dict[str, float]:
         """
-        Generates the order to apply the Graph nodes.
+        Weighs the objects by the past latency of their kind, if known, and
+        computes the critical path priorities for the graph.
         """
-        self.dependency_graph.prepare()
+        known = history.known()
+        # Kinds without any history are assumed to be as slow as the average.
+        fallback = sum(known.values()) / len(known) if known else 1
+
+        weights: dict[str, float] = {}
+        for key in graph:
+            # Dependencies that are not part of the manifests are no-ops.
+            if key not in self.objects:
+                weights[key] = 0
+                continue
 
-        order: list[tuple[str, ...]] = []
+            kind = key.split(":", 1)[0]
+            weights[key] = known.get(kind, fallback)
 
-        while self.dependency_graph.is_active():
-            nodes = self.dependency_graph.get_ready()
-            order.append(nodes)
-            self.dependency_graph.done(*nodes)
+        return critical_path_priorities(graph, weights)
 
-        return order
+    def _record_latency(self, history: LatencyHistory, timings: dict[str, float]) -> None:
+        timings = {k: v for k, v in timings.items() if k in self.objects}
+        if not timings:
+            return
 
-    def _get_delete_order(self) -> Iterable[tuple[str, ...]]:
+        history.record(timings)
+
+        try:
+            history.save()
+        except OSError as e:
+            logger.debug("Failed to save the latency history: %s", e)
+
+    def _print_result_summary(self, scheduler: Scheduler, done_label: str) -> None:
         """
-        Generates the order to delete the Graph nodes.
+        Prints the counts of the objects that were done, failed or skipped,
+        and lists the failed and skipped ones so that a retry only has to
+        redo those.
         """
-        return reversed(self._get_apply_order())
+        done = [k for k in scheduler.succeeded if k in self.objects]
+        failed = [k for k in scheduler.failed if k in self.objects]
+        skipped = [k for k in scheduler.skipped if k in self.objects]
+
+        print_centered_text("Summary")
+
+        data: list[list[str]] = []
+        for keys, result, fg in (
+            (failed, "Failed", Colors.RED),
+            (skipped, "Skipped", Colors.YELLOW),
+        ):
+            for k in sorted(keys):
+                kind, name = k.split(":", 1)
+                data.append([kind.title(), name, click.style(result, fg=fg)])
+
+        if data:
+            tabulate_data(data, headers=["Kind", "Name", "Result"])
+
+        click.secho(
+            f"{done_label}: {len(done)}, Failed: {len(failed)}, Skipped: {len(skipped)}",
+            fg=Colors.YELLOW,
+        )
 
-    @staticmethod
-    def _start_work(
-        op: Callable[[str], None],
-        work: Iterable[tuple[str, ...]],
-        workers: int,
-    ) -> None:
+    def _get_reverse_graph(self) -> dict[str, set[str]]:
         """
-        Performs the operation asynchronously with workers over the Work.
+        Inverts the dependency graph so that an object is deleted only
+        after all the objects depending on it are deleted.
         """
+        reverse: dict[str, set[str]] = {key: set() for key in self.dependency_graph}
 
-        def worker_func(w: str) -> Exception | None:
-            try:
-                op(w)
-            except Exception as e:
-                return e
-
-        max_workers = int(workers) if workers is not None else None
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for tasks in work:
-                futures = executor.map(worker_func, tasks)
+        for key, dependencies in self.dependency_graph.items():
+            for d in dependencies:
+                reverse[d].add(key)
 
-                for f in futures:
-                    if isinstance(f, Exception):
-                        raise f
+        return reverse
 
     @staticmethod
     def _can_delete(obj: Model) -> bool:
@@ -562,3 +899,7 @@ class Applier:
             raise Exception(f"Unsupported file extension for {path}")
 
         return extension
+
+
+def _format_elapsed(start: float) -> str:
+    return f"{time.monotonic() - start:.1f}s"
@@ -0,0 +1,216 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import graphlib
+import heapq
+import itertools
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+DEFAULT_MAX_WORKERS = 6
+
+
+class OnError(str, Enum):
+    """What the Scheduler does when the operation fails for a node."""
+
+    @override
+    def __str__(self):
+        return str(self.value)
+
+    # Start no new nodes and raise once the in-flight nodes finish.
+    FAIL_FAST = "fail-fast"
+    # Carry on with every node, including the dependents of failed ones.
+    CONTINUE = "continue"
+    # Skip only the transitive dependents of the failed nodes.
+    SKIP_DEPENDENTS = "skip-dependents"
+
+
+class Scheduler:
+    """Runs an operation over the nodes of a dependency graph.
+
+    Unlike a level-by-level traversal, a node is submitted as soon as all
+    of its own dependencies are done, so a slow node only holds back its
+    dependents and not the unrelated parts of the graph. At most `workers`
+    nodes are in flight at any point of time.
+
+    The graph maps every node to the nodes it depends on, i.e. the same
+    format accepted by graphlib.TopologicalSorter.
+
+        scheduler = Scheduler({"b": {"a"}, "c": {"a"}}, workers=2)
+        scheduler.run(op)
+        scheduler.timings  # {"a": 0.12, "b": 1.3, "c": 0.4}
+
+    When priorities are given, the ready node with the highest priority is
+    started first. Otherwise, nodes are started in the order they become
+    ready. See critical_path_priorities.
+
+    The on_error mode decides what happens to the rest of the graph when
+    a node fails. After the run, the nodes are available in the succeeded,
+    failed and skipped attributes, where skipped holds the nodes that were
+    never attempted. The ready_at and started_at attributes hold the
+    time.monotonic() at which every node became ready and was started, to
+    tell how long it waited on its dependencies and then on a worker.
+    """
+
+    def __init__(
+        self,
+        graph: Mapping[str, Iterable[str]],
+        workers: int | None = DEFAULT_MAX_WORKERS,
+        priorities: Mapping[str, float] | None = None,
+        on_error: OnError | str = OnError.FAIL_FAST,
+    ):
+        self.graph = graph
+        self.workers = int(workers) if workers else DEFAULT_MAX_WORKERS
+        self.priorities = priorities or {}
+        self.on_error = OnError(on_error)
+        self.timings: dict[str, float] = {}
+        self.ready_at: dict[str, float] = {}
+        self.started_at: dict[str, float] = {}
+        self.succeeded: list[str] = []
+        self.failed: dict[str, BaseException] = {}
+        self.skipped: list[str] = []
+
+    def run(self, op: Callable[[str], None]) -> None:
+        """Runs op on every node of the graph in dependency order.
+
+        The nodes that are already in flight are always allowed to finish.
+        If any node failed, the first error is raised once the run is over.
+        """
+        sorter: graphlib.TopologicalSorter[str] = graphlib.TopologicalSorter(self.graph)
+        sorter.prepare()
+
+        # Ties are broken by the order in which the nodes became ready.
+        counter = itertools.count()
+        ready: list[tuple[float, int, str]] = []
+        blocked: set[str] = set()
+
+        def push(nodes: Iterable[str]) -> None:
+            pending = deque(nodes)
+            while pending:
+                n = pending.popleft()
+                if self._is_blocked(n, blocked):
+                    # Mark it done right away so that its own dependents
+                    # become ready and get blocked in turn.
+                    blocked.add(n)
+                    sorter.done(n)
+                    pending.extend(sorter.get_ready())
+                    continue
+
+                self.ready_at[n] = time.monotonic()
+                heapq.heappush(ready, (-self.priorities.get(n, 0), next(counter), n))
+
+        push(sorter.get_ready())
+        in_flight: dict[Future[None], str] = {}
+        first_error: BaseException | None = None
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="apply"
+        ) as executor:
+            while ready or in_flight:
+                stopped = self.on_error == OnError.FAIL_FAST and first_error is not None
+
+                while ready and not stopped and len(in_flight) < self.workers:
+                    _, _, node = heapq.heappop(ready)
+                    in_flight[executor.submit(self._timed, op, node)] = node
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    node = in_flight.pop(future)
+                    exc = future.exception()
+
+                    if exc is None:
+                        self.succeeded.append(node)
+                        sorter.done(node)
+                        continue
+
+                    self.failed[node] = exc
+                    if first_error is None:
+                        first_error = exc
+
+                    if self.on_error != OnError.FAIL_FAST:
+                        sorter.done(node)
+
+                if not (self.on_error == OnError.FAIL_FAST and first_error):
+                    push(sorter.get_ready())
+
+        self.skipped = [n for n in self._nodes() if n not in self.timings]
+
+        if first_error is not None:
+            raise first_error
+
+    def _is_blocked(self, node: str, blocked: set[str]) -> bool:
+        if self.on_error != OnError.SKIP_DEPENDENTS:
+            return False
+
+        return any(d in self.failed or d in blocked for d in self.graph.get(node, ()))
+
+    def _nodes(self) -> list[str]:
+        nodes = dict.fromkeys(self.graph)
+        for dependencies in self.graph.values():
+            nodes.update(dict.fromkeys(dependencies))
+
+        return list(nodes)
+
+    def _timed(self, op: Callable[[str], None], node: str) -> None:
+        start = self.started_at[node] = time.monotonic()
+        try:
+            op(node)
+        finally:
+            self.timings[node] = time.monotonic() - start
+
+
+def critical_path_priorities(
+    graph: Mapping[str, Iterable[str]],
+    weights: Mapping[str, float] | None = None,
+) -> dict[str, float]:
+    """Computes the critical path priority of every node in the graph.
+
+    The priority of a node is its own weight plus the heaviest chain of
+    nodes that (transitively) depend on it. Starting the nodes with the
+    highest priority first gets the longest chains going early, instead of
+    spending workers on leaves that nothing is waiting for.
+
+    Nodes without a weight count as 1.
+    """
+    weights = weights or {}
+    dependents: dict[str, set[str]] = {}
+
+    for node, dependencies in graph.items():
+        dependents.setdefault(node, set())
+        for d in dependencies:
+            dependents.setdefault(d, set()).add(node)
+
+    priorities: dict[str, float] = {}
+    order = list(graphlib.TopologicalSorter(graph).static_order())
+
+    # Dependents come after their dependencies in the static order, so
+    # walking it backwards visits every dependent before the node itself.
+    for node in reversed(order):
+        tail = max((priorities[d] for d in dependents.get(node, ())), default=0)
+        priorities[node] = weights.get(node, 1) + tail
+
+    return priorities
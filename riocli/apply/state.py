@@ -0,0 +1,130 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from rapyuta_io_sdk_v2.exceptions import (
+    BadGatewayError,
+    GatewayTimeoutError,
+    HttpNotFoundError,
+    InternalServerError,
+    MethodNotAllowedError,
+    ServiceUnavailableError,
+    UnauthorizedAccessError,
+    UnknownError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rapyuta_io_sdk_v2 import Client as v2Client
+
+    from riocli.model.base import Model
+
+# Listing a kind costs at least one request, so it only pays off when more
+# than a couple of objects of that kind are being applied.
+PREFETCH_MIN_OBJECTS = 3
+
+# The errors of the listings, e.g. for missing permissions, after which the
+# objects fall back to the create-then-update path.
+LISTING_ERRORS = (
+    httpx.HTTPError,
+    BadGatewayError,
+    GatewayTimeoutError,
+    HttpNotFoundError,
+    InternalServerError,
+    MethodNotAllowedError,
+    ServiceUnavailableError,
+    UnauthorizedAccessError,
+    UnknownError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ServerState:
+    """An index of the objects that already exist on rapyuta.io.
+
+    The index is built once per apply by listing every kind present in the
+    manifests, so that each object can pick between create, update or a
+    no-op upfront instead of attempting a create that fails for every
+    existing object.
+
+    Kinds that could not be listed are not indexed, and the objects of
+    those kinds fall back to the create-then-update path.
+    """
+
+    def __init__(self):
+        self._index: dict[str, dict[str, Any]] = {}
+
+    def prefetch(
+        self,
+        objects: Iterable[Model],
+        v2_client: v2Client,
+        workers: int | None = None,
+        min_objects: int = PREFETCH_MIN_OBJECTS,
+    ) -> None:
+        """Lists the kinds of the given objects concurrently.
+
+        Kinds with fewer than min_objects objects are not listed.
+        """
+        by_kind: dict[str, list[Model]] = defaultdict(list)
+        for obj in objects:
+            by_kind[obj.kind.lower()].append(obj)
+
+        by_kind = {k: v for k, v in by_kind.items() if len(v) >= min_objects}
+        if not by_kind:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="prefetch"
+        ) as executor:
+            futures = {
+                kind: executor.submit(self._list_kind, objs, v2_client)
+                for kind, objs in by_kind.items()
+            }
+
+        for kind, future in futures.items():
+            index = future.result()
+            if index is not None:
+                self._index[kind] = index
+
+    def is_indexed(self, obj: Model) -> bool:
+        return obj.kind.lower() in self._index
+
+    def get(self, obj: Model) -> Any | None:
+        """Returns the server's copy of the object, if it exists."""
+        index = self._index.get(obj.kind.lower(), {})
+        return index.get(type(obj).index_key(obj))
+
+    @staticmethod
+    def _list_kind(objects: list[Model], v2_client: v2Client) -> dict[str, Any] | None:
+        kls = type(objects[0])
+        names = [o.metadata.name for o in objects]
+
+        try:
+            listed = kls.list_objects(v2_client=v2_client, names=names)
+        except LISTING_ERRORS as e:
+            logger.debug("Failed to list the %s objects: %s", kls.__name__, e)
+            return None
+
+        if listed is None:
+            return None
+
+        return {kls.index_key(o): o for o in listed}
@@ -43,6 +43,13 @@ from riocli.constants import Colors
     help="Secret files are sops encoded value files. riocli "
     + "expects sops to be authorized for decoding files on this computer",
 )
+@click.option(
+    "--parse-workers",
+    type=int,
+    default=None,
+    help="Number of processes used to render and parse large sets of "
+    + "manifests. Defaults to the number of CPUs, 1 disables it",
+)
 @click.argument("files", nargs=-1)
 @click.pass_context
 def template(
@@ -50,6 +57,7 @@ def template(
     values: tuple[str],
     secrets: tuple[str],
     files: tuple[str],
+    parse_workers: int | None = None,
 ) -> None:
     """Print manifests with values and secrets applied
 
@@ -85,5 +93,7 @@ def template(
         raise SystemExit(1)
 
     config = get_config_from_context(ctx)
-    applier = Applier(glob_files, abs_values, abs_secrets, config)
+    applier = Applier(
+        glob_files, abs_values, abs_secrets, config, load_workers=parse_workers
+    )
     applier.print_manifests()
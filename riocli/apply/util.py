@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import glob
+import importlib
 import os
+import threading
 from collections.abc import Iterable, Mapping
 from datetime import datetime
 from shutil import get_terminal_size
@@ -62,6 +64,89 @@ FILTERS = {
     "get_intf_ip": get_interface_ip,
 }
 
+# The Ansible filter plugins available in the manifests.
+ANSIBLE_FILTER_MODULES = (
+    "ansible.plugins.filter.core",
+    "ansible.plugins.filter.urls",
+    "ansible.plugins.filter.urlsplit",
+    "ansible.plugins.filter.mathstuff",
+    "ansible.plugins.filter.encryption",
+)
+
+# The Jinja filters that the Ansible filter plugins replace, as of
+# ansible-core 2.21. Using them loads the Ansible filters, so that the
+# templates render the same as when every filter is registered upfront.
+ANSIBLE_OVERRIDES = frozenset(
+    {
+        "d",
+        "groupby",
+        "map",
+        "random",
+        "reject",
+        "rejectattr",
+        "select",
+        "selectattr",
+        "unique",
+    }
+)
+
+
+class LazyFilters(dict):
+    """The filters of a Jinja environment, with Ansible's loaded on demand.
+
+    Importing ansible-core is slow, so its filters are only loaded the
+    first time a template looks up a filter that is not defined yet, or
+    one of the ANSIBLE_OVERRIDES. Templates that only use the other
+    built-in filters and riocli's own never import Ansible.
+    """
+
+    def __init__(self, filters: Mapping[str, Any]):
+        super().__init__(filters)
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def __getitem__(self, name):
+        self._resolve(name)
+        return super().__getitem__(name)
+
+    def __contains__(self, name):
+        self._resolve(name)
+        return super().__contains__(name)
+
+    def get(self, name, default=None):
+        self._resolve(name)
+        return super().get(name, default)
+
+    def _resolve(self, name) -> None:
+        if self._loaded:
+            return
+
+        if name in ANSIBLE_OVERRIDES or not super().__contains__(name):
+            self.load_ansible()
+
+    def load_ansible(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+
+            self._loaded = True
+            try:
+                modules = [importlib.import_module(m) for m in ANSIBLE_FILTER_MODULES]
+            except ImportError:
+                click.secho("Ansible filters are not supported", fg=Colors.YELLOW)
+                return
+
+            for module in modules:
+                for name, func in module.FilterModule().filters().items():
+                    # Ansible added this new filter in v2.19.0 that replaces the
+                    # Jinja2's built-in default filter. The Ansible's version breaks
+                    # some manifests.
+                    # https://github.com/ansible/ansible/blob/faf86ca2b3e7b06660528d69a9839bb8d1409f70/lib/ansible/plugins/filter/core.py#L669
+                    if name == "default":
+                        continue
+
+                    self[name] = func
+
 
 def get_resource_class(data: Mapping[str, Any]):
     """Get the model class based on the kind"""
@@ -139,7 +224,7 @@ def message_with_prompt(
     """
     columns, _ = get_terminal_size()
     t = datetime.now().isoformat("T")
-    spacer = " " * (int(columns) - len(left_msg + right_msg + t) - 12)
+    spacer = " " * max(int(columns) - len(left_msg + right_msg + t) - 12, 1)
     text = click.style(f">> {left_msg}{spacer}{right_msg} [{t}]", fg=fg)
 
     if spinner is not None:
@@ -159,44 +244,12 @@ def print_objects_table(objects: Iterable[str]) -> None:
 
 
 def init_jinja_environment():
-    """Initialize Jinja2 environment with custom filters"""
-    environment = jinja2.Environment()
-    for name, func in FILTERS.items():
-        environment.filters[name] = func  # pyright:ignore[reportArgumentType]
-
-    try:
-        from ansible.plugins.filter.core import FilterModule as CoreFilterModule
-        from ansible.plugins.filter.encryption import (
-            FilterModule as EncryptionFilterModule,
-        )
-        from ansible.plugins.filter.mathstuff import FilterModule as MathFilterModule
-        from ansible.plugins.filter.urls import FilterModule as URLFilterModule
-        from ansible.plugins.filter.urlsplit import FilterModule as URLSplitFilterModule
-
-        for name, func in CoreFilterModule().filters().items():
-            # Ansible added this new filter in v2.19.0 that replaces the
-            # Jinja2's built-in default filter. The Ansible's version breaks
-            # some manifests.
-            # https://github.com/ansible/ansible/blob/faf86ca2b3e7b06660528d69a9839bb8d1409f70/lib/ansible/plugins/filter/core.py#L669
-            if name == "default":
-                continue
-
-            environment.filters[name] = func  # pyright:ignore[reportArgumentType]
-
-        for name, func in URLFilterModule().filters().items():
-            environment.filters[name] = func  # pyright:ignore[reportArgumentType]
-
-        for name, func in URLSplitFilterModule().filters().items():
-            environment.filters[name] = func
-
-        for name, func in MathFilterModule().filters().items():
-            environment.filters[name] = func  # pyright:ignore[reportArgumentType]
-
-        for name, func in EncryptionFilterModule().filters().items():
-            environment.filters[name] = func  # pyright:ignore[reportArgumentType]
-    except ImportError:
-        click.secho("Ansible filters are not supported", fg=Colors.YELLOW)
+    """Initialize Jinja2 environment with custom filters
 
+    The Ansible filters are loaded when a template first uses one.
+    """
+    environment = jinja2.Environment()
+    environment.filters = LazyFilters({**environment.filters, **FILTERS})
     return environment
 
 
@@ -11,23 +11,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import click
-from rapyuta_io import Client
-
-from riocli.auth.login import login
-from riocli.auth.logout import logout
-from riocli.auth.refresh_token import refresh_token
-from riocli.auth.staging import environment
-from riocli.auth.status import status
-from riocli.auth.token import token
+
 from riocli.config import new_client
 from riocli.constants import Colors
-from riocli.utils import AliasedGroup
+from riocli.utils.alias import LazyAliasedGroup
+
+if TYPE_CHECKING:
+    from rapyuta_io import Client
+
+# Checking the login status does not need the SDKs the other commands use.
+COMMANDS = {
+    "environment": "riocli.auth.staging:environment",
+    "login": "riocli.auth.login:login",
+    "logout": "riocli.auth.logout:logout",
+    "refresh-token": "riocli.auth.refresh_token:refresh_token",
+    "status": "riocli.auth.status:status",
+    "token": "riocli.auth.token:token",
+}
 
 
 @click.group(
     invoke_without_command=False,
-    cls=AliasedGroup,
+    cls=LazyAliasedGroup,
+    lazy_commands=COMMANDS,
     help_headers_color=Colors.YELLOW,
     help_options_color=Colors.GREEN,
 )
@@ -38,11 +49,3 @@ def auth():
 
 def get_rio_client() -> Client:
     return new_client()
-
-
-auth.add_command(login)
-auth.add_command(logout)
-auth.add_command(token)
-auth.add_command(status)
-auth.add_command(environment)
-auth.add_command(refresh_token)
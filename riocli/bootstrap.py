@@ -15,53 +15,58 @@
 __version__ = "10.0.3"
 
 import os
+from importlib import metadata
 
 import click
-import rapyuta_io
 from click import Context
 
-from riocli.apply import apply, delete, graph
-from riocli.apply.explain import explain, list_examples
-from riocli.apply.template import template
-from riocli.auth import auth
-from riocli.chart import chart
-from riocli.completion import completion
-from riocli.compose import compose
-from riocli.config import Configuration
-from riocli.config.context import cli_context
-from riocli.configtree import config_trees
 from riocli.constants import Colors, Symbols
-from riocli.deployment import deployment
-from riocli.device import device
-from riocli.disk import disk
-from riocli.hwil import hwildevice
-from riocli.network import network
-from riocli.oauth2 import oauth2
-from riocli.organization import organization
-from riocli.package import package
-from riocli.parameter import parameter
-from riocli.permission import permission
-from riocli.project import project
-from riocli.role import role
-from riocli.secret import secret
-from riocli.service_account import service_account
-from riocli.shell import deprecated_repl, shell
-from riocli.ssh import ssh_cert
-from riocli.static_route import static_route
-from riocli.usergroup import usergroup
-from riocli.utils import (
-    AliasedGroup,
-    check_for_updates,
-    is_pip_installation,
-    pip_install_cli,
-    update_appimage,
-)
-from riocli.vpn import vpn
+from riocli.utils.alias import LazyAliasedGroup
+from riocli.utils.listing import GLOBAL_OUTPUTS
+
+# The commands are imported when they are invoked or listed in the help,
+# since importing all of them takes most of the startup time of the CLI.
+COMMANDS = {
+    "apply": "riocli.apply:apply",
+    "auth": "riocli.auth:auth",
+    "chart": "riocli.chart:chart",
+    "completion": "riocli.completion:completion",
+    "compose": "riocli.compose:compose",
+    "configtree": "riocli.configtree:config_trees",
+    "context": "riocli.config.context:cli_context",
+    "debug": "riocli.debug:debug",
+    "delete": "riocli.apply:delete",
+    "deployment": "riocli.deployment:deployment",
+    "device": "riocli.device:device",
+    "disk": "riocli.disk:disk",
+    "explain": "riocli.apply.explain:explain",
+    "graph": "riocli.apply:graph",
+    "hwil": "riocli.hwil:hwildevice",
+    "list-examples": "riocli.apply.explain:list_examples",
+    "network": "riocli.network:network",
+    "oauth2": "riocli.oauth2:oauth2",
+    "organization": "riocli.organization:organization",
+    "package": "riocli.package:package",
+    "parameter": "riocli.parameter:parameter",
+    "permission": "riocli.permission:permission",
+    "project": "riocli.project:project",
+    "repl": "riocli.shell:deprecated_repl",
+    "role": "riocli.role:role",
+    "secret": "riocli.secret:secret",
+    "service-account": "riocli.service_account:service_account",
+    "shell": "riocli.shell:shell",
+    "ssh-cert": "riocli.ssh:ssh_cert",
+    "static-route": "riocli.static_route:static_route",
+    "template": "riocli.apply.template:template",
+    "usergroup": "riocli.usergroup:usergroup",
+    "vpn": "riocli.vpn:vpn",
+}
 
 
 @click.group(
     invoke_without_command=False,
-    cls=AliasedGroup,
+    cls=LazyAliasedGroup,
+    lazy_commands=COMMANDS,
     aliases={
         "o2": "oauth2",
         "sr": "static-route",
@@ -72,9 +77,37 @@ from riocli.vpn import vpn
     help_headers_color=Colors.YELLOW,
     help_options_color=Colors.GREEN,
 )
+@click.option(
+    "--output",
+    "output",
+    type=click.Choice(GLOBAL_OUTPUTS),
+    default=None,
+    help="Print the items of the list and inspect commands as JSON lines "
+    "(ndjson), JSON, YAML or a table. Options given to the command win",
+)
+@click.option(
+    "--trace",
+    is_flag=True,
+    default=False,
+    help="Trace the API calls and print a summary of their latencies at "
+    "exit. Set RIO_TRACE to a file name to also record every call in it",
+)
 @click.pass_context
-def cli(ctx: Context, config: str | None = None):
+def cli(
+    ctx: Context,
+    config: str | None = None,
+    output: str | None = None,
+    trace: bool = False,
+):
     """Manage rapyuta.io features on the command-line"""
+    if trace or os.environ.get("RIO_TRACE"):
+        # Values such as RIO_TRACE=0 leave tracing disabled.
+        from riocli.utils.trace import enable_tracing_from_env
+
+        enable_tracing_from_env(trace)
+
+    from riocli.config import Configuration
+
     ctx.obj = Configuration(filepath=config)
 
 
@@ -89,6 +122,11 @@ def safe_cli():
                 pass
             raise SystemExit(1) from e
     else:
+        import logging
+
+        # Shows why the caches and other optimisations were skipped.
+        logging.basicConfig(format="%(name)s: %(message)s")
+        logging.getLogger("riocli").setLevel(logging.DEBUG)
         cli()
 
 
@@ -102,7 +140,8 @@ def cli_help(ctx):
 @cli.command()
 def version():
     """View installed CLI and SDK versions."""
-    click.echo(f"rio {__version__} / SDK {rapyuta_io.__version__}")
+    # The SDK's version from its metadata, which is faster than importing it.
+    click.echo(f"rio {__version__} / SDK {metadata.version('rapyuta-io')}")
 
 
 @cli.command("update")
@@ -127,6 +166,13 @@ def update(silent: bool) -> None:
     You can skip the confirmation prompt by using the --silent or
     --force or -f flag.
     """
+    from riocli.utils import (
+        check_for_updates,
+        is_pip_installation,
+        pip_install_cli,
+        update_appimage,
+    )
+
     available, latest = check_for_updates(__version__)
     if not available:
         click.secho("🎉 You are using the latest version", fg=Colors.GREEN)
@@ -147,37 +193,3 @@ def update(silent: bool) -> None:
         raise SystemExit(1) from e
 
     click.secho(f"{Symbols.SUCCESS} Update successful!", fg=Colors.GREEN)
-
-
-cli.add_command(apply)
-cli.add_command(chart)
-cli.add_command(explain)
-cli.add_command(list_examples)
-cli.add_command(graph)
-cli.add_command(delete)
-cli.add_command(auth)
-cli.add_command(project)
-cli.add_command(device)
-cli.add_command(secret)
-cli.add_command(package)
-cli.add_command(deployment)
-cli.add_command(static_route)
-cli.add_command(network)
-cli.add_command(completion)
-cli.add_command(parameter)
-cli.add_command(disk)
-cli.add_command(shell)
-cli.add_command(deprecated_repl)
-cli.add_command(template)
-cli.add_command(organization)
-cli.add_command(vpn)
-cli.add_command(ssh_cert)
-cli.add_command(usergroup)
-cli.add_command(config_trees)
-cli.add_command(hwildevice)
-cli.add_command(cli_context)
-cli.add_command(oauth2)
-cli.add_command(compose)
-cli.add_command(role)
-cli.add_command(service_account)
-cli.add_command(permission)
@@ -16,11 +16,11 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import click
-import requests
 from munch import Munch
 
 from riocli.apply import apply, delete
 from riocli.constants import Colors
+from riocli.utils.http import get_session
 
 
 class Chart(Munch):
@@ -91,7 +91,7 @@ class Chart(Munch):
         chart_filepath = Path(self.tmp_dir.name, self._chart_filename())
 
         with open(chart_filepath, "wb") as f:
-            resp = requests.get(self.urls[0])
+            resp = get_session().get(self.urls[0])
             f.write(resp.content)
 
         self.extract_chart()
@@ -1,9 +1,8 @@
 from urllib.parse import quote
 
-import requests
-from yaml import safe_load
-
-from riocli.utils import tabulate_data
+from riocli.utils.http import get_session
+from riocli.utils.listing import print_list
+from riocli.utils.yaml_backend import safe_load
 
 DEFAULT_REPOSITORY = (
     "https://rapyuta-robotics.github.io/rapyuta-charts/incubator/index.yaml"  # noqa
@@ -36,7 +35,7 @@ def find_chart(chart: str, repository: str = None) -> list:
 
 def fetch_index(repository: str = None) -> dict:
     """Fetches the upstream chart index."""
-    response = requests.get(repository or DEFAULT_REPOSITORY)
+    response = get_session().get(repository or DEFAULT_REPOSITORY)
     if not response.ok:
         raise Exception(f"Fetching index failed: {repository}")
 
@@ -91,4 +90,4 @@ def print_chart_entries(entries: list, wide: bool = False) -> None:
 
         data.append(row)
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
@@ -5,7 +5,6 @@ from dataclasses import asdict
 from pathlib import Path
 
 import click
-import yaml
 from click_help_colors import HelpColorsCommand
 from munch import munchify
 
@@ -18,6 +17,7 @@ from riocli.compose.populate import populate
 from riocli.config import get_config_from_context
 from riocli.constants import Colors
 from riocli.utils import print_centered_text
+from riocli.utils import yaml_backend as yaml
 
 
 # Expose the command for import
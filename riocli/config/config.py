@@ -20,11 +20,9 @@ import subprocess
 import uuid
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from click import get_app_dir
-from rapyuta_io import Client
-from rapyuta_io_sdk_v2 import Client as v2Client
-from rapyuta_io_sdk_v2 import Configuration as v2Config
 
 from riocli.exceptions import (
     HwilLoggedOut,
@@ -32,7 +30,12 @@ from riocli.exceptions import (
     NoOrganizationSelected,
     NoProjectSelected,
 )
-from riocli.hwilclient import Client as HwilClient
+
+if TYPE_CHECKING:
+    from rapyuta_io import Client
+    from rapyuta_io_sdk_v2 import Client as v2Client
+
+    from riocli.hwilclient import Client as HwilClient
 
 
 class Configuration:
@@ -89,6 +92,12 @@ class Configuration:
     # https://docs.python.org/3.8/library/functools.html#functools.lru_cache
     @lru_cache(maxsize=2)  # noqa: B019
     def new_client(self: Configuration, with_project: bool = True) -> Client:
+        # The SDKs are imported here, since they are slow to import and
+        # many commands do not need them.
+        from rapyuta_io import Client
+
+        from riocli.utils.http import patch_rest_client
+
         if "auth_token" not in self.data:
             raise LoggedOut
 
@@ -103,6 +112,7 @@ class Configuration:
         if not with_project:
             project = None
 
+        patch_rest_client()
         return Client(auth_token=token, project=project)
 
     @lru_cache(maxsize=2)  # noqa: B019
@@ -111,6 +121,11 @@ class Configuration:
         with_project: bool = True,
         from_file: bool = True,  # from_file parameter is deprecated
     ) -> v2Client:
+        from rapyuta_io_sdk_v2 import Client as v2Client
+        from rapyuta_io_sdk_v2 import Configuration as v2Config
+
+        from riocli.utils.http import configure_v2_client
+
         if "auth_token" not in self.data:
             raise LoggedOut
 
@@ -130,9 +145,12 @@ class Configuration:
             config_kwargs["project_guid"] = self.data.get("project_id")
             config_kwargs["email"] = self.data.get("email_id")
 
-        return v2Client(config=v2Config(**config_kwargs))
+        return configure_v2_client(v2Client(config=v2Config(**config_kwargs)))
 
     def new_hwil_client(self: Configuration) -> HwilClient:
+        from riocli.hwilclient import Client as HwilClient
+        from riocli.utils.http import patch_rest_client
+
         if "hwil_auth_token" not in self.data:
             raise HwilLoggedOut
 
@@ -141,6 +159,7 @@ class Configuration:
 
         token = self.data.get("hwil_auth_token", None)
 
+        patch_rest_client()
         return HwilClient(auth_token=token, email_id=self.data.get("email_id"))
 
     def get_auth_header(self: Configuration) -> dict:
@@ -15,12 +15,12 @@ import json
 from pathlib import Path
 
 import click
-import yaml
 from click_help_colors import HelpColorsCommand
 
 from riocli.config import Configuration
 from riocli.constants import Colors, Symbols
 from riocli.utils import AliasedGroup, inspect_with_format
+from riocli.utils import yaml_backend as yaml
 
 
 @click.group(
@@ -19,13 +19,13 @@ from base64 import b64decode
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
-import yaml
 from benedict import benedict
 from munch import Munch, munchify, unmunchify
 from rapyuta_io_sdk_v2 import walk_pages
 
 from riocli.config import new_v2_client
 from riocli.utils import tabulate_data
+from riocli.utils import yaml_backend as yaml
 from riocli.utils.graph import Graphviz
 from riocli.utils.state import StateFile
 
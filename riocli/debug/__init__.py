@@ -0,0 +1,31 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import click
+
+from riocli.debug.startup import startup
+from riocli.utils import AliasedGroup
+
+
+@click.group(
+    invoke_without_command=False,
+    cls=AliasedGroup,
+    help_headers_color="yellow",
+    help_options_color="green",
+)
+def debug() -> None:
+    """Troubleshoot the CLI itself"""
+    pass
+
+
+debug.add_command(startup)
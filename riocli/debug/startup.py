@@ -0,0 +1,177 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Import-time profiling of the CLI's startup.
+
+The command runs in a new interpreter with Python's import profiler, the
+same as ``python -X importtime``, so that every module it imports is
+measured from a cold start:
+
+    profile = profile_imports(["deployment", "list", "--help"])
+    for module in profile.top(10):
+        print(module.name, module.self_ms, module.cumulative_ms)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+import click
+from click_help_colors import HelpColorsCommand
+
+from riocli.constants import Colors
+from riocli.utils import tabulate_data
+
+SORT_SELF = "self"
+SORT_CUMULATIVE = "cumulative"
+
+# A line of the import profiler's report, e.g.
+# "import time:       906 |    1239180 |   riocli.apply"
+_IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ModuleImport:
+    """The time a module took to import, in microseconds."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def self_ms(self) -> float:
+        return self.self_us / 1000
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.cumulative_us / 1000
+
+
+@dataclass
+class ImportProfile:
+    """The imports of a command, along with its total run time."""
+
+    elapsed: float
+    exit_code: int
+    modules: list[ModuleImport] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(m.self_us for m in self.modules) / 1000
+
+    def top(self, count: int, sort_by: str = SORT_SELF) -> list[ModuleImport]:
+        key = "cumulative_us" if sort_by == SORT_CUMULATIVE else "self_us"
+        return sorted(self.modules, key=attrgetter(key), reverse=True)[:count]
+
+
+def parse_import_times(report: str) -> list[ModuleImport]:
+    """Parses the report of the import profiler, skipping other lines."""
+    modules = []
+    for line in report.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match is None:
+            continue
+
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append(
+            ModuleImport(
+                name=name,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=len(indent) // 2,
+            )
+        )
+
+    return modules
+
+
+def profile_imports(args: list[str]) -> ImportProfile:
+    """Runs rio with the arguments in a new interpreter and profiles it."""
+    env = {**os.environ, "PYTHONPROFILEIMPORTTIME": "1"}
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "riocli", *args],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    return ImportProfile(
+        elapsed=elapsed,
+        exit_code=result.returncode,
+        modules=parse_import_times(result.stderr),
+    )
+
+
+@click.command(
+    "startup",
+    cls=HelpColorsCommand,
+    help_headers_color=Colors.YELLOW,
+    help_options_color=Colors.GREEN,
+    context_settings={"ignore_unknown_options": True},
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Number of modules to show",
+)
+@click.option(
+    "--sort",
+    "sort_by",
+    type=click.Choice([SORT_SELF, SORT_CUMULATIVE]),
+    default=SORT_SELF,
+    show_default=True,
+    help="Sort the modules by their own import time or by the time "
+    "including the modules they import",
+)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+def startup(top: int, sort_by: str, args: tuple[str, ...]) -> None:
+    """Show where the startup time of a command goes.
+
+    The command, rio version by default, runs in a new interpreter
+    with Python's import profiler. The modules that took the longest to
+    import are printed, in milliseconds. Put the command after --, e.g.
+
+        rio debug startup -- deployment list --help
+    """
+    args = list(args) or ["version"]
+    profile = profile_imports(args)
+    if not profile.modules:
+        click.secho(f"Could not profile rio {' '.join(args)}", fg=Colors.RED)
+        raise SystemExit(1)
+
+    data = [
+        [m.name, f"{m.self_ms:.1f}", f"{m.cumulative_ms:.1f}"]
+        for m in profile.top(top, sort_by)
+    ]
+    tabulate_data(data, headers=["Module", "Self (ms)", "Cumulative (ms)"])
+
+    click.secho(
+        f"\nrio {' '.join(args)} took {profile.elapsed * 1000:.0f}ms, "
+        f"{profile.total_ms:.0f}ms of which importing "
+        f"{len(profile.modules)} modules",
+        fg=Colors.YELLOW,
+    )
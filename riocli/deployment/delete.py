@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
-from queue import Queue
 
 import click
 from click_help_colors import HelpColorsCommand
@@ -22,8 +21,7 @@ from riocli.config import new_v2_client
 from riocli.constants import Colors, Symbols
 from riocli.deployment.model import Deployment
 from riocli.deployment.util import fetch_deployments, print_deployments_for_confirmation
-from riocli.utils import tabulate_data
-from riocli.utils.execute import apply_func_with_result
+from riocli.utils.execute import bulk_execute, print_bulk_result
 from riocli.utils.spinner import with_spinner
 
 
@@ -52,6 +50,27 @@ from riocli.utils.spinner import with_spinner
     type=int,
     default=10,
 )
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="Seconds to wait for each deployment, including retried requests",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    default=None,
+    help="Maximum number of requests per second",
+)
+@click.option(
+    "--label",
+    "-l",
+    "labels",
+    multiple=True,
+    type=click.STRING,
+    default=(),
+    help="Only delete the deployments with the labels",
+)
 @click.argument("deployment-name-or-regex", type=str, default="")
 @with_spinner(text="Deleting deployment...")
 def delete_deployment(
@@ -59,6 +78,9 @@ def delete_deployment(
     deployment_name_or_regex: str,
     delete_all: bool = False,
     workers: int = 10,
+    timeout: float | None = None,
+    rate_limit: float | None = None,
+    labels: tuple[str, ...] = (),
     spinner=None,
 ) -> None:
     """Delete one or more deployments with a name or a regex pattern.
@@ -72,6 +94,9 @@ def delete_deployment(
     If you want to delete deployments without confirmation, then use the
     ``--force`` or ``--silent`` or ``-f``
 
+    The ``--label`` option only selects the deployments with all the
+    labels. Without a name or regex, all of them are deleted.
+
     Usage Examples:
 
         Delete a deployment by name
@@ -89,15 +114,21 @@ def delete_deployment(
         Delete deployments using regex pattern
 
             $ rio deployment delete "DEPLOYMENT.*"
+
+        Delete the deployments with a label
+
+            $ rio deployment delete --label app=amr
     """
     client = new_v2_client()
-    if not (deployment_name_or_regex or delete_all):
+    if not (deployment_name_or_regex or delete_all or labels):
         spinner.text = "Nothing to delete"
         spinner.green.ok(Symbols.SUCCESS)
         return
 
     try:
-        deployments = fetch_deployments(client, deployment_name_or_regex, delete_all)
+        deployments = fetch_deployments(
+            client, deployment_name_or_regex, delete_all, labels=labels
+        )
     except Exception as e:
         spinner.text = click.style(f"Failed to delete deployment(s): {e}", Colors.RED)
         spinner.red.fail(Symbols.ERROR)
@@ -119,20 +150,22 @@ def delete_deployment(
         spinner.write("")
 
     try:
-        f = functools.partial(_apply_delete, client)
-        result = apply_func_with_result(
-            f=f, items=deployments, workers=workers, key=lambda x: x[0]
+        results = bulk_execute(
+            functools.partial(_apply_delete, client),
+            deployments,
+            workers=workers,
+            timeout=timeout,
+            rate_limit=rate_limit,
         )
 
-        data, statuses = [], []
-        for name, status, msg in result:
-            fg = Colors.GREEN if status else Colors.RED
-            icon = Symbols.SUCCESS if status else Symbols.ERROR
-            statuses.append(status)
-            data.append([click.style(name, fg), click.style(f"{icon}  {msg}", fg)])
-
-        with spinner.hidden():
-            tabulate_data(data, headers=["Name", "Status"])
+        statuses = []
+        for r in results:
+            msg = "Deployment Deleted Successfully" if r.ok else str(r.error)
+            statuses.append(r.ok)
+            print_bulk_result(
+                spinner, r.item.metadata.name, r.ok, msg, unknown=r.timed_out
+            )
+            spinner.text = f"Deleted {sum(statuses)}/{len(deployments)} deployment(s)..."
 
         # When no deployment is deleted, raise an exception.
         if not any(statuses):
@@ -154,9 +187,5 @@ def delete_deployment(
         raise SystemExit(1) from e
 
 
-def _apply_delete(client: Client, result: Queue, deployment: Deployment) -> None:
-    try:
-        client.delete_deployment(name=deployment.metadata.name)
-        result.put((deployment.metadata.name, True, "Deployment Deleted Successfully"))
-    except Exception as e:
-        result.put((deployment.metadata.name, False, str(e)))
+def _apply_delete(client: Client, deployment: Deployment) -> None:
+    client.delete_deployment(name=deployment.metadata.name)
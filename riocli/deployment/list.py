@@ -18,7 +18,13 @@ from rapyuta_io_sdk_v2 import walk_pages
 from riocli.config import new_v2_client
 from riocli.constants import Colors
 from riocli.deployment.model import Deployment
-from riocli.utils import tabulate_data
+from riocli.utils.listing import (
+    OUTPUT_TABLE,
+    iter_items,
+    list_output_options,
+    print_list,
+    stream_items,
+)
 from riocli.utils.process_errors import process_errors
 
 ALL_PHASES = [
@@ -36,6 +42,20 @@ DEFAULT_PHASES = [
     "FailedToStart",
 ]
 
+COLUMNS = [
+    ("Name", 32),
+    ("Package", 32),
+    ("Creation Time (UTC)", 20),
+    ("Phase", 13),
+    ("Status", 0),
+]
+WIDE_COLUMNS = [
+    *COLUMNS[:-1],
+    ("Status", 24),
+    ("Deployment ID", 24),
+    ("Stopped Time (UTC)", 0),
+]
+
 
 @click.command(
     "list",
@@ -70,11 +90,14 @@ DEFAULT_PHASES = [
 @click.option(
     "--wide", "-w", is_flag=True, default=False, help="Print more details", type=bool
 )
+@list_output_options
 def list_deployments(
     device: str,
     phase: list[str],
     labels: list[str],
     wide: bool = False,
+    output: str = OUTPUT_TABLE,
+    limit: int | None = None,
 ) -> None:
     """List the deployments in the current project
 
@@ -82,6 +105,11 @@ def list_deployments(
 
     The -w or --wide flag prints more details about the deployments.
 
+    The table is sorted by name and printed once all the deployments are
+    listed. With --output stream or jsonl, the deployments are printed in
+    the order of the server as they are listed, which is much faster for
+    large projects.
+
     Usage Examples:
 
       Filter by phase
@@ -91,16 +119,27 @@ def list_deployments(
       Filter by labels
 
       $ rio deployment list --label key1=value1 --label key2=value2
+
+      Stream the first 500 deployments
+
+      $ rio deployment list --output stream --limit 500
     """
     try:
         client = new_v2_client(with_project=True)
-        deployments = []
-        for page in walk_pages(
-            client.list_deployments, label_selector=labels, phases=phase
-        ):
-            deployments.extend(page)
-        deployments = sorted(deployments, key=lambda d: d.metadata.name.lower())
-        display_deployment_list(deployments, show_header=True, wide=wide)
+        deployments = iter_items(
+            walk_pages(client.list_deployments, label_selector=labels, phases=phase),
+            limit=limit,
+        )
+        if output == OUTPUT_TABLE:
+            deployments = sorted(deployments, key=lambda d: d.metadata.name.lower())
+            display_deployment_list(deployments, show_header=True, wide=wide)
+        else:
+            stream_items(
+                deployments,
+                output,
+                WIDE_COLUMNS if wide else COLUMNS,
+                lambda d: _deployment_row(d, wide),
+            )
     except Exception as e:
         click.secho(str(e), fg=Colors.RED)
         raise SystemExit(1)
@@ -113,40 +152,38 @@ def display_deployment_list(
 ):
     headers = []
     if show_header:
-        headers = ["Name", "Package", "Creation Time (UTC)", "Phase", "Status"]
+        headers = [h for h, _ in (WIDE_COLUMNS if wide else COLUMNS)]
 
-    if show_header and wide:
-        headers.extend(["Deployment ID", "Stopped Time (UTC)"])
+    data = [_deployment_row(d, wide) for d in deployments]
+    print_list(data, headers=headers)
 
-    data = []
-    for d in deployments:
-        package_name_version = (
-            f"{d.metadata.depends.name_or_guid} ({d.metadata.depends.version})"
-        )
-        phase = d.status.phase
 
-        status = ""
+def _deployment_row(d: Deployment, wide: bool = False) -> list:
+    package_name_version = (
+        f"{d.metadata.depends.name_or_guid} ({d.metadata.depends.version})"
+    )
+    phase = d.status.phase
 
-        if d.status:
-            error_codes = getattr(d.status, "error_codes", None)
-            if error_codes:
-                status = click.style(
-                    process_errors(error_codes, no_action=True), fg=Colors.RED
-                )
-            else:
-                status = d.status.status
+    status = ""
 
-        row = [
-            d.metadata.name,
-            package_name_version,
-            d.metadata.createdAt,
-            phase,
-            status,
-        ]
+    if d.status:
+        error_codes = getattr(d.status, "error_codes", None)
+        if error_codes:
+            status = click.style(
+                process_errors(error_codes, no_action=True), fg=Colors.RED
+            )
+        else:
+            status = d.status.status
 
-        if wide:
-            row.extend([d.metadata.guid, d.metadata.deletedAt])
+    row = [
+        d.metadata.name,
+        package_name_version,
+        d.metadata.createdAt,
+        phase,
+        status,
+    ]
 
-        data.append(row)
+    if wide:
+        row.extend([d.metadata.guid, d.metadata.deletedAt])
 
-    tabulate_data(data, headers=headers)
+    return row
@@ -12,11 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+import re
+
 import click
 from click_help_colors import HelpColorsCommand
+from tabulate import tabulate
 
 from riocli.config import new_v2_client
 from riocli.constants import Colors
+from riocli.deployment.logstream import DEFAULT_BUFFER_LINES, LogMultiplexer, LogSource
+from riocli.deployment.util import PLAIN_NAME, fetch_deployments
+from riocli.exceptions import ResourceNotFound
+
+PREFIX_COLORS = [
+    Colors.CYAN,
+    Colors.MAGENTA,
+    Colors.BLUE,
+    Colors.GREEN,
+    Colors.YELLOW,
+    Colors.BRIGHT_CYAN,
+    Colors.BRIGHT_MAGENTA,
+    Colors.BRIGHT_BLUE,
+]
 
 
 @click.command(
@@ -31,11 +49,71 @@ from riocli.constants import Colors
 @click.option(
     "--exec", "exec_name", default=None, help="Name of a executable in the component"
 )
-@click.argument("deployment-name", type=str)
+@click.option(
+    "--all-executables",
+    is_flag=True,
+    default=False,
+    help="Stream the logs of all the executables",
+)
+@click.option(
+    "--all-replicas",
+    is_flag=True,
+    default=False,
+    help="Stream the logs of all the replicas",
+)
+@click.option(
+    "--merge",
+    "merge_window",
+    type=float,
+    default=None,
+    help="Order the lines of all the streams by their timestamps, holding "
+    "them back for the given number of seconds",
+)
+@click.option(
+    "--grep",
+    type=str,
+    default=None,
+    help="Only print the lines matching the regex pattern",
+)
+@click.option(
+    "--max-streams",
+    type=click.IntRange(min=1),
+    default=20,
+    help="Maximum number of log streams open at a time",
+)
+@click.option(
+    "--reconnect",
+    "reconnects",
+    type=click.IntRange(min=0),
+    default=3,
+    help="Number of times a log stream is reconnected in a row when it fails",
+)
+@click.option(
+    "--buffer",
+    "buffer_lines",
+    type=click.IntRange(min=1),
+    default=DEFAULT_BUFFER_LINES,
+    help="Maximum number of lines buffered across all the streams",
+)
+@click.option(
+    "--drop",
+    is_flag=True,
+    default=False,
+    help="Drop lines when the buffer is full instead of slowing down the streams",
+)
+@click.argument("deployment-name-or-regex", type=str)
 def deployment_logs(
     replica: int,
     exec_name: str,
-    deployment_name: str,
+    all_executables: bool,
+    all_replicas: bool,
+    merge_window: float | None,
+    grep: str | None,
+    max_streams: int,
+    reconnects: int,
+    buffer_lines: int,
+    drop: bool,
+    deployment_name_or_regex: str,
 ) -> None:
     """Stream live logs from cloud deployments.
 
@@ -47,22 +125,194 @@ def deployment_logs(
     the replica number using the --replica option. The default replica
     number is 0.
 
+    Use the --all-executables and --all-replicas flags to follow the
+    logs of every executable and replica at once. Every line is then
+    prefixed with its executable and replica. With --merge, the lines
+    are ordered by their timestamps instead of their arrival.
+
+    A regex pattern follows the logs of all the matching cloud
+    deployments. The --grep option filters the lines as they are
+    received. At most --max-streams streams are open at a time, and a
+    stream that fails is reconnected, skipping the lines it already
+    printed. When there are many streams, a summary of the lines
+    received, matched and dropped per stream is printed at the end.
+
     Note: The logs are streamed in real-time. Press Ctrl+C to stop the
     log streaming. Also, device deployments do not support log streaming.
+
+    Usage Examples:
+
+        Stream the logs of every executable and replica
+
+            $ rio deployment logs DEPLOYMENT_NAME --all-executables --all-replicas
+
+        Merge the lines by timestamp, waiting up to two seconds for late lines
+
+            $ rio deployment logs DEPLOYMENT_NAME --all-executables --merge 2
+
+        Search the logs of many deployments for errors
+
+            $ rio deployment logs "amr-.*" --grep ERROR
     """
     try:
-        # TODO(pallab): when no exec name is given, implement the logic to set default or prompt a selection.
+        pattern = re.compile(grep) if grep else None
         client = new_v2_client()
-        if not exec_name:
-            deployment_manifest = client.get_deployment(name=deployment_name)
-            exec_name = list(deployment_manifest.status.executables_status.values())[
-                0
-            ].name
-        stream_logs = client.stream_deployment_logs(
-            name=deployment_name, executable=exec_name, replica=replica
+        sources = resolve_log_sources(
+            client,
+            deployment_name_or_regex,
+            exec_name=exec_name,
+            replica=replica,
+            all_executables=all_executables,
+            all_replicas=all_replicas,
         )
-        for log in stream_logs:
-            print(log)
+        multiplexer = LogMultiplexer(
+            client,
+            sources,
+            buffer_lines=buffer_lines,
+            merge_window=merge_window,
+            grep=pattern,
+            max_streams=max_streams,
+            reconnects=reconnects,
+            drop=drop,
+        )
+        stream_logs(multiplexer, show_stats=len(sources) > 1 or bool(pattern))
     except Exception as e:
         click.secho(e, fg=Colors.RED)
         raise SystemExit(1)
+
+
+def resolve_log_sources(
+    client,
+    deployment_name_or_regex: str,
+    **kwargs,
+) -> list[LogSource]:
+    """Returns the log streams of the deployments with the name or regex."""
+    if PLAIN_NAME.fullmatch(deployment_name_or_regex):
+        return get_log_sources(client, deployment_name_or_regex, **kwargs)
+
+    deployments = [
+        d
+        for d in fetch_deployments(client, deployment_name_or_regex, include_all=False)
+        if d.spec.runtime == "cloud"
+    ]
+    if not deployments:
+        raise ResourceNotFound(f"no cloud deployments match {deployment_name_or_regex}")
+
+    sources, replica_counts = [], {}
+    for d in deployments:
+        try:
+            sources.extend(
+                get_log_sources(
+                    client,
+                    d.metadata.name,
+                    deployment=d,
+                    replica_counts=replica_counts,
+                    **kwargs,
+                )
+            )
+        except Exception as e:
+            click.secho(f"{d.metadata.name}: {e}", fg=Colors.YELLOW, err=True)
+
+    if not sources:
+        raise ResourceNotFound("no executables are running in the deployments")
+
+    return sources
+
+
+def get_log_sources(
+    client,
+    deployment_name: str,
+    exec_name: str | None = None,
+    replica: int = 0,
+    all_executables: bool = False,
+    all_replicas: bool = False,
+    deployment=None,
+    replica_counts: dict | None = None,
+) -> list[LogSource]:
+    """Returns the log streams of a deployment selected by the options."""
+    executables = [exec_name] if exec_name and not all_executables else []
+    replicas = [replica]
+
+    if not executables or all_replicas:
+        if deployment is None:
+            deployment = client.get_deployment(name=deployment_name)
+        executables_status = deployment.status.executables_status or {}
+        names = [e.name for e in executables_status.values()]
+        if not names:
+            raise Exception(f"no executables are running in {deployment_name}")
+
+        if not executables:
+            # TODO(pallab): when no exec name is given, implement the logic to set default or prompt a selection.
+            executables = names if all_executables else names[:1]
+
+        if all_replicas:
+            cache = replica_counts if replica_counts is not None else {}
+            count = _replica_count(client, deployment, cache)
+            replicas = list(range(count))
+
+    return [
+        LogSource(deployment_name, executable, r)
+        for executable in executables
+        for r in replicas
+    ]
+
+
+def stream_logs(multiplexer: LogMultiplexer, show_stats: bool = False) -> None:
+    """Prints the lines of the log streams, prefixed if there are many."""
+    sources = multiplexer.sources
+    with_deployment = len({s.deployment for s in sources}) > 1
+    colors = itertools.cycle(PREFIX_COLORS)
+    prefixes = {}
+    if len(sources) > 1:
+        width = max(len(s.prefix(with_deployment)) for s in sources)
+        prefixes = {
+            s: click.style(f"{s.prefix(with_deployment):<{width}} | ", fg=next(colors))
+            for s in sources
+        }
+
+    try:
+        for source, line in multiplexer:
+            click.echo(f"{prefixes.get(source, '')}{line}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if show_stats:
+            print_stream_stats(multiplexer, with_deployment)
+
+    for source, error in multiplexer.errors:
+        click.secho(f"{prefixes.get(source, '')}{error}", fg=Colors.RED, err=True)
+
+    if len(multiplexer.errors) == len(sources):
+        raise SystemExit(1)
+
+
+def print_stream_stats(multiplexer: LogMultiplexer, with_deployment: bool) -> None:
+    headers = ["Stream", "Received", "Matched", "Dropped", "Blocked (s)", "Reconnects"]
+    data = [
+        [
+            source.prefix(with_deployment),
+            stats.received,
+            stats.matched,
+            stats.dropped,
+            f"{stats.blocked:.1f}",
+            stats.reconnects,
+        ]
+        for source, stats in multiplexer.stats.items()
+    ]
+
+    click.echo(err=True)
+    click.echo(
+        tabulate(data, headers=[click.style(h, fg=Colors.YELLOW) for h in headers]),
+        err=True,
+    )
+
+
+def _replica_count(client, deployment, cache: dict) -> int:
+    depends = deployment.metadata.depends
+    key = (depends.name_or_guid, depends.version)
+    if key not in cache:
+        package = client.get_package(name=depends.name_or_guid, version=depends.version)
+        cloud = package.spec.cloud
+        cache[key] = (cloud.replicas if cloud else None) or 1
+
+    return cache[key]
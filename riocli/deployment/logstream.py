@@ -0,0 +1,340 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import heapq
+import itertools
+import queue
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timezone
+from typing import TYPE_CHECKING
+
+from dateutil.parser import isoparse
+
+from riocli.utils.http import configure_pool
+from riocli.utils.poller import Backoff
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from rapyuta_io_sdk_v2 import Client
+
+# The longest delay before reconnecting a log stream.
+RECONNECT_INTERVAL = 10
+
+# The number of lines buffered across all the streams. Readers block when
+# the buffer is full, so a slow terminal slows the streams down instead of
+# growing the memory usage.
+DEFAULT_BUFFER_LINES = 1000
+
+_TIMESTAMP = re.compile(
+    r"^\s*\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?)"
+)
+
+
+@dataclass(frozen=True)
+class LogSource:
+    """A single log stream of a deployment."""
+
+    deployment: str
+    executable: str
+    replica: int = 0
+
+    def prefix(self, with_deployment: bool = False) -> str:
+        prefix = f"{self.executable}/{self.replica}"
+        if with_deployment:
+            prefix = f"{self.deployment}/{prefix}"
+
+        return prefix
+
+
+@dataclass
+class StreamStats:
+    """Counters of a single log stream."""
+
+    received: int = 0
+    matched: int = 0
+    dropped: int = 0
+    # Seconds the reader waited for room in the buffer.
+    blocked: float = 0.0
+    reconnects: int = 0
+
+
+class _EndOfStream:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+
+@dataclass
+class _ResumePoint:
+    """The position of the last line of a stream that was passed on.
+
+    That is the last timestamp seen, the lines seen with that timestamp,
+    and the number of lines without a timestamp seen after it.
+    """
+
+    started: bool = False
+    ts: float | None = None
+    at_ts: Counter[str] = field(default_factory=Counter)
+    untimed: int = 0
+
+    def seen(self, ts: float | None, line: str) -> None:
+        self.started = True
+        if ts is None:
+            self.untimed += 1
+            return
+
+        if ts != self.ts:
+            self.ts = ts
+            self.at_ts = Counter()
+        self.at_ts[line] += 1
+        self.untimed = 0
+
+
+class _Replay:
+    """Tells the lines a reconnected stream replays from the new ones.
+
+    The stream is replayed from an earlier point, so the lines are skipped
+    until one is past the resume point: a line with a later timestamp, one
+    with the same timestamp that was not seen, or a line without a
+    timestamp beyond the ones counted after the last timestamp.
+    """
+
+    def __init__(self, resume: _ResumePoint):
+        self.resume = resume
+        self.active = resume.started
+        self.anchor: float | None = None
+        self.untimed = 0
+        self.pending = Counter(resume.at_ts)
+
+    def is_new(self, ts: float | None, line: str) -> bool:
+        if not self.active:
+            return True
+
+        resume = self.resume
+        if ts is not None:
+            self.anchor, self.untimed = ts, 0
+            if resume.ts is not None and ts < resume.ts:
+                return False
+            if resume.ts == ts and self.pending[line] > 0:
+                self.pending[line] -= 1
+                return False
+        else:
+            # Lines before the resume point's timestamp were all seen.
+            if self.anchor != resume.ts:
+                return False
+
+            self.untimed += 1
+            if self.untimed <= resume.untimed:
+                return False
+
+        self.active = False
+        return True
+
+
+class LogMultiplexer:
+    """Follows many log streams concurrently and yields their lines.
+
+    The streams are read by a pool of threads into a shared bounded buffer.
+    Iterating over the multiplexer yields (source, line) pairs in the
+    order they arrive, or, with a merge window, ordered by the timestamp
+    at the start of the lines. Lines are held back for the merge window
+    so that lines of the other streams with earlier timestamps can catch
+    up. Lines without a timestamp keep the position of the previous line
+    of their stream.
+
+    Lines are filtered by the grep pattern in the reader threads, before
+    they are buffered. When the buffer is full, the readers wait for room
+    or, with drop enabled, drop the line. Both are counted in the stats of
+    the stream, along with the reconnects.
+
+    Streams that fail are reconnected up to `reconnects` times in a row,
+    while the ones that end are done. On reconnect, the lines that were already seen are skipped based
+    on their timestamps and their text, or by counting the lines without
+    a timestamp, since the stream cannot be resumed at an offset.
+    Streams that still fail are reported through the `errors` list and the
+    rest keep streaming. The iteration ends when all the streams have ended.
+
+    At most `max_streams` streams are open at a time, one per thread of the
+    pool. The others start when an open one ends.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        sources: Iterable[LogSource],
+        buffer_lines: int = DEFAULT_BUFFER_LINES,
+        merge_window: float | None = None,
+        grep: re.Pattern | None = None,
+        max_streams: int | None = None,
+        reconnects: int = 0,
+        drop: bool = False,
+    ):
+        self.client = client
+        self.sources = list(sources)
+        self.buffer_lines = buffer_lines
+        self.merge_window = merge_window
+        self.grep = grep
+        self.reconnects = reconnects
+        self.drop = drop
+        self.errors: list[tuple[LogSource, Exception]] = []
+        self.stats = {source: StreamStats() for source in self.sources}
+        self._queue: queue.Queue = queue.Queue(maxsize=buffer_lines)
+        self._workers = min(max_streams or len(self.sources), len(self.sources))
+        self._backoff = Backoff(RECONNECT_INTERVAL)
+
+    def __iter__(self) -> Iterator[tuple[LogSource, str]]:
+        # Every open stream holds a connection of the pool.
+        configure_pool(self._workers)
+        pending: queue.SimpleQueue[LogSource] = queue.SimpleQueue()
+        for source in self.sources:
+            pending.put(source)
+        for _ in range(self._workers):
+            threading.Thread(target=self._work, args=(pending,), daemon=True).start()
+
+        if self.merge_window:
+            yield from self._merge(self.merge_window)
+        else:
+            yield from self._receive()
+
+    def _work(self, pending: queue.SimpleQueue[LogSource]) -> None:
+        while True:
+            try:
+                source = pending.get_nowait()
+            except queue.Empty:
+                return
+
+            self._read(source)
+
+    def _read(self, source: LogSource) -> None:
+        error = None
+        try:
+            error = self._follow(source)
+        finally:
+            self._queue.put((source, _EndOfStream(error)))
+
+    def _follow(self, source: LogSource) -> Exception | None:
+        """Reads a stream, reconnecting it. Returns the last error, if any."""
+        stats = self.stats[source]
+        resume = _ResumePoint()
+        attempt = 0
+
+        while True:
+            error, received = None, False
+            replay = _Replay(resume)
+            try:
+                for line in self.client.stream_deployment_logs(
+                    name=source.deployment,
+                    executable=source.executable,
+                    replica=source.replica,
+                ):
+                    ts = parse_timestamp(line)
+                    if not replay.is_new(ts, line):
+                        continue
+
+                    received = True
+                    resume.seen(ts, line)
+
+                    stats.received += 1
+                    if self.grep is None or self.grep.search(line):
+                        stats.matched += 1
+                        self._put(source, line, stats)
+            except Exception as e:
+                error = e
+
+            if received:
+                attempt = 0
+            if error is None or attempt >= self.reconnects:
+                return error
+
+            time.sleep(self._backoff.delay(attempt))
+            attempt += 1
+            stats.reconnects += 1
+
+    def _put(self, source: LogSource, line: str, stats: StreamStats) -> None:
+        try:
+            self._queue.put_nowait((source, line))
+            return
+        except queue.Full:
+            if self.drop:
+                stats.dropped += 1
+                return
+
+        start = time.monotonic()
+        self._queue.put((source, line))
+        stats.blocked += time.monotonic() - start
+
+    def _receive(
+        self, timeout: float | None = None
+    ) -> Iterator[tuple[LogSource, str] | None]:
+        """Yields the lines as they arrive, and None on every timeout."""
+        active = len(self.sources)
+        while active:
+            try:
+                source, line = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                yield None
+                continue
+
+            if isinstance(line, _EndOfStream):
+                active -= 1
+                if line.error is not None:
+                    self.errors.append((source, line.error))
+                continue
+
+            yield source, line
+
+    def _merge(self, window: float) -> Iterator[tuple[LogSource, str]]:
+        heap: list = []
+        last_seen: dict[LogSource, float] = {}
+        counter = itertools.count()
+
+        for item in self._receive(timeout=window / 2):
+            now = time.monotonic()
+            if item is not None:
+                source, line = item
+                ts = parse_timestamp(line)
+                if ts is None:
+                    ts = last_seen.get(source, time.time())
+                last_seen[source] = ts
+                heapq.heappush(heap, (ts, next(counter), now, source, line))
+
+            while heap and (heap[0][2] + window <= now or len(heap) > self.buffer_lines):
+                _, _, _, source, line = heapq.heappop(heap)
+                yield source, line
+
+        while heap:
+            _, _, _, source, line = heapq.heappop(heap)
+            yield source, line
+
+
+def parse_timestamp(line: str) -> float | None:
+    """Returns the POSIX timestamp at the start of a log line, if any."""
+    match = _TIMESTAMP.match(line)
+    if match is None:
+        return None
+
+    try:
+        ts = isoparse(match.group(1).replace(" ", "T").replace(",", "."))
+    except ValueError:
+        return None
+
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+
+    return ts.timestamp()
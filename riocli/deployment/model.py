@@ -11,18 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import time
+from typing import Any
 
 from munch import Munch
-from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2 import Client, walk_pages
 from rapyuta_io_sdk_v2 import Deployment as DeploymentModel
 from typing_extensions import override
 
-from riocli.constants import Status
+from riocli.deployment.tracker import get_tracker
 from riocli.model import Model
-from riocli.utils.error import (
-    RetriesExhausted,
-)
 
 
 class Deployment(Model):
@@ -59,6 +56,25 @@ class Deployment(Model):
     def delete_object(self, v2_client: Client, *args, **kwargs) -> None:
         _ = v2_client.delete_deployment(self._obj.metadata.name)
 
+    @override
+    @classmethod
+    def list_objects(cls, v2_client: Client, names: list[str]) -> list[Any]:
+        return [
+            o
+            for page in walk_pages(
+                v2_client.list_deployments,
+                names=names,
+                phases=[
+                    "InProgress",
+                    "Provisioning",
+                    "Succeeded",
+                    "FailedToStart",
+                    "Stopped",
+                ],
+            )
+            for o in page
+        ]
+
     @override
     def list_dependencies(self) -> list[str] | None:
         return self._obj.list_dependencies()
@@ -70,18 +86,11 @@ def wait_for_dependencies(
     retry_count: int = 50,
     retry_interval: int = 6,
 ) -> None:
-    """Waits until all deployment_names are in RUNNING state."""
-    for _ in range(retry_count):
-        deployments = client.list_deployments(
-            names=deployment_names,
-            phases=["InProgress", "Provisioning", "Succeeded"],
-        )
-
-        if all(d.status.status == Status.RUNNING for d in deployments.items):
-            return
-
-        time.sleep(retry_interval)
+    """Waits until all deployment_names are in RUNNING state.
 
-    raise RetriesExhausted(
-        f"Retries exhausted waiting for dependencies: {deployment_names}"
+    The deployments are polled together with the ones that other
+    deployments being created with the same client are waiting for.
+    """
+    get_tracker(client).wait(
+        deployment_names, retry_count=retry_count, retry_interval=retry_interval
     )
@@ -0,0 +1,191 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import math
+import threading
+import time
+import weakref
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from rapyuta_io_sdk_v2 import walk_pages
+
+from riocli.constants import Status
+from riocli.utils.error import RetriesExhausted
+from riocli.utils.poller import Backoff
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rapyuta_io_sdk_v2 import Client
+
+# The phases in which a deployment can still become or already is running.
+WAIT_PHASES = ["InProgress", "Provisioning", "Succeeded"]
+
+# Keeps the query string of a single list call within the server's limits.
+NAMES_PER_CALL = 50
+
+_trackers: weakref.WeakKeyDictionary[Client, DeploymentTracker] = (
+    weakref.WeakKeyDictionary()
+)
+_trackers_lock = threading.Lock()
+
+
+class DeploymentTracker:
+    """Tracks which deployments are running on behalf of many waiters.
+
+    Every waiter registers the names it is waiting for. Instead of each
+    waiter listing its own deployments, a single list call is made for the
+    union of all the registered names, and its result is shared by every
+    waiter. Polls are paced by a shared backoff that starts short whenever
+    new names are registered and grows up to the interval, so the number
+    of calls does not grow with the number of waiters.
+
+        tracker = DeploymentTracker(client)
+        tracker.wait(["broker"], retry_count=50, retry_interval=6)
+    """
+
+    def __init__(self, client: Client):
+        self.client = client
+        self._cond = threading.Condition()
+        self._waiting: Counter[str] = Counter()
+        self._running: set[str] = set()
+        self._polling = False
+        self._error: Exception | None = None
+        # Incremented at the end of every poll.
+        self._generation = 0
+        self._last_poll = -math.inf
+        # Polls made since a new name was last registered.
+        self._attempt = 0
+
+    def wait(
+        self,
+        names: Iterable[str],
+        retry_count: int = 50,
+        retry_interval: float = 6,
+    ) -> None:
+        """Waits until all the deployments are in RUNNING state.
+
+        Gives up after retry_count * retry_interval seconds.
+        """
+        names = set(names)
+        deadline = time.monotonic() + retry_count * retry_interval
+        backoff = Backoff(retry_interval)
+
+        with self._cond:
+            fresh = time.monotonic() - self._last_poll < retry_interval
+            if fresh and not self._polling and names <= self._running:
+                return
+
+            if not names <= self._waiting.keys():
+                # Probe new names quickly instead of at the grown delay.
+                self._attempt = 0
+                self._cond.notify_all()
+            self._waiting.update(names)
+            seen = self._generation
+
+        try:
+            while True:
+                seen = self._refresh(after=seen, backoff=backoff, deadline=deadline)
+
+                with self._cond:
+                    if names <= self._running:
+                        return
+
+                if time.monotonic() >= deadline:
+                    break
+        finally:
+            with self._cond:
+                self._waiting.subtract(names)
+                # Drop the names that nobody is waiting for anymore.
+                self._waiting = +self._waiting
+
+        raise RetriesExhausted(
+            f"Retries exhausted waiting for dependencies: {sorted(names)}"
+        )
+
+    def _refresh(self, after: int, backoff: Backoff, deadline: float) -> int:
+        """Waits for a poll that completes after the given generation.
+
+        Polls are started at most once per backoff delay, by whichever
+        waiter gets there first, and every other waiter waits for its
+        result. A last poll is made when the deadline is reached. Returns
+        the generation of the poll.
+        """
+        with self._cond:
+            while True:
+                if self._polling:
+                    self._cond.wait()
+                    continue
+
+                if self._generation > after:
+                    if self._error is not None:
+                        raise self._error
+                    return self._generation
+
+                delay = backoff.delay(self._attempt)
+                wait = min(self._last_poll + delay, deadline) - time.monotonic()
+                if wait <= 0:
+                    break
+
+                self._cond.wait(timeout=wait)
+
+            self._polling = True
+            self._last_poll = time.monotonic()
+            self._attempt += 1
+            names = sorted(self._waiting)
+
+        running: set[str] | None = None
+        error: Exception | None = None
+        try:
+            found: set[str] = set()
+            for i in range(0, len(names), NAMES_PER_CALL):
+                for page in walk_pages(
+                    self.client.list_deployments,
+                    names=names[i : i + NAMES_PER_CALL],
+                    phases=WAIT_PHASES,
+                ):
+                    found.update(
+                        d.metadata.name
+                        for d in page
+                        if d.status is not None and d.status.status == Status.RUNNING
+                    )
+            running = found
+        except Exception as e:
+            error = e
+
+        with self._cond:
+            if running is not None:
+                self._running = running
+            self._error = error
+            self._polling = False
+            self._generation += 1
+            self._cond.notify_all()
+
+            if error is not None:
+                raise error
+
+            return self._generation
+
+
+def get_tracker(client: Client) -> DeploymentTracker:
+    """Returns the tracker shared by everyone using the same client."""
+    with _trackers_lock:
+        tracker = _trackers.get(client)
+        if tracker is None:
+            tracker = DeploymentTracker(client)
+            _trackers[client] = tracker
+
+        return tracker
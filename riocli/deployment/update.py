@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import functools
-from queue import Queue
 
 import click
 from click_help_colors import HelpColorsCommand
@@ -23,8 +22,7 @@ from yaspin.api import Yaspin
 from riocli.config import new_v2_client
 from riocli.constants import Colors, Symbols
 from riocli.deployment.util import fetch_deployments, print_deployments_for_confirmation
-from riocli.utils import tabulate_data
-from riocli.utils.execute import apply_func_with_result
+from riocli.utils.execute import bulk_execute, print_bulk_result
 from riocli.utils.spinner import with_spinner
 
 
@@ -54,6 +52,18 @@ from riocli.utils.spinner import with_spinner
     type=int,
     default=10,
 )
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="Seconds to wait for each deployment, including retried requests",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    default=None,
+    help="Maximum number of requests per second",
+)
 @click.argument("deployment-name-or-regex", type=str, default="")
 @with_spinner(text="Updating...")
 def update_deployment(
@@ -61,10 +71,20 @@ def update_deployment(
     workers: int,
     deployment_name_or_regex: str,
     update_all: bool = False,
+    timeout: float | None = None,
+    rate_limit: float | None = None,
     spinner: Yaspin = None,
 ) -> None:
     """Use the restart command instead"""
-    _update(force, workers, deployment_name_or_regex, update_all, spinner)
+    _update(
+        force,
+        workers,
+        deployment_name_or_regex,
+        update_all,
+        timeout=timeout,
+        rate_limit=rate_limit,
+        spinner=spinner,
+    )
 
 
 @click.command(
@@ -92,6 +112,27 @@ def update_deployment(
     type=int,
     default=10,
 )
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="Seconds to wait for each deployment, including retried requests",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    default=None,
+    help="Maximum number of requests per second",
+)
+@click.option(
+    "--label",
+    "-l",
+    "labels",
+    multiple=True,
+    type=click.STRING,
+    default=(),
+    help="Only restart the deployments with the labels",
+)
 @click.argument("deployment-name-or-regex", type=str, default="")
 @with_spinner(text="Updating...")
 def restart_deployment(
@@ -99,6 +140,9 @@ def restart_deployment(
     workers: int,
     deployment_name_or_regex: str,
     update_all: bool = False,
+    timeout: float | None = None,
+    rate_limit: float | None = None,
+    labels: tuple[str, ...] = (),
     spinner: Yaspin = None,
 ) -> None:
     """Restarts one or more deployments by name or regex.
@@ -116,8 +160,21 @@ def restart_deployment(
     Restart deployments matching a regex.
 
     $ rio deployment restart amr.*
+
+    Restart the deployments with a label.
+
+    $ rio deployment restart --label app=amr
     """
-    _update(force, workers, deployment_name_or_regex, update_all, spinner)
+    _update(
+        force,
+        workers,
+        deployment_name_or_regex,
+        update_all,
+        timeout=timeout,
+        rate_limit=rate_limit,
+        labels=labels,
+        spinner=spinner,
+    )
 
 
 def _update(
@@ -125,16 +182,21 @@ def _update(
     workers: int,
     deployment_name_or_regex: str,
     update_all: bool = False,
+    timeout: float | None = None,
+    rate_limit: float | None = None,
+    labels: tuple[str, ...] = (),
     spinner: Yaspin = None,
 ) -> None:
     client = new_v2_client()
-    if not (deployment_name_or_regex or update_all):
+    if not (deployment_name_or_regex or update_all or labels):
         spinner.text = "Nothing to update"
         spinner.green.ok(Symbols.SUCCESS)
         return
 
     try:
-        deployments = fetch_deployments(client, deployment_name_or_regex, update_all)
+        deployments = fetch_deployments(
+            client, deployment_name_or_regex, update_all, labels=labels
+        )
     except Exception as e:
         spinner.text = click.style(f"Failed to update deployment(s): {e}", Colors.RED)
         spinner.red.fail(Symbols.ERROR)
@@ -156,20 +218,27 @@ def _update(
         spinner.write("")
 
     try:
-        f = functools.partial(_apply_update, client)
-        result = apply_func_with_result(
-            f=f, items=deployments, workers=workers, key=lambda x: x[0]
+        results = bulk_execute(
+            functools.partial(_apply_update, client),
+            deployments,
+            workers=workers,
+            timeout=timeout,
+            rate_limit=rate_limit,
         )
 
-        data, fg, statuses = [], Colors.GREEN, []
-        for name, status, msg in result:
-            fg = Colors.GREEN if status else Colors.RED
-            icon = Symbols.SUCCESS if status else Symbols.ERROR
-            statuses.append(status)
-            data.append([click.style(name, fg), click.style(f"{icon}  {msg}", fg)])
-
-        with spinner.hidden():
-            tabulate_data(data, headers=["Name", "Status"])
+        statuses = []
+        for r in results:
+            statuses.append(r.ok)
+            print_bulk_result(
+                spinner,
+                r.item.metadata.name,
+                r.ok,
+                "Restarted" if r.ok else str(r.error),
+                unknown=r.timed_out,
+            )
+            spinner.text = (
+                f"Restarted {sum(statuses)}/{len(deployments)} deployment(s)..."
+            )
 
         icon = Symbols.SUCCESS if all(statuses) else Symbols.WARNING
         fg = Colors.GREEN if all(statuses) else Colors.YELLOW
@@ -184,13 +253,5 @@ def _update(
         raise SystemExit(1) from e
 
 
-def _apply_update(
-    client: Client,
-    result: Queue,
-    deployment: Deployment,
-) -> None:
-    try:
-        client.update_deployment(body=deployment)
-        result.put((deployment.metadata.name, True, "Restarted"))
-    except Exception as e:
-        result.put((deployment.metadata.name, False, str(e)))
+def _apply_update(client: Client, deployment: Deployment) -> None:
+    client.update_deployment(body=deployment)
@@ -12,17 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
-import time
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from rapyuta_io_sdk_v2 import Client
 from rapyuta_io_sdk_v2.models import Deployment
 from rapyuta_io_sdk_v2.utils import walk_pages
 
+from riocli.deployment.list import ALL_PHASES as WATCH_PHASES
 from riocli.deployment.list import DEFAULT_PHASES
+from riocli.deployment.tracker import NAMES_PER_CALL
+from riocli.exceptions import ResourceNotFound
 from riocli.utils import process_errors, tabulate_data
 from riocli.utils.enums import DeploymentPhaseConstants
 from riocli.utils.error import DeploymentNotRunning, ImagePullError, RetriesExhausted
+from riocli.utils.listing import iter_items
+from riocli.utils.matcher import NameMatcher
+from riocli.utils.poller import Poller
 
 ALL_PHASES = [
     DeploymentPhaseConstants.DeploymentPhaseInProgress,
@@ -31,31 +37,57 @@ ALL_PHASES = [
     DeploymentPhaseConstants.DeploymentPhaseStopped,
 ]
 
+FAILED_TO_START_PHASE = "FailedToStart"
+IMAGE_PULL_ERROR = "DEP_E153"
+
+# Deployment names that can be sent to the server as a filter.
+PLAIN_NAME = re.compile(r"[a-z0-9][a-z0-9-]*")
+
 
 def fetch_deployments(
     client: Client,
     deployment_name_or_regex: str,
     include_all: bool,
+    labels: Iterable[str] = (),
 ) -> list[Any]:
-    deployments = []
-    for page in walk_pages(client.list_deployments, phases=DEFAULT_PHASES):
-        deployments.extend(page)
-    result = []
-    items = deployments if deployments is not None else []
-    for deployment in items:
-        if (
-            include_all
-            or deployment_name_or_regex == deployment.metadata.name
-            or deployment_name_or_regex == deployment.metadata.guid
-            or (
-                deployment_name_or_regex not in deployment.metadata.name
-                and re.search(rf"^{deployment_name_or_regex}$", deployment.metadata.name)
-                and re.search(rf"^{deployment_name_or_regex}$", deployment.metadata.name)
+    """Returns the deployments with the name, GUID or regex and the labels.
+
+    The names and the labels are sent as filters to the server, so that
+    only the candidates are listed. A regex is matched against the whole
+    listing, since the server cannot narrow it down. Without
+    a name or regex, all the deployments with the labels are returned.
+    """
+    labels = list(labels) or None
+    if include_all or not deployment_name_or_regex:
+        if not (include_all or labels):
+            return []
+        return _list_deployments(client, label_selector=labels)
+
+    matcher = NameMatcher(deployment_name_or_regex)
+    if matcher.literal:
+        for key in ("names", "guids"):
+            result = _list_deployments(
+                client, label_selector=labels, **{key: [deployment_name_or_regex]}
             )
-        ):
-            result.append(deployment)
+            result = [
+                d for d in result if matcher.matches(d.metadata.name, d.metadata.guid)
+            ]
+            if result:
+                return result
+
+        return []
 
-    return result
+    return [
+        d
+        for d in _list_deployments(client, label_selector=labels)
+        if matcher.matches(d.metadata.name, d.metadata.guid)
+    ]
+
+
+def _list_deployments(client: Client, **filters) -> list[Deployment]:
+    return list(
+        iter_items(walk_pages(client.list_deployments, phases=DEFAULT_PHASES, **filters))
+    )
 
 
 def print_deployments_for_confirmation(deployments: list[Deployment]):
@@ -85,10 +117,11 @@ def poll_deployment(
     if ready_phases is None:
         ready_phases = []
 
-    deployment = client.get_deployment(name=name)
-    status = deployment.status
+    status = None
+    for _ in Poller.from_retries(retry_count, sleep_interval):
+        deployment = client.get_deployment(name=name)
+        status = deployment.status
 
-    for _ in range(retry_count):
         if status is not None and status.phase in ready_phases:
             return deployment
 
@@ -111,13 +144,9 @@ def poll_deployment(
                 f"Deployment not running. Phase: Stopped  Status: {status.phase}"
             )
 
-        time.sleep(sleep_interval)
-        deployment = client.get_deployment(name=name)
-        status = deployment.status
-
     error_codes = getattr(status, "error_codes", []) if status else []
     msg = (
-        f"Retries exhausted: Tried {retry_count} times with {sleep_interval}s interval. "
+        f"Retries exhausted: Waited {retry_count * sleep_interval}s for the deployment. "
         f"Deployment: phase={status.phase if status else 'Unknown'} "
         f"status={status.status if status else 'Unknown'}"
     )
@@ -125,3 +154,137 @@ def poll_deployment(
         msg += f"\n{process_errors(error_codes)}"
 
     raise RetriesExhausted(msg)
+
+
+def watch_deployments(
+    client: Client,
+    names_or_regex: Iterable[str],
+    labels: Iterable[str] = (),
+    retry_count: int = 50,
+    sleep_interval: int = 6,
+) -> Iterator[tuple[list[Deployment], dict[str, Deployment]]]:
+    """Polls a set of deployments and yields their transitions.
+
+    The deployments are matched by name, GUID or regex and by labels on
+    the first poll. Every later poll lists all of them with one batched
+    call. Each iteration yields the deployments whose phase or status
+    changed since the previous poll, along with the latest state of all
+    the matched deployments by name. The iteration stops at the deadline
+    of retry_count * sleep_interval seconds.
+    """
+    patterns, labels = list(names_or_regex), list(labels)
+    tracked: dict[str, Deployment] = {}
+
+    for attempt in Poller.from_retries(retry_count, sleep_interval):
+        if attempt == 0:
+            current = _match_deployments(client, patterns, labels)
+        else:
+            current = _list_deployments_by_name(client, list(tracked))
+            deleted = tracked.keys() - current.keys()
+            if deleted:
+                raise DeploymentNotRunning(
+                    f"Deployment(s) deleted: {', '.join(sorted(deleted))}"
+                )
+
+        changed = [
+            d
+            for name, d in current.items()
+            if name not in tracked or _state(tracked[name]) != _state(d)
+        ]
+        tracked = current
+        yield changed, tracked
+
+
+def is_deployment_ready(deployment: Deployment) -> bool:
+    status = deployment.status
+    return (
+        status is not None
+        and status.phase == DeploymentPhaseConstants.DeploymentPhaseSucceeded.value
+    )
+
+
+def deployment_failure(deployment: Deployment) -> str | None:
+    """Returns why the deployment will not become ready, if it will not."""
+    status = deployment.status
+    if status is None:
+        return None
+
+    errors = status.error_codes or []
+    if (
+        status.phase == DeploymentPhaseConstants.DeploymentPhaseProvisioning.value
+        and IMAGE_PULL_ERROR in errors
+    ) or status.phase in (
+        DeploymentPhaseConstants.DeploymentPhaseStopped.value,
+        FAILED_TO_START_PHASE,
+    ):
+        msg = f"Phase: {status.phase} Status: {status.status}"
+        if errors:
+            msg += f"\n{process_errors(errors)}"
+        return msg
+
+    return None
+
+
+def _state(deployment: Deployment) -> tuple[str | None, str | None]:
+    status = deployment.status
+    if status is None:
+        return None, None
+
+    return status.phase, status.status
+
+
+def _match_deployments(
+    client: Client,
+    patterns: list[str],
+    labels: list[str],
+) -> dict[str, Deployment]:
+    """Returns the deployments matching the names, GUIDs or regexes.
+
+    Plain names are looked up with a names filter. The rest are matched
+    against a listing of every deployment with the labels.
+    """
+    plain = [p for p in patterns if PLAIN_NAME.fullmatch(p)]
+    found = _list_deployments_by_name(client, plain, labels) if plain else {}
+
+    rest = [p for p in patterns if p not in found]
+    if rest or not patterns:
+        regexes = {p: re.compile(p) for p in rest}
+        matched: set[str] = set()
+        for page in walk_pages(
+            client.list_deployments, label_selector=labels, phases=WATCH_PHASES
+        ):
+            for d in page:
+                for p, regex in regexes.items():
+                    if p == d.metadata.guid or regex.fullmatch(d.metadata.name):
+                        found[d.metadata.name] = d
+                        matched.add(p)
+
+                if not patterns:
+                    found[d.metadata.name] = d
+
+        missing = [p for p in rest if p not in matched]
+        if missing:
+            raise ResourceNotFound(f"deployment(s) not found: {', '.join(missing)}")
+
+    if not found:
+        raise ResourceNotFound("no deployments match the labels")
+
+    return found
+
+
+def _list_deployments_by_name(
+    client: Client,
+    names: list[str],
+    labels: list[str] | None = None,
+) -> dict[str, Deployment]:
+    found = {}
+    for i in range(0, len(names), NAMES_PER_CALL):
+        for page in walk_pages(
+            client.list_deployments,
+            names=names[i : i + NAMES_PER_CALL],
+            label_selector=labels,
+            phases=WATCH_PHASES,
+        ):
+            found.update((d.metadata.name, d) for d in page)
+
+    return found
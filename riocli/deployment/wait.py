@@ -16,8 +16,12 @@ from click_help_colors import HelpColorsCommand
 
 from riocli.config import new_v2_client
 from riocli.constants import Colors, Symbols
-from riocli.deployment.util import poll_deployment
-from riocli.utils.error import DeploymentNotRunning, ImagePullError, RetriesExhausted
+from riocli.deployment.util import (
+    deployment_failure,
+    is_deployment_ready,
+    watch_deployments,
+)
+from riocli.utils.error import DeploymentNotRunning, RetriesExhausted
 from riocli.utils.spinner import with_spinner
 
 
@@ -27,38 +31,103 @@ from riocli.utils.spinner import with_spinner
     help_headers_color=Colors.YELLOW,
     help_options_color=Colors.GREEN,
 )
-@click.argument("deployment-name", type=str)
+@click.option(
+    "--label",
+    "-l",
+    "labels",
+    multiple=True,
+    type=click.STRING,
+    default=(),
+    help="Wait for the deployments with the labels",
+)
+@click.argument("deployment-name-or-regex", type=str, nargs=-1)
 @with_spinner(text="Waiting for deployment...", timer=True)
 def wait_for_deployment(
-    deployment_name: str,
+    deployment_name_or_regex: tuple[str, ...],
+    labels: tuple[str, ...],
     spinner=None,
 ) -> None:
-    """Wait until the deployment succeeds/fails
+    """Wait until the deployments succeed or any of them fails
 
     This command is useful in scripts or automation when you
-    explicitly want to wait for the deployment to succeed.
+    explicitly want to wait for the deployments to succeed.
+
+    You can specify deployment names, GUIDs or regex patterns, and
+    labels to select the deployments. The phase transitions of the
+    deployments are printed as they happen.
+
+    Usage Examples:
+
+        Wait for a deployment by name
+
+            $ rio deployment wait DEPLOYMENT_NAME
+
+        Wait for multiple deployments
+
+            $ rio deployment wait DEPLOYMENT_1 DEPLOYMENT_2
+
+        Wait for deployments using a regex pattern
+
+            $ rio deployment wait "DEPLOYMENT.*"
+
+        Wait for deployments with labels
+
+            $ rio deployment wait --label app=amr --label site=tokyo
     """
+    if not (deployment_name_or_regex or labels):
+        raise click.UsageError("Specify deployment names, regex patterns or labels")
+
     try:
         client = new_v2_client()
-        deployment = poll_deployment(client=client, name=deployment_name)
-        spinner.text = click.style(
-            f"Phase: Succeeded Status: {deployment.status.status}",
-            fg=Colors.GREEN,
+        pending = set()
+        for changed, deployments in watch_deployments(
+            client, deployment_name_or_regex, labels
+        ):
+            for d in changed:
+                spinner.write(_transition(d))
+
+            failed = {n: deployment_failure(d) for n, d in deployments.items()}
+            failed = {n: msg for n, msg in failed.items() if msg}
+            if failed:
+                raise DeploymentNotRunning(
+                    "Deployment not running. "
+                    + "\n".join(f"{n}: {msg}" for n, msg in sorted(failed.items()))
+                )
+
+            pending = {n for n, d in deployments.items() if not is_deployment_ready(d)}
+            if not pending:
+                spinner.text = click.style(
+                    f"{len(deployments)} deployment(s) succeeded", fg=Colors.GREEN
+                )
+                spinner.green.ok(Symbols.SUCCESS)
+                return
+
+            spinner.text = f"Waiting for {len(pending)} deployment(s)..."
+
+        raise RetriesExhausted(
+            f"Retries exhausted: Deployment(s) not ready: {', '.join(sorted(pending))}"
         )
-        spinner.green.ok(Symbols.SUCCESS)
     except RetriesExhausted as e:
         spinner.write(click.style(str(e), fg=Colors.RED))
         spinner.text = click.style("Try again", Colors.RED)
         spinner.red.fail(Symbols.ERROR)
-    except DeploymentNotRunning as e:
-        spinner.text = click.style(str(e), fg=Colors.RED)
-        spinner.red.fail(Symbols.ERROR)
-        raise SystemExit(1)
-    except ImagePullError as e:
-        spinner.text = click.style(str(e), fg=Colors.RED)
-        spinner.red.fail(Symbols.ERROR)
-        raise SystemExit(1)
     except Exception as e:
         spinner.text = click.style(str(e), fg=Colors.RED)
         spinner.red.fail(Symbols.ERROR)
         raise SystemExit(1)
+
+
+def _transition(deployment) -> str:
+    status = deployment.status
+    phase = status.phase if status else "Unknown"
+    state = status.status if status else "Unknown"
+
+    color = Colors.YELLOW
+    if deployment_failure(deployment):
+        color = Colors.RED
+    elif is_deployment_ready(deployment):
+        color = Colors.GREEN
+
+    return click.style(
+        f"{deployment.metadata.name}: Phase: {phase} Status: {state}", fg=color
+    )
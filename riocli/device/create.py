@@ -17,6 +17,7 @@ from rapyuta_io import ROSDistro
 from rapyuta_io.clients.device import Device, DeviceRuntime
 
 from riocli.config import new_client
+from riocli.utils.namecache import DEVICE, invalidates_names
 
 
 @click.command("create", hidden=True)
@@ -39,6 +40,7 @@ from riocli.config import new_client
     help="Path to the Catkin Workspace (only preinstalled)",
 )
 @click.argument("device-name", type=str)
+@invalidates_names(DEVICE)
 def create_device(
     device_name: str,
     description: str,
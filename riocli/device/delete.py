@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
-from queue import Queue
 
 import click
 import requests
@@ -25,7 +24,8 @@ from riocli.config import new_client
 from riocli.constants import Colors, Symbols
 from riocli.device.util import fetch_devices
 from riocli.utils import tabulate_data
-from riocli.utils.execute import apply_func_with_result
+from riocli.utils.execute import bulk_execute, print_bulk_result
+from riocli.utils.namecache import DEVICE, invalidates_names
 from riocli.utils.spinner import with_spinner
 
 
@@ -48,13 +48,28 @@ from riocli.utils.spinner import with_spinner
     type=int,
     default=10,
 )
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="Seconds to wait for each device, including the retried requests",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    default=None,
+    help="Maximum number of requests per second",
+)
 @click.argument("device-name-or-regex", type=str, default="")
+@invalidates_names(DEVICE)
 @with_spinner(text="Deleting device...")
 def delete_device(
     force: bool,
     workers: int,
     device_name_or_regex: str,
     delete_all: bool = False,
+    timeout: float | None = None,
+    rate_limit: float | None = None,
     spinner: Yaspin = None,
 ) -> None:
     """Delete one or more devices with a name or a regex pattern.
@@ -118,32 +133,27 @@ def delete_device(
         spinner.write("")
 
     try:
-        f = functools.partial(_delete_device, client)
-        result = apply_func_with_result(
-            f=f, items=devices, workers=workers, key=lambda x: x[0]
+        results = bulk_execute(
+            functools.partial(_delete_device, client),
+            devices,
+            workers=workers,
+            timeout=timeout,
+            rate_limit=rate_limit,
         )
 
-        data, fg = [], Colors.GREEN
         success_count, failed_count = 0, 0
-
-        for name, response in result:
-            if response.status_code and response.status_code < 400:
-                fg = Colors.GREEN
-                icon = Symbols.SUCCESS
+        for r in results:
+            response = r.value
+            ok = r.ok and bool(response.status_code) and response.status_code < 400
+            if ok:
                 success_count += 1
                 msg = ""
             else:
-                fg = Colors.RED
-                icon = Symbols.ERROR
                 failed_count += 1
-                msg = get_error_message(response, name)
+                msg = get_error_message(response, r.item.name) if r.ok else str(r.error)
 
-            data.append(
-                [click.style(name, fg), click.style(icon, fg), click.style(msg, fg)]
-            )
-
-        with spinner.hidden():
-            tabulate_data(data, headers=["Name", "Status", "Message"])
+            print_bulk_result(spinner, r.item.name, ok, msg, unknown=r.timed_out)
+            spinner.text = f"Deleted {success_count}/{len(devices)} device(s)..."
 
         spinner.write("")
 
@@ -171,17 +181,8 @@ def delete_device(
         raise SystemExit(1) from e
 
 
-def _delete_device(
-    client: Client,
-    result: Queue,
-    device: Device = None,
-) -> None:
-    response = requests.models.Response()
-    try:
-        response = client.delete_device(device_id=device.uuid)
-        result.put((device["name"], response))
-    except Exception:
-        result.put((device["name"], response))
+def _delete_device(client: Client, device: Device) -> requests.models.Response:
+    return client.delete_device(device_id=device.uuid)
 
 
 def get_error_message(response: requests.models.Response, name: str) -> str:
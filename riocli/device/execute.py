@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from shlex import join
-from time import sleep
+from time import monotonic, sleep
 
 import click
 from click_help_colors import HelpColorsCommand
@@ -21,6 +21,10 @@ from rapyuta_io import Command
 from riocli.config import new_client
 from riocli.constants import Colors, Symbols
 from riocli.device.util import fetch_devices
+from riocli.utils.poller import Backoff
+
+# The longest delay between two fetches of an async command result.
+ASYNC_RESULT_INTERVAL = 10
 
 
 @click.command(
@@ -176,19 +180,33 @@ def execute_async(client, device_guids, device_dict, command, timeout):
 
 
 def get_async_output(client, jid, device_guids, device_dict, timeout):
-    max_retries = 3
     remaining_devices = device_guids.copy()
-    for _ in range(max_retries):
-        wait_result = client.fetch_cmd_result(
-            jid=jid, device_ids=remaining_devices, timeout=timeout
-        )
+    backoff = Backoff(maximum=ASYNC_RESULT_INTERVAL)
+    deadline = monotonic() + timeout
+    attempt = 0
+
+    while remaining_devices and monotonic() < deadline:
+        # The SDK sleeps for the retry interval when the result is not ready
+        # yet, so a single probe with the backoff delay also paces the loop.
+        interval = max(min(backoff.delay(attempt), deadline - monotonic()), 0.1)
+        attempt += 1
+
+        try:
+            wait_result = client.fetch_cmd_result(
+                jid=jid,
+                device_ids=remaining_devices,
+                retry_interval=interval,
+                timeout=interval,
+            )
+        except TimeoutError:
+            continue
+
         remaining_devices = print_response(
             result=wait_result, device_guids=remaining_devices, device_dict=device_dict
         )
 
-        if len(remaining_devices) <= 0:
-            break
-        sleep(2)
+        if remaining_devices:
+            sleep(interval)
 
     if remaining_devices:
         print_no_output_error(remaining_devices)
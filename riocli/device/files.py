@@ -27,6 +27,7 @@ from riocli.config import new_v2_client
 from riocli.constants import Colors, Symbols
 from riocli.device.util import name_to_guid, name_to_request_id
 from riocli.utils import AliasedGroup, tabulate_data
+from riocli.utils.namecache import FILE_UPLOAD, invalidates_names
 from riocli.utils.spinner import with_spinner
 
 
@@ -96,6 +97,7 @@ def list_uploads(device_name: str, device_guid: str) -> None:
 @click.argument("upload-name", type=str)
 @click.argument("file-path", type=str)
 @name_to_guid
+@invalidates_names(FILE_UPLOAD)
 @with_spinner(text="Uploading...")
 def create_upload(
     device_name: str,
@@ -194,6 +196,7 @@ def upload_status(
 @click.argument("file-name", type=str)
 @name_to_guid
 @name_to_request_id
+@invalidates_names(FILE_UPLOAD)
 @with_spinner(text="Deleting upload...")
 def delete_upload(
     device_name: str, device_guid: str, file_name: str, request_id: str, spinner=None
@@ -18,7 +18,7 @@ from rapyuta_io.clients import Device
 
 from riocli.config import new_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -46,4 +46,4 @@ def _display_device_list(devices: list[Device], show_header: bool = True) -> Non
 
     data = [[d.uuid, d.name, d.status] for d in devices]
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
@@ -19,6 +19,7 @@ from riocli.config import new_client
 from riocli.constants import Colors, Symbols
 from riocli.device.util import migrate_device_to_project, name_to_guid
 from riocli.project.util import name_to_guid as project_name_to_guid
+from riocli.utils.namecache import DEVICE, invalidates_names
 from riocli.utils.spinner import with_spinner
 
 
@@ -46,6 +47,7 @@ from riocli.utils.spinner import with_spinner
 )
 @name_to_guid
 @project_name_to_guid
+@invalidates_names(DEVICE)
 @click.pass_context
 @with_spinner(text="Migrating device...")
 def migrate_project(
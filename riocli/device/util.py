@@ -12,11 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
-import re
-import time
 import typing
 from datetime import datetime, timedelta, timezone
-from functools import lru_cache, wraps
+from functools import wraps
 from pathlib import Path
 
 import click
@@ -24,6 +22,7 @@ from munch import Munch
 from rapyuta_io import Client
 from rapyuta_io.clients.device import Device, DeviceStatus
 from rapyuta_io.utils import RestClient
+from rapyuta_io.utils.error import ResourceNotFoundError
 from rapyuta_io.utils.rest_client import HttpMethod
 from rapyuta_io_sdk_v2 import walk_pages
 from rapyuta_io_sdk_v2.models import SharedURL, SharedURLSpec
@@ -40,6 +39,10 @@ from riocli.constants import Colors
 from riocli.exceptions import DeviceNotFound
 from riocli.hwil.util import execute_command, find_device_id
 from riocli.utils import is_valid_uuid, trim_prefix, trim_suffix
+from riocli.utils.listing import iter_items
+from riocli.utils.matcher import NameMatcher
+from riocli.utils.namecache import DEVICE, FILE_UPLOAD, get_name_cache
+from riocli.utils.poller import Poller
 
 
 def name_to_guid(f: typing.Callable) -> typing.Callable:
@@ -124,17 +127,27 @@ def get_device_name(client: Client, guid: str) -> str:
     return device.name
 
 
-@lru_cache
 def find_device_guid(client: Client, name: str) -> str:
+    cache = get_name_cache()
+    guid = cache.get(DEVICE, name) if cache else None
+    if guid is not None:
+        return guid
+
     devices = client.get_all_devices(device_name=name)
     for device in devices:
         if device.name == name:
+            if cache:
+                cache.set(DEVICE, name, device.uuid)
             return device.uuid
 
     raise DeviceNotFound()
 
 
 def find_device_by_name(client: Client, name: str) -> Device:
+    device = _get_cached_device(client, name)
+    if device is not None:
+        return device
+
     devices = client.get_all_devices(device_name=name)
     if devices:
         return devices[0]
@@ -142,6 +155,25 @@ def find_device_by_name(client: Client, name: str) -> Device:
     raise DeviceNotFound()
 
 
+def _get_cached_device(client: Client, name: str) -> Device | None:
+    """Fetches a device by its cached GUID, forgetting it if stale."""
+    cache = get_name_cache()
+    guid = cache.get(DEVICE, name) if cache else None
+    if guid is None:
+        return None
+
+    try:
+        device = client.get_device(device_id=guid)
+    except ResourceNotFoundError:
+        device = None
+
+    if device is None or device.name != name:
+        cache.forget(DEVICE, name)
+        return None
+
+    return device
+
+
 def name_to_request_id(f: typing.Callable) -> typing.Callable:
     @wraps(f)
     def decorated(**kwargs):
@@ -154,11 +186,28 @@ def name_to_request_id(f: typing.Callable) -> typing.Callable:
         file_name = kwargs.pop("file_name")
         device_guid = kwargs.get("device_guid")
 
-        # Collect all file uploads across pages to avoid missing entries due to pagination
-        all_uploads = []
-        for page in walk_pages(client.list_fileuploads, device_guid=device_guid):
-            all_uploads.extend(page)
-        file_name, request_id = find_request_id(all_uploads, file_name)
+        cache = get_name_cache()
+        key = f"{device_guid}/{file_name}"
+        request_id = cache.get(FILE_UPLOAD, key) if cache else None
+
+        if request_id is None:
+            # Walk the pages to avoid missing entries due to pagination, and
+            # stop at the first upload with the name.
+            all_uploads = []
+            pages = walk_pages(client.list_fileuploads, device_guid=device_guid)
+            for upload in iter_items(pages):
+                all_uploads.append(upload)
+                if upload.spec.file_name == file_name:
+                    break
+            if cache:
+                cache.update(
+                    FILE_UPLOAD,
+                    (
+                        (f"{device_guid}/{u.spec.file_name}", u.metadata.guid)
+                        for u in all_uploads
+                    ),
+                )
+            file_name, request_id = find_request_id(all_uploads, file_name)
 
         kwargs["file_name"] = file_name
         kwargs["request_id"] = request_id
@@ -173,21 +222,46 @@ def fetch_devices(
     include_all: bool,
     online_devices: bool = False,
 ) -> list[Device]:
-    devices = client.get_all_devices(online_device=online_devices)
-    result = []
-    for device in devices:
-        if (
-            include_all
-            or device.name == device_name_or_regex
-            or device_name_or_regex == device.uuid
-            or (
-                device_name_or_regex not in device.name
-                and re.search(rf"^{device_name_or_regex}$", device.name)
-            )
-        ):
-            result.append(device)
+    if include_all:
+        return _list_devices(client, online_devices)
+
+    matcher = NameMatcher(device_name_or_regex)
+    if not matcher.literal:
+        # The server cannot narrow down a regex, so every device is matched.
+        devices = _list_devices(client, online_devices)
+        return [d for d in devices if matcher.matches(d.name, d.uuid)]
+
+    device = _get_cached_device(client, device_name_or_regex)
+    if device is not None:
+        return [device] if device.is_online() or not online_devices else []
+
+    # The server only narrows down the devices by name, so the listing is
+    # matched here as well.
+    devices = _list_devices(client, online_devices, device_name=device_name_or_regex)
+    result = [d for d in devices if matcher.matches(d.name, d.uuid)]
+    if result or not is_valid_uuid(device_name_or_regex):
+        return result
+
+    try:
+        device = client.get_device(device_id=device_name_or_regex)
+    except ResourceNotFoundError:
+        return []
+    return [device] if device.is_online() or not online_devices else []
+
+
+def _list_devices(
+    client: Client,
+    online_devices: bool,
+    device_name: str | None = None,
+) -> list[Device]:
+    devices = client.get_all_devices(
+        online_device=online_devices, device_name=device_name
+    )
+    cache = get_name_cache()
+    if cache:
+        cache.update(DEVICE, ((d.name, d.uuid) for d in devices))
 
-    return result
+    return devices
 
 
 def migrate_device_to_project(
@@ -382,19 +456,11 @@ def wait_until_online(device: Device, timeout: int = 600) -> None:
     This is a helper method that waits until the device is online.
     Or, until the timeout is reached. The default timeout is 600 seconds.
     """
-    counter, interval = 0, 20
     failed_states = (DeviceStatus.FAILED, DeviceStatus.REJECTED)
 
-    device.refresh()
-
-    while (
-        not device.is_online()
-        and device.status not in failed_states
-        and counter < timeout
-    ):
-        counter += interval
-        time.sleep(interval)
+    for _ in Poller(timeout=timeout, interval=20):
         device.refresh()
+        if device.is_online() or device.status in failed_states:
+            return
 
-    if not device.is_online() and counter >= timeout:
-        raise Exception("timeout reached while waiting for the device to be online")
+    raise Exception("timeout reached while waiting for the device to be online")
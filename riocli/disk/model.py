@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any
+
 from munch import Munch
 from rapyuta_io_sdk_v2 import Client as v2Client
 from rapyuta_io_sdk_v2 import Disk as DiskModel
+from rapyuta_io_sdk_v2 import walk_pages
 from typing_extensions import override
 
 from riocli.disk.util import poll_disk
@@ -47,6 +50,11 @@ class Disk(Model):
     def delete_object(self, v2_client: v2Client, *args, **kwargs) -> None:
         _ = v2_client.delete_disk(self._obj.metadata.name)
 
+    @override
+    @classmethod
+    def list_objects(cls, v2_client: v2Client, names: list[str]) -> list[Any]:
+        return [o for page in walk_pages(v2_client.list_disks, names=names) for o in page]
+
     @override
     def list_dependencies(self) -> list[str] | None:
         return None
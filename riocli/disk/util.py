@@ -17,9 +17,9 @@ import typing
 
 from rapyuta_io_sdk_v2 import Client
 
-from riocli.utils import tabulate_data
 from riocli.utils.enums import DiskStatusConstants
 from riocli.utils.error import DeploymentNotRunning, RetriesExhausted
+from riocli.utils.listing import print_list
 
 
 def fetch_disks(
@@ -70,7 +70,7 @@ def display_disk_list(disks: typing.Any, show_header: bool = True):
             ]
         )
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
 
 
 def poll_disk(
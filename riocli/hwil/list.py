@@ -17,7 +17,7 @@ from click_help_colors import HelpColorsCommand
 
 from riocli.config import new_hwil_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -46,4 +46,4 @@ def _display_device_list(devices: list[dict], show_header: bool = True) -> None:
         [d.id, d.name, d.status, d.static_ip, d.ip_address, d.flavor] for d in devices
     ]
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
@@ -15,7 +15,6 @@ from __future__ import annotations
 
 import http
 import json
-import time
 from typing import TYPE_CHECKING
 
 from munch import Munch, munchify
@@ -24,6 +23,7 @@ from rapyuta_io.utils.rest_client import HttpMethod, RestClient
 
 from riocli.exceptions import DeviceNotFound
 from riocli.utils import generate_short_guid, sanitize_label
+from riocli.utils.poller import Poller
 
 if TYPE_CHECKING:
     import requests
@@ -201,7 +201,7 @@ class Client:
         url = f"{self._host}/device/{device_id}"
         headers = self._get_auth_header()
 
-        for _ in range(retry_limit):
+        for _ in Poller.from_retries(retry_limit, sleep_interval):
             response = RestClient(url).method(HttpMethod.GET).headers(headers).execute()
 
             handle_server_errors(response)
@@ -211,13 +211,10 @@ class Client:
                 raise Exception(f"hwil: {response.text}")
 
             device = munchify(data)
-            if device.status != "IDLE":
-                time.sleep(sleep_interval)
-                continue
+            if device.status == "IDLE":
+                return
 
-            return
-
-        msg = f"Retries exhausted: Tried {retry_limit} times with {sleep_interval}s interval."
+        msg = f"Retries exhausted: Waited {retry_limit * sleep_interval}s for the device."
         raise RetriesExhausted(msg)
 
     def list_devices(self: Client, query: dict = None) -> Munch:
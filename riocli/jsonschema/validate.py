@@ -14,9 +14,8 @@
 import functools
 from pathlib import Path
 
-import yaml
-
 from jsonschema import Draft7Validator, validators
+from riocli.utils import yaml_backend as yaml
 
 
 def extend_with_default(validator_class):
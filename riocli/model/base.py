@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any
 
 from munch import Munch
 from rapyuta_io import Client
@@ -29,6 +29,9 @@ from riocli.constants import ApplyResult
 from riocli.exceptions import ResourceNotFound
 from riocli.jsonschema.validate import load_schema
 
+if TYPE_CHECKING:
+    from riocli.apply.state import ServerState
+
 DELETE_POLICY_LABEL = "rapyuta.io/deletionPolicy"
 
 
@@ -58,6 +61,9 @@ class Model(ABC, Munch):
     The validate method is a class method that need not be implemented
     by the subclasses. It validates the model against the corresponding
     schema that are defined in the schema files.
+
+    The subclasses can optionally implement the list_objects class method
+    to let apply find out upfront whether the objects already exist.
     """
 
     @abstractmethod
@@ -111,6 +117,23 @@ class Model(ABC, Munch):
         """
         raise NotImplementedError
 
+    @classmethod
+    def list_objects(cls, v2_client: v2Client, names: list[str]) -> Iterable[Any] | None:
+        """List the objects of this kind that exist on rapyuta.io.
+
+        The names of the objects being applied are passed so that the
+        implementation can filter on the server when the API supports it.
+        Returns None if listing is not supported for the kind.
+        """
+        return None
+
+    @classmethod
+    def index_key(cls, obj: Any) -> str:
+        """
+        Generate the key that matches a listed object with a manifest.
+        """
+        return obj.metadata.name
+
     @staticmethod
     def object_key(obj: Mapping[str, Any]) -> str:
         """
@@ -137,9 +160,13 @@ class Model(ABC, Munch):
         config: Configuration,
         retry_count: int,
         retry_interval: int,
+        server_state: "ServerState | None" = None,
     ) -> ApplyResult:
         """
         Create or update the object.
+
+        If the server_state has indexed the kind of the object, it is used
+        to pick between create and update without a failing request.
         """
         metadata = self.get("metadata")
         if metadata is not None:
@@ -148,6 +175,38 @@ class Model(ABC, Munch):
             if "updatedAt" in metadata:
                 del metadata["updatedAt"]
 
+        kwargs = dict(
+            client=client,
+            v2_client=v2_client,
+            config=config,
+            retry_count=retry_count,
+            retry_interval=retry_interval,
+        )
+
+        existing = None
+        if server_state is not None and server_state.is_indexed(self):
+            existing = server_state.get(self)
+
+        if existing is None:
+            # Either the kind is not indexed, or the object does not exist.
+            # The create falls back to update in case the object was created
+            # after it was listed.
+            return self._create_or_update(**kwargs)
+
+        try:
+            _ = self.update_object(**kwargs)
+            return ApplyResult.UPDATED
+        except NotImplementedError:
+            return ApplyResult.EXISTS
+
+    def _create_or_update(
+        self,
+        client: Client,
+        v2_client: v2Client,
+        config: Configuration,
+        retry_count: int,
+        retry_interval: int,
+    ) -> ApplyResult:
         try:
             _ = self.create_object(
                 client=client,
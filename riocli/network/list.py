@@ -17,7 +17,7 @@ from click_help_colors import HelpColorsCommand
 
 from riocli.config import new_v2_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -90,4 +90,4 @@ def _display_network_list(
             ]
         )
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
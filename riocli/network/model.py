@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any
+
 from munch import Munch
-from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2 import Client, walk_pages
 from rapyuta_io_sdk_v2 import Network as NetworkModel
 from typing_extensions import override
 
@@ -47,6 +49,13 @@ class Network(Model):
     def delete_object(self, v2_client: Client, *args, **kwargs) -> None:
         _ = v2_client.delete_network(self._obj.metadata.name)
 
+    @override
+    @classmethod
+    def list_objects(cls, v2_client: Client, names: list[str]) -> list[Any]:
+        return [
+            o for page in walk_pages(v2_client.list_networks, names=names) for o in page
+        ]
+
     @override
     def list_dependencies(self) -> list[str] | None:
         self._obj.list_dependencies()
@@ -19,7 +19,7 @@ from munch import munchify, unmunchify
 
 from riocli.config import get_config_from_context
 from riocli.constants.colors import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -76,4 +76,4 @@ def _display_oauth2_client_list(
 
         data.append(row)
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
@@ -17,7 +17,7 @@ from click_help_colors import HelpColorsCommand
 
 from riocli.config import get_config_from_context, new_v2_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -63,4 +63,4 @@ def print_organizations(organizations, current):
             ]
         )
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
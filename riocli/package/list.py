@@ -16,7 +16,7 @@ from rapyuta_io_sdk_v2 import walk_pages
 
 from riocli.config import new_v2_client
 from riocli.package.model import Package
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command("list")
@@ -82,4 +82,4 @@ def _display_package_list(
             data.append(
                 [name, package.metadata.version, package.metadata.guid, description]
             )
-    tabulate_data(data, headers=headers)
+    print_list(data, headers=headers)
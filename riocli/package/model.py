@@ -12,8 +12,10 @@
 # see the license for the specific language governing permissions and
 # limitations under the license.
 
+from typing import Any
+
 from munch import Munch
-from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2 import Client, walk_pages
 from rapyuta_io_sdk_v2 import Package as PackageModel
 from typing_extensions import override
 
@@ -40,6 +42,16 @@ class Package(Model):
             self._obj.metadata.name, version=self._obj.metadata.version
         )
 
+    @override
+    @classmethod
+    def list_objects(cls, v2_client: Client, names: list[str]) -> list[Any]:
+        return [o for page in walk_pages(v2_client.list_packages) for o in page]
+
+    @override
+    @classmethod
+    def index_key(cls, obj: Any) -> str:
+        return f"{obj.metadata.name}:{obj.metadata.version}"
+
     @override
     def list_dependencies(self) -> list[str] | None:
         return self._obj.list_dependencies()
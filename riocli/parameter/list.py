@@ -16,7 +16,7 @@ from click_help_colors import HelpColorsCommand
 
 from riocli.constants import Colors
 from riocli.parameter.utils import list_trees
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -30,7 +30,7 @@ def list_configuration_trees() -> None:
     try:
         data = list_trees()
         trees = [[tree] for tree in data]
-        tabulate_data(trees, headers=["Tree Name"])
+        print_list(trees, headers=["Tree Name"])
     except Exception as e:
         click.secho(str(e), fg=Colors.RED)
         raise SystemExit(1)
@@ -20,11 +20,11 @@ from filecmp import dircmp
 
 import click
 from directory_tree import display_tree
-from rapyuta_io.utils import RestClient
 from rapyuta_io.utils.rest_client import HttpMethod
 
 from riocli.config import Configuration
 from riocli.constants import Colors
+from riocli.utils.http import api_request
 
 
 def filter_trees(root_dir: str, tree_names: tuple[str]) -> list[str]:
@@ -59,7 +59,7 @@ def display_trees(root_dir: str, trees: list[str]) -> None:
 
 
 def _api_call(
-    method: str,
+    method: HttpMethod,
     name: str | None = None,
     payload: dict | None = None,
     load_response: bool = True,
@@ -72,7 +72,7 @@ def _api_call(
     if name:
         url = f"{url}/{name}"
     headers = config.get_auth_header()
-    response = RestClient(url).method(method).headers(headers).execute(payload=payload)
+    response = api_request(method.value, url, headers=headers, json=payload)
     data = None
     err_msg = "error in the api call"
     if load_response:
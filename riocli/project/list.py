@@ -20,7 +20,7 @@ from rapyuta_io_sdk_v2.utils import walk_pages
 from riocli.config import new_v2_client
 from riocli.constants import Colors
 from riocli.organization.util import name_to_guid as name_to_organization_guid
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -121,4 +121,4 @@ def _display_project_list(
             )
         data.append([click.style(v, fg=fg, bold=bold) for v in row])
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
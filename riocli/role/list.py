@@ -19,7 +19,16 @@ from rapyuta_io_sdk_v2.utils import walk_pages
 
 from riocli.config import get_config_from_context
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import (
+    OUTPUT_TABLE,
+    iter_items,
+    list_output_options,
+    print_list,
+    stream_items,
+)
+
+ROLE_COLUMNS = [("Role Name", 40), ("Description", 0)]
+BINDING_COLUMNS = [("Role", 32), ("Domain", 40), ("Subject", 0)]
 
 
 @click.command(
@@ -37,8 +46,14 @@ from riocli.utils import tabulate_data
     default=(),
     help="Filter the roles list by labels",
 )
+@list_output_options
 @click.pass_context
-def list_roles(ctx: click.Context, labels: list[str] | None = None):
+def list_roles(
+    ctx: click.Context,
+    labels: list[str] | None = None,
+    output: str = OUTPUT_TABLE,
+    limit: int | None = None,
+):
     """List all the roles in current organization.
 
     You can also filter the list by specifying labels using the ``--label``
@@ -53,15 +68,22 @@ def list_roles(ctx: click.Context, labels: list[str] | None = None):
         List all roles with label "release=3.0"
 
             $ rio role list --label release=3.0
+
+        Stream the roles as JSON lines, in the order of the server
+
+            $ rio role list --output jsonl
     """
     try:
         config = get_config_from_context(ctx)
         client = config.new_v2_client(with_project=False)
-        roles = []
-        for items in walk_pages(client.list_roles, label_selector=labels):
-            roles.extend(items)
-        roles = sorted(roles, key=lambda r: r.metadata.name.lower())
-        _display_role_list(roles)
+        roles = iter_items(
+            walk_pages(client.list_roles, label_selector=labels), limit=limit
+        )
+        if output == OUTPUT_TABLE:
+            roles = sorted(roles, key=lambda r: r.metadata.name.lower())
+            _display_role_list(roles)
+        else:
+            stream_items(roles, output, ROLE_COLUMNS, _role_row)
     except Exception as e:
         click.secho(str(e), fg=Colors.RED)
         raise SystemExit(1)
@@ -82,8 +104,14 @@ def list_roles(ctx: click.Context, labels: list[str] | None = None):
     default=(),
     help="Filter the rolebindings list by labels",
 )
+@list_output_options
 @click.pass_context
-def list_role_bindings(ctx: click.Context, labels: list[str] | None = None):
+def list_role_bindings(
+    ctx: click.Context,
+    labels: list[str] | None = None,
+    output: str = OUTPUT_TABLE,
+    limit: int | None = None,
+):
     """List all the rolebindings in current organization.
 
     Usage:
@@ -93,10 +121,13 @@ def list_role_bindings(ctx: click.Context, labels: list[str] | None = None):
     try:
         config = get_config_from_context(ctx)
         client = config.new_v2_client(with_project=False)
-        role_bindings = []
-        for items in walk_pages(client.list_role_bindings, label_selector=labels):
-            role_bindings.extend(items)
-        _display_rolebindings_list(role_bindings)
+        role_bindings = iter_items(
+            walk_pages(client.list_role_bindings, label_selector=labels), limit=limit
+        )
+        if output == OUTPUT_TABLE:
+            _display_rolebindings_list(list(role_bindings))
+        else:
+            stream_items(role_bindings, output, BINDING_COLUMNS, _rolebinding_row)
     except Exception as e:
         click.secho(str(e), fg=Colors.RED)
         raise SystemExit(1)
@@ -108,32 +139,34 @@ def _display_role_list(
 ) -> None:
     headers = []
     if show_header:
-        headers = ["Role Name", "Description"]
+        headers = [h for h, _ in ROLE_COLUMNS]
 
-    data = []
-    for r in roles:
-        description = getattr(r.spec, "description", "")
+    data = [_role_row(r) for r in roles]
+    print_list(data, headers)
 
-        description = description.replace("\n", " ")
-        if len(description) > 48:
-            description = description[:48] + ".."
 
-        data.append([r.metadata.name, description])
+def _role_row(r: Munch) -> list:
+    description = getattr(r.spec, "description", "") or ""
 
-    tabulate_data(data, headers)
+    description = description.replace("\n", " ")
+    if len(description) > 48:
+        description = description[:48] + ".."
+
+    return [r.metadata.name, description]
 
 
 def _display_rolebindings_list(rolebindings: list[Munch], show_header: bool = True):
-    headers = ["Role", "Domain", "Subject"] if show_header else []
-    data = [
-        [
-            r.spec.role_ref.name,
-            _format_domain(r.spec.domain),
-            _format_subject(r.spec.subject),
-        ]
-        for r in rolebindings
+    headers = [h for h, _ in BINDING_COLUMNS] if show_header else []
+    data = [_rolebinding_row(r) for r in rolebindings]
+    print_list(data, headers)
+
+
+def _rolebinding_row(r: Munch) -> list:
+    return [
+        r.spec.role_ref.name,
+        _format_domain(r.spec.domain),
+        _format_subject(r.spec.subject),
     ]
-    tabulate_data(data, headers)
 
 
 def _format_subject(subject: Munch) -> str:
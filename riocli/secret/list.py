@@ -18,7 +18,7 @@ from rapyuta_io_sdk_v2 import walk_pages
 
 from riocli.config import new_v2_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -70,4 +70,4 @@ def _display_secret_list(
         for secret in secrets
     ]
 
-    tabulate_data(data, headers)
+    print_list(data, headers)
@@ -19,7 +19,7 @@ from rapyuta_io_sdk_v2.utils import walk_pages
 
 from riocli.config import new_v2_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -80,4 +80,4 @@ def _display_service_accounts_list(accounts: list[ServiceAccount]) -> None:
             ]
         )
 
-    tabulate_data(data=data, headers=headers)
+    print_list(data=data, headers=headers)
@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from rapyuta_io_sdk_v2 import Client
+from typing import Any
+
+from rapyuta_io_sdk_v2 import Client, walk_pages
 from rapyuta_io_sdk_v2 import ServiceAccount as ServiceAccountModel
 from typing_extensions import override
 
@@ -38,6 +40,11 @@ class ServiceAccount(Model):
     def delete_object(self, v2_client: Client, *args, **kwargs) -> None:
         _ = v2_client.delete_service_account(name=self._obj.metadata.name)
 
+    @override
+    @classmethod
+    def list_objects(cls, v2_client: Client, names: list[str]) -> list[Any]:
+        return [o for page in walk_pages(v2_client.list_service_accounts) for o in page]
+
     @override
     def list_dependencies(self):
         return self._obj.list_dependencies()
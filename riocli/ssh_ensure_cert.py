@@ -16,9 +16,10 @@
 
 This module is the *fast path* equivalent of ``rio ssh-cert``.
 It is invoked on **every** SSH connection that matches the wrapper's
-``Match user ... exec`` block, so startup latency matters: importing the
-full ``rio`` command tree (``riocli.bootstrap``) costs ~650ms because it
-eagerly pulls in both SDKs and the ``apply`` subsystem.
+``Match user ... exec`` block, so startup latency matters: running
+``rio ssh-cert`` costs ~650ms because the command pulls in both SDKs and
+the configuration, even though ``riocli.bootstrap`` loads its commands
+lazily.
 
 To keep the common (no-renewal) path fast, this module lives at the top of
 the ``riocli`` package — importing it runs only the tiny ``riocli/__init__``
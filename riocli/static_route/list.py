@@ -18,7 +18,15 @@ from rapyuta_io_sdk_v2 import walk_pages
 
 from riocli.config import new_v2_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import (
+    OUTPUT_TABLE,
+    iter_items,
+    list_output_options,
+    print_list,
+    stream_items,
+)
+
+COLUMNS = [("ID", 26), ("Name", 32), ("URL", 0)]
 
 
 @click.command(
@@ -36,7 +44,8 @@ from riocli.utils import tabulate_data
     default=(),
     help="Filter the deployment list by labels",
 )
-def list_static_routes(labels: list[str]) -> None:
+@list_output_options
+def list_static_routes(labels: list[str], output: str, limit: int | None) -> None:
     """List the static routes in the current project.
 
     You can filter the list by providing labels using
@@ -47,29 +56,30 @@ def list_static_routes(labels: list[str]) -> None:
         List static routes with label 'app=web'
 
             $ rio static-route list --label app=web
+
+        Print the first 100 static routes as JSON lines
+
+            $ rio static-route list --output jsonl --limit 100
     """
     try:
         client = new_v2_client(with_project=True)
-        routes = []
-        for page in walk_pages(client.list_staticroutes, label_selector=labels):
-            routes.extend(page)
-        _display_routes_list(routes)
+        routes = iter_items(
+            walk_pages(client.list_staticroutes, label_selector=labels), limit=limit
+        )
+        if output == OUTPUT_TABLE:
+            _display_routes_list(list(routes))
+        else:
+            stream_items(routes, output, COLUMNS, _route_row)
     except Exception as e:
         click.secho(str(e), fg=Colors.RED)
         raise SystemExit(1) from e
 
 
 def _display_routes_list(routes: list[munch.Munch]) -> None:
-    headers = ["ID", "Name", "URL"]
+    headers = [h for h, _ in COLUMNS]
+    data = [_route_row(route) for route in routes]
+    print_list(data, headers)
 
-    data = []
-    for route in routes:
-        data.append(
-            [
-                route.metadata.guid,
-                route.metadata.name,
-                f"https://{route.spec.url}",
-            ]
-        )
 
-    tabulate_data(data, headers)
+def _route_row(route: munch.Munch) -> list:
+    return [route.metadata.guid, route.metadata.name, f"https://{route.spec.url}"]
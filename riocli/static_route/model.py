@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Any
+
 from munch import Munch
-from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2 import Client, walk_pages
 from rapyuta_io_sdk_v2 import StaticRoute as StaticRouteModel
 from typing_extensions import override
 
@@ -42,6 +44,22 @@ class StaticRoute(Model):
             name=f"{self._obj.metadata.name}-{config.organization_short_id}"
         )
 
+    @override
+    @classmethod
+    def list_objects(cls, v2_client: Client, names: list[str]) -> list[Any]:
+        # The routes are named "{name}-{organization_short_id}" on the
+        # server, so the names in the manifests cannot be used as a filter.
+        return [o for page in walk_pages(v2_client.list_staticroutes) for o in page]
+
+    @override
+    @classmethod
+    def index_key(cls, obj: Any) -> str:
+        if isinstance(obj, Model):
+            return obj.metadata.name
+
+        # Strip the organization's short ID from the listed routes.
+        return obj.metadata.name.rsplit("-", 1)[0]
+
     @override
     def list_dependencies(self) -> list[str] | None:
         return None
@@ -19,7 +19,7 @@ from rapyuta_io_sdk_v2.utils import walk_pages
 
 from riocli.config import new_v2_client
 from riocli.constants import Colors
-from riocli.utils import tabulate_data
+from riocli.utils.listing import print_list
 
 
 @click.command(
@@ -62,4 +62,4 @@ def _display_usergroup_list(usergroups: typing.Any, show_header: bool = True):
                 ]
             )
 
-    tabulate_data(rows, headers)
+    print_list(rows, headers)
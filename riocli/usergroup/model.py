@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Any
+
 from munch import Munch
-from rapyuta_io_sdk_v2 import Client
+from rapyuta_io_sdk_v2 import Client, walk_pages
 from rapyuta_io_sdk_v2 import UserGroupCreate as UserGroupModel
 from typing_extensions import override
 
@@ -55,6 +57,11 @@ class UserGroup(Model):
             group_guid=group_guid, group_name=self._obj.metadata.name
         )
 
+    @override
+    @classmethod
+    def list_objects(cls, v2_client: Client, names: list[str]) -> list[Any]:
+        return [o for page in walk_pages(v2_client.list_user_groups) for o in page]
+
     @override
     def list_dependencies(self) -> list[str] | None:
         self._obj.list_dependencies()
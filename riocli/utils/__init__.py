@@ -27,15 +27,12 @@ from typing import Any
 from uuid import UUID
 
 import click
-import requests
-import semver
-import yaml
+from click.core import ParameterSource
 from click_help_colors import HelpColorsGroup
-from munch import munchify
-from tabulate import tabulate
 
 from riocli.constants import Colors, Symbols
 from riocli.utils.alias import AliasedGroup as AliasedGroup
+from riocli.utils.context import get_output_format
 
 
 class Singleton(type):
@@ -48,7 +45,20 @@ class Singleton(type):
 
 
 def inspect_with_format(obj: Any, format_type: str):
-    if format_type == "json":
+    """
+    Prints the object in the given format.
+
+    The global --output option takes precedence over the default of the
+    command's --format option, but not over a --format given explicitly.
+    With ndjson, the object is printed on a single line, without a pager.
+    """
+    from riocli.utils import yaml_backend as yaml
+
+    format_type = _inspect_format(format_type)
+
+    if format_type == "ndjson":
+        click.echo(json.dumps(obj, default=str))
+    elif format_type == "json":
         click.echo_via_pager(json.dumps(obj, indent=4))
     elif format_type == "yaml":
         click.echo_via_pager(yaml.dump(obj, allow_unicode=True))
@@ -56,10 +66,28 @@ def inspect_with_format(obj: Any, format_type: str):
         raise Exception("Invalid format")
 
 
+def _inspect_format(format_type: str) -> str:
+    output = get_output_format()
+    if output is None or output == "table":
+        return format_type
+
+    # Commands without a format option print in the format they document.
+    ctx = click.get_current_context()
+    if not any(p.name == "format_type" for p in ctx.command.params):
+        return format_type
+
+    if ctx.get_parameter_source("format_type") == ParameterSource.COMMANDLINE:
+        return format_type
+
+    return output
+
+
 def dump_all_yaml(objs: list[dict[str, Any]]):
     """
     Dump multiple documents as YAML separated by triple dash (---)
     """
+    from riocli.utils import yaml_backend as yaml
+
     click.echo_via_pager(
         yaml.safe_dump_all(documents=objs, allow_unicode=True, explicit_start=True)
     )
@@ -149,6 +177,8 @@ def tabulate_data(
     """
     Prints data in tabular format
     """
+    from tabulate import tabulate
+
     # https://github.com/astanin/python-tabulate#table-format
     header_foreground = "yellow"
 
@@ -171,6 +201,9 @@ def is_pip_installation() -> bool:
 
 
 def check_for_updates(current_version: str) -> tuple[bool, str]:
+    import requests
+    import semver
+
     try:
         package_info = requests.get("https://pypi.org/pypi/rapyuta-io-cli/json").json()
     except Exception as e:
@@ -192,6 +225,8 @@ def pip_install_cli(
     """
     Installs the given rapyuta-io-cli version using pip
     """
+    import semver
+
     if not version:
         raise ValueError("version cannot by empty.")
 
@@ -214,6 +249,9 @@ def update_appimage(version: str):
     """
     Updates the AppImage locally
     """
+    import requests
+    from munch import munchify
+
     if not version:
         raise ValueError("version cannot be empty")
 
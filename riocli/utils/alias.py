@@ -1,3 +1,5 @@
+import importlib
+
 from click_help_colors import HelpColorsGroup
 
 
@@ -11,13 +13,13 @@ class AliasedGroup(HelpColorsGroup):
 
     def get_command(self, ctx, cmd_name):
         # Step 1: Try to get the command normally (exact match)
-        rv = super().get_command(ctx, cmd_name)
+        rv = self._get_command(ctx, cmd_name)
         if rv is not None:
             return rv
 
         # Step 2: Check if it's an explicit alias
         if cmd_name in self.aliases:
-            return super().get_command(ctx, self.aliases[cmd_name])
+            return self._get_command(ctx, self.aliases[cmd_name])
 
         # Step 3: Check for abbreviations (startswith)
         matches = [
@@ -26,12 +28,51 @@ class AliasedGroup(HelpColorsGroup):
         if not matches:
             return None
         elif len(matches) == 1:
-            return super().get_command(ctx, matches[0])
+            return self._get_command(ctx, matches[0])
 
         # Multiple matches - fail with helpful message
         ctx.fail(f"Too many matches: {', '.join(sorted(matches))}")
 
+    def _get_command(self, ctx, cmd_name):
+        return super().get_command(ctx, cmd_name)
+
     def resolve_command(self, ctx, args):
         # Always return the command's name, not the alias
         cmd_name, cmd, args = super().resolve_command(ctx, args)
         return cmd.name, cmd, args
+
+
+class LazyAliasedGroup(AliasedGroup):
+    """An AliasedGroup that imports its subcommands when they are needed.
+
+    The subcommands are given as a mapping of command names to import
+    paths of the form "module.path:attribute". A subcommand's module is
+    imported when it is invoked, completed or listed in the help, so that
+    running one command does not import the code of all the others.
+
+    Commands added with add_command are supported as well.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.lazy_commands = kwargs.pop("lazy_commands", {})
+        super().__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def _get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+
+        return super()._get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name):
+        module_name, attribute = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if command.name != cmd_name:
+            raise ValueError(
+                f"{self.lazy_commands[cmd_name]} is the {command.name} command, "
+                f"not {cmd_name}"
+            )
+
+        return command
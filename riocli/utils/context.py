@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import click
 from click import Context
 
 
@@ -25,3 +26,15 @@ def get_root_context(ctx: Context) -> Context:
             return ctx
 
         ctx = ctx.parent
+
+
+def get_output_format() -> str | None:
+    """
+    get_output_format returns the value of the global --output option, or
+    None when it is not set or there is no command running.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return None
+
+    return get_root_context(ctx).params.get("output")
@@ -12,13 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import threading
+import time
 import typing
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from queue import Queue
 
+import click
 from rapyuta_io import Command
 
 from riocli.config import new_client
+from riocli.constants import Colors, Symbols
+from riocli.utils.http import configure_pool, deadline
+from riocli.utils.ratelimit import RateLimiter
 
 
 def run_on_device(
@@ -76,6 +83,7 @@ def apply_func(f: typing.Callable, items: list[typing.Any], workers: int = 5) ->
     workers : int
         The number of workers to use
     """
+    configure_pool(workers)
     with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exec") as e:
         e.map(f, items)
 
@@ -124,9 +132,158 @@ def apply_func_with_result(
     r = Queue()
     f = functools.partial(f, r)
 
-    apply_func(f, items, workers)
+    for _ in bulk_execute(f, items, workers=workers):
+        pass
 
     if key:
         return sorted(list(r.queue), key=key)
 
     return list(r.queue)
+
+
+@dataclass
+class BulkResult:
+    """The outcome of applying a function to an item.
+
+    An item that timed out is not ok, but its outcome is unknown: the call
+    may still have taken effect.
+    """
+
+    item: typing.Any
+    value: typing.Any = None
+    error: Exception | None = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def bulk_execute(
+    f: typing.Callable,
+    items: typing.Iterable[typing.Any],
+    workers: int = 5,
+    timeout: float | None = None,
+    rate_limit: float | None = None,
+) -> typing.Iterator[BulkResult]:
+    """Apply a function to items in parallel and yield results as they complete
+
+    Unlike apply_func_with_result, the function returns its result or raises,
+    and every item's BulkResult is yielded as soon as it is done. For example,
+
+    for r in bulk_execute(lambda d: client.delete_deployment(name=d), names):
+        print(r.item, "deleted" if r.ok else r.error)
+
+    The items are not retried here, since the API calls are already retried
+    on transient errors by riocli.utils.http. The API requests of an item
+    time out along with it. An item that is still running when its timeout
+    passes, e.g. in a request, is reported as timed out with a TimeoutError,
+    and the result of its call is dropped if it returns later. When the
+    caller stops iterating, e.g. on Ctrl-C, the items that have not started
+    are cancelled.
+
+    Parameters
+    ----------
+    f : typing.Callable
+        The function to apply
+    items : typing.Iterable
+        The items to apply the function to
+    workers : int
+        The number of workers to use
+    timeout : float
+        The seconds an item may take
+    rate_limit : float
+        The maximum number of calls per second across all the workers
+    """
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    stopped = threading.Event()
+    started: dict[int, float] = {}
+    abandoned: set[int] = set()
+
+    def run(index: int, item: typing.Any) -> BulkResult | None:
+        started[index] = time.monotonic()
+        result = BulkResult(item)
+        if stopped.is_set():
+            result.error = CancelledError()
+            return result
+
+        with deadline(timeout):
+            if limiter is not None:
+                limiter.acquire()
+
+            try:
+                result.value = f(item)
+            except Exception as e:
+                result.error = e
+
+        # The item was already reported as timed out.
+        if index in abandoned:
+            return None
+
+        return result
+
+    configure_pool(workers)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk")
+    try:
+        futures = {
+            executor.submit(run, i, item): (i, item) for i, item in enumerate(items)
+        }
+        pending = set(futures)
+        while pending:
+            starts = [started.get(futures[f][0]) for f in pending]
+            done, pending = wait(
+                pending,
+                timeout=_next_expiry(starts, timeout),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                yield future.result()
+
+            if timeout is None:
+                continue
+
+            now = time.monotonic()
+            for future in list(pending):
+                index, item = futures[future]
+                if index in started and now - started[index] >= timeout:
+                    pending.remove(future)
+                    abandoned.add(index)
+                    yield BulkResult(
+                        item,
+                        error=TimeoutError(
+                            f"timed out after {timeout}s, the outcome is unknown"
+                        ),
+                        timed_out=True,
+                    )
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _next_expiry(starts: list[float | None], timeout: float | None) -> float | None:
+    """Returns the seconds until the earliest started item times out."""
+    if timeout is None:
+        return None
+
+    starts = [s for s in starts if s is not None]
+    if not starts:
+        return timeout
+
+    return max(min(starts) + timeout - time.monotonic(), 0.01)
+
+
+def print_bulk_result(
+    spinner, name: str, ok: bool, msg: str = "", unknown: bool = False
+) -> None:
+    """Prints the outcome of an item of a bulk operation above the spinner.
+
+    Items whose outcome is unknown, e.g. that timed out, are printed as
+    warnings rather than failures.
+    """
+    if unknown:
+        fg, icon = Colors.YELLOW, Symbols.WARNING
+    else:
+        fg = Colors.GREEN if ok else Colors.RED
+        icon = Symbols.SUCCESS if ok else Symbols.ERROR
+
+    spinner.write(f"{click.style(name, fg)}  {click.style(f'{icon}  {msg}', fg)}")
@@ -0,0 +1,472 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The HTTP plumbing shared by the API clients.
+
+All the clients in the process share the same connection pools, so that
+worker threads reuse kept-alive TLS connections instead of connecting for
+every call, and pace their requests with the process-wide rate limiter:
+
+* The v2 SDK client's httpx client is replaced by one that uses the shared
+  ApiTransport.
+* The v1 SDK's RestClient, which calls requests.request directly, is
+  patched once to use the shared requests session.
+* Everything else makes its requests with get_session or api_request.
+
+    client = configure_v2_client(v2Client(config=config))
+    patch_rest_client()
+    response = api_request("GET", url, headers=headers)
+
+The pools hold DEFAULT_POOL_SIZE connections per host and grow with
+configure_pool when more workers are used. Requests with idempotent
+methods are retried on connection errors and 502, 503 and 504 responses.
+A DELETE that finds nothing to delete after an attempt that may have
+reached the server, i.e. one answered with one of these statuses or that
+timed out reading the response, succeeded on that attempt, and is
+reported as such. Throttled requests (HTTP 429)
+slow the limiter down and are retried after their Retry-After delay, so
+that they do not surface as errors. This is the only layer that retries
+the requests. The calls and their retries are traced with
+riocli.utils.trace when it is enabled.
+
+The requests a thread makes within a deadline time out when it passes,
+however many requests and retries the call makes:
+
+    with deadline(30):
+        client.delete_deployment(name=name)
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, TypeVar
+
+import httpx
+import requests
+from rapyuta_io.utils.rest_client import RestClient
+from requests.adapters import HTTPAdapter
+
+from riocli.utils.poller import Backoff
+from riocli.utils.ratelimit import get_rate_limiter
+from riocli.utils.trace import count_retry, trace_request
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    from rapyuta_io_sdk_v2 import Client as v2Client
+
+    from riocli.utils.ratelimit import AdaptiveRateLimiter
+
+NO_CONTENT = 204
+NOT_FOUND = 404
+TOO_MANY_REQUESTS = 429
+
+# The number of times a throttled request is retried.
+MAX_THROTTLE_RETRIES = 5
+
+DEFAULT_POOL_SIZE = 10
+KEEPALIVE_EXPIRY = 60
+# The connect and read timeouts, the same as the v1 SDK's.
+REQUEST_TIMEOUT = (30, 150)
+
+# The number of times an idempotent request is retried on the errors below.
+HTTP_RETRIES = 3
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"})
+RETRY_BACKOFF = Backoff(maximum=4)
+
+# The shortest timeout given to a request made past its deadline.
+MIN_TIMEOUT = 0.001
+
+_Response = TypeVar("_Response", httpx.Response, requests.Response)
+
+_lock = threading.Lock()
+_pool_size = DEFAULT_POOL_SIZE
+_session: requests.Session | None = None
+_httpx_pool: httpx.BaseTransport | None = None
+# The responses open on every httpx pool, so that a pool that was replaced
+# is closed once they are all closed.
+_httpx_pool_users: dict[httpx.BaseTransport, int] = {}
+_deadline = threading.local()
+
+
+def configure_pool(workers: int) -> None:
+    """Grows the connection pools to serve the given number of workers."""
+    global _pool_size, _httpx_pool
+
+    with _lock:
+        if workers <= _pool_size:
+            return
+
+        _pool_size = workers
+        if _session is not None:
+            _mount(_session)
+        # Requests in flight finish on the previous pool, which is closed
+        # after them, and the next ones use a bigger one.
+        retired, _httpx_pool = _httpx_pool, None
+        idle = retired is not None and retired not in _httpx_pool_users
+
+    if idle:
+        retired.close()
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Times out the requests the thread makes once the seconds have passed.
+
+    The timeouts of the requests are capped to the time left, and they are
+    not retried past it. Nested deadlines never extend the outer ones.
+    """
+    previous = getattr(_deadline, "at", None)
+    if seconds is not None:
+        at = time.monotonic() + seconds
+        _deadline.at = at if previous is None else min(at, previous)
+
+    try:
+        yield
+    finally:
+        _deadline.at = previous
+
+
+def get_session() -> requests.Session:
+    """Returns the requests session shared by the whole process."""
+    global _session
+
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _mount(_session)
+
+        return _session
+
+
+def api_request(method: str, url: str, **kwargs) -> requests.Response:
+    """Makes a request with the shared session and the rate limiter."""
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    session = get_session()
+
+    def request() -> requests.Response:
+        timeout = _capped(kwargs["timeout"])
+        return session.request(method, url, **{**kwargs, "timeout": timeout})
+
+    def send() -> requests.Response:
+        limiter = get_rate_limiter()
+        if limiter is None:
+            return request()
+
+        return _throttled(limiter, request, close=requests.Response.close)
+
+    with trace_request(method, url) as call:
+        response, reached = _with_retries(
+            method,
+            send,
+            close=requests.Response.close,
+            errors=(requests.ConnectionError, requests.Timeout),
+            unanswered=(requests.ReadTimeout,),
+        )
+        if reached and _already_deleted(method, response.status_code):
+            response.close()
+            gone = requests.Response()
+            gone.status_code, gone.url, gone._content = NO_CONTENT, url, b""
+            gone.request = response.request
+            response = gone
+
+        if call is not None:
+            call.set_response(response.status_code, response.headers)
+            if call.size is None and not kwargs.get("stream"):
+                call.size = len(response.content or b"")
+
+        return response
+
+
+class ApiTransport(httpx.BaseTransport):
+    """An httpx transport over the shared pool with the rate limiter.
+
+    Requests with idempotent methods are retried with backoff on connection
+    errors and on the RETRY_STATUS_CODES. Closing it leaves the shared pool
+    open for the other clients.
+    """
+
+    def __init__(self, retries: int = HTTP_RETRIES):
+        self.retries = retries
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with trace_request(request.method, str(request.url)) as call:
+            response = self._handle(request)
+            if call is not None:
+                call.set_response(response.status_code, response.headers)
+
+            return response
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        response, reached = _with_retries(
+            request.method,
+            lambda: self._send(request),
+            close=httpx.Response.close,
+            errors=(httpx.TransportError,),
+            unanswered=(httpx.ReadTimeout,),
+            retries=self.retries,
+        )
+        if reached and _already_deleted(request.method, response.status_code):
+            response.close()
+            return httpx.Response(NO_CONTENT, request=request)
+
+        return response
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        if _time_left() is not None:
+            timeouts = request.extensions.get("timeout", {})
+            request.extensions["timeout"] = {k: _capped(v) for k, v in timeouts.items()}
+
+        limiter = get_rate_limiter()
+        if limiter is None:
+            return _send_on_pool(request)
+
+        return _throttled(
+            limiter,
+            lambda: _send_on_pool(request),
+            close=httpx.Response.close,
+        )
+
+    def close(self) -> None:
+        pass
+
+
+def configure_v2_client(client: v2Client) -> v2Client:
+    """Routes the requests of a v2 SDK client through the shared transport."""
+    previous = client.c
+    client.c = httpx.Client(
+        timeout=previous.timeout,
+        headers=previous.headers,
+        transport=ApiTransport(),
+    )
+    previous.close()
+
+    return client
+
+
+def patch_rest_client() -> None:
+    """Routes the requests of the v1 SDK's RestClient through api_request."""
+    with _lock:
+        if getattr(RestClient._request, "patched", False):
+            return
+
+        @functools.wraps(RestClient._request)
+        def _request(self, payload, raw=False):
+            body = {"data": payload} if raw else {"json": payload}
+            return api_request(
+                self._method,
+                self._url,
+                headers=self._headers,
+                params=self._query_params,
+                **body,
+            )
+
+        _request.patched = True
+        RestClient._request = _request
+
+
+def retry_after(headers: Mapping[str, str]) -> float | None:
+    """Returns the seconds to wait from a Retry-After header, if any."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _mount(session: requests.Session) -> None:
+    previous = {session.adapters.get(prefix) for prefix in ("https://", "http://")}
+    adapter = HTTPAdapter(
+        pool_connections=DEFAULT_POOL_SIZE,
+        pool_maxsize=_pool_size,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # urllib3 closes the connections in use when they are returned.
+    for old in previous - {None}:
+        old.close()
+
+
+def _get_httpx_pool() -> httpx.BaseTransport:
+    global _httpx_pool
+
+    with _lock:
+        if _httpx_pool is None:
+            _httpx_pool = httpx.HTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=_pool_size,
+                    max_keepalive_connections=_pool_size,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                )
+            )
+
+        return _httpx_pool
+
+
+def _send_on_pool(request: httpx.Request) -> httpx.Response:
+    """Sends a request on the current httpx pool, holding it until closed."""
+    pool = _get_httpx_pool()
+    with _lock:
+        _httpx_pool_users[pool] = _httpx_pool_users.get(pool, 0) + 1
+
+    try:
+        response = pool.handle_request(request)
+    except BaseException:
+        _release_httpx_pool(pool)
+        raise
+
+    if response.is_closed:
+        _release_httpx_pool(pool)
+    else:
+        response.stream = _PoolStream(response.stream, pool)
+
+    return response
+
+
+def _release_httpx_pool(pool: httpx.BaseTransport) -> None:
+    with _lock:
+        users = _httpx_pool_users[pool] - 1
+        if users:
+            _httpx_pool_users[pool] = users
+            return
+
+        del _httpx_pool_users[pool]
+        if pool is _httpx_pool:
+            return
+
+    pool.close()
+
+
+class _PoolStream(httpx.SyncByteStream):
+    """The body of a response, which releases its pool when it is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, pool: httpx.BaseTransport):
+        self._stream = stream
+        self._pool: httpx.BaseTransport | None = pool
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            pool, self._pool = self._pool, None
+            if pool is not None:
+                _release_httpx_pool(pool)
+
+
+def _with_retries(
+    method: str,
+    send: Callable[[], _Response],
+    close: Callable[[_Response], None],
+    errors: tuple[type[Exception], ...],
+    unanswered: tuple[type[Exception], ...] = (),
+    retries: int = HTTP_RETRIES,
+) -> tuple[_Response, bool]:
+    """Sends a request, retrying it with backoff if its method is idempotent.
+
+    It is not retried past the thread's deadline. Returns the response and
+    whether an earlier attempt may have reached the server: it was answered
+    with one of the RETRY_STATUS_CODES, or raised one of the unanswered
+    errors, e.g. a read timeout.
+    """
+    attempts = retries + 1 if method.upper() in IDEMPOTENT_METHODS else 1
+    reached = False
+
+    for attempt in range(attempts):
+        try:
+            response = send()
+        except errors as e:
+            if attempt == attempts - 1 or _expired():
+                raise
+            reached = reached or isinstance(e, unanswered)
+        else:
+            last = attempt == attempts - 1 or _expired()
+            if last or response.status_code not in RETRY_STATUS_CODES:
+                return response, reached
+            close(response)
+            reached = True
+
+        count_retry()
+        time.sleep(RETRY_BACKOFF.delay(attempt))
+
+    raise AssertionError("unreachable")
+
+
+def _time_left() -> float | None:
+    """Returns the seconds left before the thread's deadline, if any."""
+    at = getattr(_deadline, "at", None)
+    return None if at is None else at - time.monotonic()
+
+
+def _expired() -> bool:
+    left = _time_left()
+    return left is not None and left <= 0
+
+
+def _capped(timeout: float | tuple | None) -> float | tuple | None:
+    """Caps a timeout, or the timeouts of a tuple, to the time left."""
+    left = _time_left()
+    if left is None:
+        return timeout
+
+    left = max(left, MIN_TIMEOUT)
+    if isinstance(timeout, tuple):
+        return tuple(_capped(t) for t in timeout)
+
+    return left if timeout is None else min(timeout, left)
+
+
+def _already_deleted(method: str, status: int) -> bool:
+    return method.upper() == "DELETE" and status == NOT_FOUND
+
+
+def _throttled(
+    limiter: AdaptiveRateLimiter,
+    send: Callable[[], _Response],
+    close: Callable[[_Response], None],
+) -> _Response:
+    """Sends a request with the limiter, retrying it while it is throttled.
+
+    The throttled responses are closed, except the last one, which is
+    returned once the retries are exhausted.
+    """
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        limiter.acquire()
+        response = send()
+        if response.status_code != TOO_MANY_REQUESTS:
+            limiter.succeeded()
+            return response
+
+        limiter.throttled(retry_after(response.headers))
+        if attempt < MAX_THROTTLE_RETRIES:
+            count_retry()
+            close(response)
+
+    return response
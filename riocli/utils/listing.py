@@ -0,0 +1,281 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Streaming output for the list commands.
+
+The table output needs every item before printing, since tabulate sizes
+the columns from the whole data. The stream and jsonl outputs print the
+items of every page as soon as it arrives instead, while the next page is
+fetched in the background, so the first rows show up at the same time
+whatever the size of the project. The jsonl (or ndjson) output prints
+one record per line as well, while the json and yaml outputs print all the
+records at once.
+
+Without --output, the list commands use the global --output option given
+before the command, e.g. rio --output ndjson device list. The commands
+that only print a table use print_list, which prints a record per row
+keyed by the column headers for the structured outputs.
+
+    @list_output_options
+    def list_things(output: str, limit: int | None):
+        items = iter_items(walk_pages(client.list_things), limit=limit)
+        if output == OUTPUT_TABLE:
+            _display_things(list(items))
+        else:
+            stream_items(items, output, COLUMNS, _thing_row)
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import click
+
+from riocli.utils import tabulate_data
+from riocli.utils.context import get_output_format
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+T = TypeVar("T")
+
+OUTPUT_TABLE = "table"
+OUTPUT_STREAM = "stream"
+OUTPUT_JSONL = "jsonl"
+OUTPUT_NDJSON = "ndjson"
+OUTPUT_JSON = "json"
+OUTPUT_YAML = "yaml"
+LIST_OUTPUTS = (
+    OUTPUT_TABLE,
+    OUTPUT_STREAM,
+    OUTPUT_JSONL,
+    OUTPUT_NDJSON,
+    OUTPUT_JSON,
+    OUTPUT_YAML,
+)
+# The choices of the global --output option.
+GLOBAL_OUTPUTS = (OUTPUT_NDJSON, OUTPUT_JSON, OUTPUT_YAML, OUTPUT_TABLE)
+RECORD_OUTPUTS = frozenset({OUTPUT_JSONL, OUTPUT_NDJSON, OUTPUT_JSON, OUTPUT_YAML})
+
+_END = object()
+
+# The gap between the columns of a streamed table.
+COLUMN_GAP = "  "
+
+
+def list_output_options(f: Callable) -> Callable:
+    """Adds the --output and --limit options of the list commands."""
+    f = click.option(
+        "--limit",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Print at most this many items",
+    )(f)
+    f = click.option(
+        "--output",
+        "output",
+        type=click.Choice(LIST_OUTPUTS),
+        default=None,
+        callback=lambda ctx, param, value: resolve_output(value),
+        help="Print a table sized to the items, or print every page as it "
+        "arrives as a table with fixed columns (stream) or as JSON lines, "
+        "or print all the items as JSON or YAML. Defaults to the global "
+        "--output, or table",
+    )(f)
+    return f
+
+
+def resolve_output(output: str | None) -> str:
+    """Returns the output of a list command, falling back to the global one."""
+    output = output or get_output_format() or OUTPUT_TABLE
+    return OUTPUT_JSONL if output == OUTPUT_NDJSON else output
+
+
+def prefetch(pages: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """Iterates over the pages, fetching the next ones in the background.
+
+    At most `depth` pages are fetched ahead of the one being consumed.
+    Errors are raised when the page that failed would have been consumed.
+    Fetching stops when the iteration is stopped early.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def fetch() -> None:
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except Exception as e:
+            put((None, e))
+            return
+
+        put((_END, None))
+
+    threading.Thread(target=fetch, daemon=True, name="prefetch").start()
+
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is _END:
+                return
+            yield page
+    finally:
+        stopped.set()
+
+
+def iter_items(
+    pages: Iterable[Iterable[T]],
+    limit: int | None = None,
+) -> Iterator[T]:
+    """Yields the items of prefetched pages, stopping after `limit` items."""
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    for page in prefetch(pages):
+        for item in page:
+            yield item
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+class StreamingTable:
+    """Prints rows as they come, in columns of fixed widths.
+
+    Longer values are truncated with "..". The last column is never
+    truncated, so it can hold free text.
+    """
+
+    def __init__(self, columns: Sequence[tuple[str, int]], show_header: bool = True):
+        self.headers = [h for h, _ in columns]
+        self.widths = [w for _, w in columns]
+        self.show_header = show_header
+        self._header_printed = False
+
+    def print_row(self, row: Sequence[Any]) -> None:
+        if self.show_header and not self._header_printed:
+            self._header_printed = True
+            header = self._format(self.headers)
+            click.echo(click.style(header, fg="yellow"))
+            rule = [
+                "-" * (w or len(h))
+                for h, w in zip(self.headers, self.widths, strict=True)
+            ]
+            click.echo(self._format(rule))
+
+        click.echo(self._format(row))
+
+    def _format(self, row: Sequence[Any]) -> str:
+        cells = []
+        last = len(self.widths) - 1
+        for i, (value, width) in enumerate(zip(row, self.widths, strict=True)):
+            text = "" if value is None else str(value)
+            plain = click.unstyle(text)
+            if i == last:
+                cells.append(text)
+                continue
+
+            if len(plain) > width:
+                text = plain = plain[: max(width - 2, 0)] + ".."
+
+            cells.append(text + " " * (width - len(plain)))
+
+        return COLUMN_GAP.join(cells)
+
+
+def stream_items(
+    items: Iterable[T],
+    output: str,
+    columns: Sequence[tuple[str, int]],
+    row: Callable[[T], Sequence[Any]],
+    show_header: bool = True,
+) -> None:
+    """Prints the items as they come, as a streamed table or as records."""
+    if output in RECORD_OUTPUTS:
+        print_records(map(to_record, items), output)
+        return
+
+    table = StreamingTable(columns, show_header=show_header)
+    for item in items:
+        table.print_row(row(item))
+
+
+def print_records(records: Iterable[Any], output: str) -> None:
+    """Prints plain data records as JSON lines, a JSON list or a YAML list.
+
+    JSON lines are printed one at a time as the records come.
+    """
+    if output in (OUTPUT_JSONL, OUTPUT_NDJSON):
+        for record in records:
+            click.echo(json.dumps(record, default=str))
+    elif output == OUTPUT_JSON:
+        click.echo(json.dumps(list(records), indent=4, default=str))
+    elif output == OUTPUT_YAML:
+        from riocli.utils import yaml_backend as yaml
+
+        click.echo(yaml.dump(list(records), allow_unicode=True), nl=False)
+    else:
+        raise ValueError(f"invalid output: {output}")
+
+
+def print_list(
+    data: Sequence[Sequence[Any]],
+    headers: Sequence[str] | None = None,
+) -> None:
+    """Prints the rows of a list command as a table or as records.
+
+    With the global --output set to ndjson, json or yaml, every row is
+    printed as a record keyed by the column headers, without styling.
+    Otherwise the rows are printed with tabulate_data.
+    """
+    output = get_output_format()
+    if output not in RECORD_OUTPUTS:
+        tabulate_data(data, headers)
+        return
+
+    keys = [click.unstyle(str(h)) for h in headers or ()]
+    print_records((_row_record(keys, row) for row in data), output)
+
+
+def _row_record(keys: Sequence[str], row: Sequence[Any]) -> dict[str, Any] | list:
+    values = [click.unstyle(v) if isinstance(v, str) else v for v in row]
+    if not keys:
+        return values
+
+    return dict(zip(keys, values, strict=False))
+
+
+def to_record(obj: Any) -> Any:
+    """Converts an SDK object to plain data for printing."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json", exclude_none=True, by_alias=True)
+
+    return obj
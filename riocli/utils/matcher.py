@@ -0,0 +1,44 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import re
+
+# Names that match nothing but themselves as a regex.
+LITERAL_NAME = re.compile(r"[\w-]+")
+
+
+class NameMatcher:
+    """Selects resources by a name, a GUID or a regex pattern.
+
+    A resource matches when its name or GUID equals the argument, or when
+    the pattern matches its whole name. The pattern is compiled once and
+    only used when the argument is not a literal name, so matching a
+    literal name is a string comparison.
+    """
+
+    def __init__(self, name_or_regex: str):
+        self.value = name_or_regex
+        self.literal = LITERAL_NAME.fullmatch(name_or_regex) is not None
+        self.pattern = None if self.literal else re.compile(rf"^{name_or_regex}$")
+
+    def matches(self, name: str, guid: str | None = None) -> bool:
+        if name == self.value or guid == self.value:
+            return True
+
+        return (
+            self.pattern is not None
+            and self.value not in name
+            and self.pattern.search(name) is not None
+        )
@@ -0,0 +1,253 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING
+
+import click
+from click import get_app_dir
+
+from riocli.config.config import Configuration
+from riocli.utils.context import get_root_context
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# The seconds a resolved name is trusted, unless set with the
+# RIO_NAME_CACHE_TTL environment variable. Zero disables the cache.
+DEFAULT_TTL = 300
+TTL_ENV = "RIO_NAME_CACHE_TTL"
+
+DEVICE = "device"
+FILE_UPLOAD = "fileupload"
+
+logger = logging.getLogger(__name__)
+
+
+class NameCache:
+    """Remembers the GUIDs of resources by name across invocations.
+
+    Resolving a name usually means listing the whole collection, which is
+    slow for projects with thousands of devices. The cache is a file per
+    project under the config directory, holding the GUID of every name
+    along with the time it was seen, for example:
+
+        {"device": {"amr-1": {"guid": "7d1d...", "at": 1735689600.0}}}
+
+    Entries older than the TTL are ignored. Commands that create, delete
+    or move resources invalidate their kinds with invalidates_names, and
+    callers that find a GUID stale forget it. A missing or corrupt file is
+    treated as an empty cache.
+    """
+
+    DIR_NAME = "name-cache"
+
+    def __init__(
+        self,
+        organization_guid: str,
+        project_guid: str,
+        ttl: float = DEFAULT_TTL,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path or (
+            Path(get_app_dir(Configuration.APP_NAME))
+            / self.DIR_NAME
+            / organization_guid
+            / f"{project_guid}.json"
+        )
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def get(self, kind: str, name: str) -> str | None:
+        """Returns the GUID of a name if it was seen within the TTL."""
+        entry = self._data.get(kind, {}).get(name)
+        if entry is None or self._clock() - entry["at"] >= self.ttl:
+            return None
+
+        return entry["guid"]
+
+    def set(self, kind: str, name: str, guid: str) -> None:
+        self.update(kind, [(name, guid)])
+
+    def update(self, kind: str, names: Iterable[tuple[str, str]]) -> None:
+        """Records (name, GUID) pairs, typically from a listing.
+
+        Names that appear more than once are ambiguous and are not cached.
+        """
+        names = list(names)
+        counts = Counter(name for name, _ in names)
+        now = self._clock()
+
+        with self._lock:
+            entries = self._data.setdefault(kind, {})
+            for name, guid in names:
+                if counts[name] > 1:
+                    entries.pop(name, None)
+                else:
+                    entries[name] = {"guid": guid, "at": now}
+
+            self._save()
+
+    def forget(self, kind: str, name: str) -> None:
+        with self._lock:
+            if self._data.get(kind, {}).pop(name, None) is not None:
+                self._save()
+
+    def invalidate(self, *kinds: str) -> None:
+        """Drops all the names of the kinds, or of every kind if none."""
+        with self._lock:
+            for kind in kinds or list(self._data):
+                self._data.pop(kind, None)
+
+            self._save()
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=".name-cache-", delete=False
+            ) as f:
+                json.dump(self._data, f)
+
+            os.replace(f.name, self.path)
+        except OSError as e:
+            logger.debug("Failed to save the name cache: %s", e)
+
+    def _load(self) -> dict[str, dict[str, dict]]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+
+        return data
+
+
+_caches: dict[tuple[str, str], NameCache] = {}
+_caches_lock = threading.Lock()
+_ttl: float | None = None
+
+
+def get_name_cache() -> NameCache | None:
+    """Returns the name cache of the current project.
+
+    The project is the one of the configuration loaded by the running
+    command. RIO_NAME_CACHE_TTL is read once. Returns None if the cache is
+    disabled with RIO_NAME_CACHE_TTL=0 or no project is selected.
+    """
+    global _ttl
+
+    with _caches_lock:
+        if _ttl is None:
+            _ttl = _ttl_from_env()
+        ttl = _ttl
+
+    if ttl <= 0:
+        return None
+
+    config = _current_config()
+    if config is None:
+        return None
+
+    organization = config.data.get("organization_id")
+    project = config.data.get("project_id")
+    if not organization or not project:
+        return None
+
+    with _caches_lock:
+        key = (organization, project)
+        if key not in _caches:
+            _caches[key] = NameCache(organization, project, ttl=ttl)
+
+        return _caches[key]
+
+
+def _current_config() -> Configuration | None:
+    ctx = click.get_current_context(silent=True)
+    config = get_root_context(ctx).obj if ctx is not None else None
+    if isinstance(config, Configuration):
+        return config
+
+    return _load_config()
+
+
+@functools.cache
+def _load_config() -> Configuration | None:
+    """Loads the configuration once, for callers outside of a command."""
+    try:
+        return Configuration()
+    except (OSError, ValueError) as e:
+        logger.debug("Not caching names without a readable config: %s", e)
+        return None
+
+
+def _ttl_from_env() -> float:
+    value = os.environ.get(TTL_ENV, "").strip()
+    if not value:
+        return DEFAULT_TTL
+
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = math.nan
+
+    if math.isnan(ttl):
+        click.secho(
+            f"Ignoring {TTL_ENV}={value!r}: expected the seconds names are "
+            f"cached for, e.g. {DEFAULT_TTL}, or 0 to disable the cache.",
+            fg="yellow",
+            err=True,
+        )
+        return DEFAULT_TTL
+
+    return ttl
+
+
+def invalidates_names(*kinds: str) -> Callable:
+    """Invalidates the cached names of the kinds after a command runs.
+
+    Decorate the commands that create, delete or move resources, so that
+    the following commands do not resolve names to stale GUIDs. Without
+    kinds, every kind is invalidated.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        @functools.wraps(f)
+        def decorated(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+            finally:
+                cache = get_name_cache()
+                if cache is not None:
+                    cache.invalidate(*kinds)
+
+        return decorated
+
+    return decorator
@@ -0,0 +1,125 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import random
+import time
+from typing import TYPE_CHECKING
+
+from riocli.utils.trace import record_sleep
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class Backoff:
+    """Computes exponentially growing delays with a random jitter.
+
+    The delay starts at `initial` and is multiplied by `factor` after
+    every attempt until it reaches `maximum`. Each delay is then spread by
+    up to +/- `jitter` (a fraction of the delay) so that many clients that
+    started together do not keep polling in lockstep.
+    """
+
+    def __init__(
+        self,
+        maximum: float,
+        initial: float = 0.5,
+        factor: float = 2.0,
+        jitter: float = 0.1,
+    ):
+        self.maximum = maximum
+        self.initial = min(initial, maximum)
+        self.factor = factor
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """Returns the delay to wait after the given (0-based) attempt."""
+        delay = min(self.initial * self.factor ** max(attempt, 0), self.maximum)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class Poller:
+    """Paces a polling loop with exponential backoff until a deadline.
+
+    Iterating over the poller yields the attempt number and sleeps between
+    the attempts. The first attempt is made right away unless fast_first is
+    disabled, and the last one is made when the deadline is reached, after
+    which the iteration stops:
+
+        for _ in Poller(timeout=300, interval=6):
+            if is_ready():
+                return
+        raise RetriesExhausted(...)
+
+    The delay between the attempts starts small to notice quick transitions
+    and grows up to `interval` to keep the load bounded for slow ones. The
+    total time slept is kept in `slept` and reported to the tracer.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        interval: float,
+        initial: float = 0.5,
+        factor: float = 2.0,
+        jitter: float = 0.1,
+        fast_first: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.timeout = timeout
+        self.backoff = Backoff(interval, initial=initial, factor=factor, jitter=jitter)
+        self.fast_first = fast_first
+        self.attempts = 0
+        self.slept = 0.0
+        self._sleep = sleep
+        self._clock = clock
+        self._deadline: float | None = None
+
+    @classmethod
+    def from_retries(cls, retry_count: int, retry_interval: float, **kwargs) -> Poller:
+        """Creates a poller with the deadline of a retry count and interval."""
+        return cls(
+            timeout=retry_count * retry_interval, interval=retry_interval, **kwargs
+        )
+
+    def remaining(self) -> float:
+        """Returns the seconds left until the deadline."""
+        if self._deadline is None:
+            return self.timeout
+
+        return max(self._deadline - self._clock(), 0)
+
+    def __iter__(self) -> Iterator[int]:
+        self._deadline = self._clock() + self.timeout
+        self.attempts = 0
+
+        if not self.fast_first:
+            self._wait(self.backoff.delay(0))
+
+        while True:
+            yield self.attempts
+            self.attempts += 1
+
+            if self.remaining() <= 0:
+                return
+
+            self._wait(self.backoff.delay(self.attempts - 1))
+
+    def _wait(self, delay: float) -> None:
+        delay = min(delay, self.remaining())
+        self._sleep(delay)
+        self.slept += delay
+        record_sleep(delay)
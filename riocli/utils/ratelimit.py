@@ -0,0 +1,204 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# The requests per second allowed by the process-wide limiter. Unless it
+# is set, the requests are only slowed down once the server throttles
+# them. Zero disables the limiter.
+RATE_LIMIT_ENV = "RIO_RATE_LIMIT"
+
+
+class RateLimiter:
+    """A thread-safe token bucket.
+
+    The bucket holds up to `burst` tokens and is refilled with `rate`
+    tokens per second. Every acquire takes a token, waiting for one if the
+    bucket is empty. Waiters reserve their token before sleeping, so they
+    are served in the order they arrived.
+
+        limiter = RateLimiter(rate=10)
+        for item in items:
+            limiter.acquire()
+            ...
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """Takes a token and returns the seconds spent waiting for it."""
+        with self._lock:
+            wait = self._reserve()
+
+        if wait > 0:
+            self._sleep(wait)
+
+        return wait
+
+    def _reserve(self) -> float:
+        self._refill()
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+        self._updated = now
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """A token bucket that slows down when the server throttles.
+
+    When a request is throttled, the rate is halved down to `min_rate` and
+    nobody gets a token until the Retry-After delay has passed. Every
+    successful request raises the rate again by a small step, up to the
+    initial rate. This keeps the request rate just below what the server
+    accepts, however many threads are making requests.
+
+    Without a rate, the requests are not limited until one is throttled.
+    The limiter then starts from half the rate at which the requests were
+    being sent, and stops limiting once it has recovered that rate.
+    """
+
+    # The fraction of the maximum rate regained on every success.
+    INCREASE = 0.05
+    # The number of recent requests the rate is measured over.
+    WINDOW = 32
+
+    def __init__(self, rate: float | None = None, min_rate: float = 1.0, **kwargs):
+        super().__init__(rate or min_rate, **kwargs)
+        self.unlimited = rate is None
+        self.rate: float | None = rate
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate) if rate else min_rate
+        self._sent: deque[float] = deque(maxlen=self.WINDOW)
+
+    def _reserve(self) -> float:
+        if self.rate is None:
+            self._sent.append(self._clock())
+            return 0
+
+        return super()._reserve()
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """Records a throttled request, optionally with its Retry-After."""
+        with self._lock:
+            if self.rate is None:
+                self.max_rate = self._sending_rate()
+                self.rate = self.max_rate
+                self._tokens = 0
+                self._updated = self._clock()
+
+            self._refill()
+            self.rate = max(self.rate / 2, self.min_rate)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            # Put the bucket in debt so that the next token is available
+            # only after the pause.
+            self._tokens = min(self._tokens, 0) - pause * self.rate
+
+    def succeeded(self) -> None:
+        """Records a request that was not throttled."""
+        if self.rate is None or self.rate >= self.max_rate:
+            return
+
+        with self._lock:
+            self._refill()
+            self.rate = min(self.rate + self.max_rate * self.INCREASE, self.max_rate)
+            if self.unlimited and self.rate >= self.max_rate:
+                self.rate = None
+                self._sent.clear()
+
+    def _sending_rate(self) -> float:
+        """Returns the recent requests per second, at least min_rate."""
+        if len(self._sent) < 2:
+            return self.min_rate
+
+        elapsed = self._sent[-1] - self._sent[0]
+        if elapsed <= 0:
+            return max(float(len(self._sent)), self.min_rate)
+
+        return max((len(self._sent) - 1) / elapsed, self.min_rate)
+
+
+_limiter: AdaptiveRateLimiter | None = None
+_configured = False
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter | None:
+    """Returns the limiter shared by all the API calls of the process.
+
+    RIO_RATE_LIMIT sets the maximum requests per second, and is read once.
+    Returns None if rate limiting is disabled with RIO_RATE_LIMIT=0.
+    """
+    global _limiter, _configured
+
+    with _limiter_lock:
+        if not _configured:
+            _configured = True
+            rate = _rate_from_env()
+            if rate is None or rate > 0:
+                burst = max(int(rate), 1) if rate else 1
+                _limiter = AdaptiveRateLimiter(rate, burst=burst)
+
+        return _limiter
+
+
+def _rate_from_env() -> float | None:
+    value = os.environ.get(RATE_LIMIT_ENV, "").strip()
+    if not value:
+        return None
+
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = math.nan
+
+    if not math.isfinite(rate):
+        click.secho(
+            f"Ignoring {RATE_LIMIT_ENV}={value!r}: expected the requests per "
+            "second, e.g. 20, or 0 to disable rate limiting.",
+            fg="yellow",
+            err=True,
+        )
+        return None
+
+    return rate
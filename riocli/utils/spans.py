@@ -0,0 +1,301 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Hierarchical spans of a run, exported for trace viewers.
+
+The spans are recorded in memory and exported when the run is over:
+
+* RIO_TRACE_SPANS=apply.json writes them as a Chrome trace-event file,
+  which opens in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+* RIO_TRACE_OTLP=1 sends them to an OpenTelemetry collector with OTLP
+  over HTTP, as JSON. The collector is at OTEL_EXPORTER_OTLP_ENDPOINT, or
+  http://localhost:4318 when it is not set.
+
+    recorder = SpanRecorder("rio apply")
+    with recorder.span("load"):
+        with recorder.span("render", files=3):
+            ...
+    recorder.export()
+
+Spans nest within the spans open on the same thread, or under an explicit
+parent for work handed to other threads. Waits that are only known after
+the fact are added with add, and shown on tracks of their own.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+SPANS_ENV = "RIO_TRACE_SPANS"
+OTLP_ENV = "RIO_TRACE_OTLP"
+OTLP_ENDPOINT_ENV = "OTEL_EXPORTER_OTLP_ENDPOINT"
+DEFAULT_OTLP_ENDPOINT = "http://localhost:4318"
+
+OTLP_TIMEOUT = 10
+SERVICE_NAME = "rio"
+
+
+@dataclass
+class Span:
+    """A named interval of the run, with times from time.monotonic."""
+
+    name: str
+    span_id: str
+    parent_id: str | None
+    start: float
+    end: float | None = None
+    thread: str = ""
+    # Spans that are not nested in a thread's stack, e.g. waits.
+    detached: bool = False
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class SpanRecorder:
+    """Records the spans of a run under a root span.
+
+    The recorder is thread-safe. Its clock is time.monotonic, the same as
+    the Scheduler's, so that times measured elsewhere can be added.
+    """
+
+    def __init__(self, name: str, clock: Callable[[], float] = time.monotonic):
+        self.trace_id = os.urandom(16).hex()
+        self.spans: list[Span] = []
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        start = clock()
+        # Maps the monotonic clock to the wall clock for OTLP.
+        self._epoch = time.time() - start
+        self.root = self._new(name, parent_id=None, start=start)
+
+    @contextmanager
+    def span(
+        self, name: str, parent: Span | None = None, **attributes: Any
+    ) -> Iterator[Span]:
+        """Records the span of a block, nested in the current span."""
+        stack = self._stack()
+        parent = parent or (stack[-1] if stack else self.root)
+        span = self._new(name, parent.span_id, self._clock(), attributes)
+
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = str(e) or type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            span.end = self._clock()
+
+    def add(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        parent: Span | None = None,
+        **attributes: Any,
+    ) -> Span:
+        """Adds a span measured elsewhere, shown on a track of its own."""
+        span = self._new(name, (parent or self.root).span_id, start, attributes)
+        span.end = end
+        span.detached = True
+        return span
+
+    def wrap(
+        self, func: Callable[[str], None], parent: Span, prefix: str
+    ) -> Callable[[str], None]:
+        """Wraps an operation on a key to record a span for every call."""
+
+        def traced(key: str) -> None:
+            with self.span(f"{prefix} {key}", parent=parent, key=key):
+                func(key)
+
+        return traced
+
+    def finish(self) -> None:
+        if self.root.end is None:
+            self.root.end = self._clock()
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Returns the spans in the Chrome trace-event format."""
+        self.finish()
+        origin = self.root.start
+        threads: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+
+        for span in self._snapshot():
+            end = span.end if span.end is not None else self._clock()
+            ts = (span.start - origin) * 1e6
+            args = {**span.attributes}
+            if span.error is not None:
+                args["error"] = span.error
+
+            if span.detached:
+                common = {"name": span.name, "cat": "wait", "id": span.span_id}
+                events.append({**common, "ph": "b", "ts": ts, "pid": 1, "args": args})
+                events.append({**common, "ph": "e", "ts": (end - origin) * 1e6, "pid": 1})
+                continue
+
+            tid = threads.setdefault(span.thread, len(threads) + 1)
+            events.append(
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": ts,
+                    "dur": (end - span.start) * 1e6,
+                    "pid": 1,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+
+        for name, tid in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def otlp_payload(self) -> dict[str, Any]:
+        """Returns the spans as an OTLP/JSON export request."""
+        self.finish()
+        spans = []
+        for span in self._snapshot():
+            end = span.end if span.end is not None else self._clock()
+            otlp = {
+                "traceId": self.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                # SPAN_KIND_INTERNAL
+                "kind": 1,
+                "startTimeUnixNano": str(int((span.start + self._epoch) * 1e9)),
+                "endTimeUnixNano": str(int((end + self._epoch) * 1e9)),
+                "attributes": [
+                    {"key": k, "value": _otlp_value(v)}
+                    for k, v in {"thread": span.thread, **span.attributes}.items()
+                ],
+            }
+            if span.parent_id is not None:
+                otlp["parentSpanId"] = span.parent_id
+            if span.error is not None:
+                # STATUS_CODE_ERROR
+                otlp["status"] = {"code": 2, "message": span.error}
+
+            spans.append(otlp)
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": _otlp_value(SERVICE_NAME)}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": "riocli"}, "spans": spans}],
+                }
+            ]
+        }
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def export_otlp(self, endpoint: str) -> None:
+        """Sends the spans to an OTLP/HTTP collector, e.g. on port 4318."""
+        from riocli.utils.http import get_session
+
+        response = get_session().post(
+            f"{endpoint.rstrip('/')}/v1/traces",
+            json=self.otlp_payload(),
+            timeout=OTLP_TIMEOUT,
+        )
+        response.raise_for_status()
+
+    def export(self) -> None:
+        """Exports the spans to the destinations set in the environment.
+
+        Export errors are reported but never fail the run.
+        """
+        import click
+
+        path = os.environ.get(SPANS_ENV)
+        otlp = os.environ.get(OTLP_ENV, "").lower() in ("1", "true", "yes", "on")
+
+        try:
+            if path:
+                self.write_chrome_trace(path)
+            if otlp:
+                self.export_otlp(
+                    os.environ.get(OTLP_ENDPOINT_ENV) or DEFAULT_OTLP_ENDPOINT
+                )
+        except Exception as e:
+            click.secho(f"Failed to export the trace: {e}", fg="yellow", err=True)
+
+    def _new(
+        self,
+        name: str,
+        parent_id: str | None,
+        start: float,
+        attributes: dict[str, Any] | None = None,
+    ) -> Span:
+        span = Span(
+            name=name,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            start=start,
+            thread=threading.current_thread().name,
+            attributes=attributes or {},
+        )
+        with self._lock:
+            self.spans.append(span)
+
+        return span
+
+    def _snapshot(self) -> list[Span]:
+        with self._lock:
+            return list(self.spans)
+
+    def _stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+
+    return {"stringValue": str(value)}
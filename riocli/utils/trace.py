@@ -0,0 +1,335 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tracing of the API calls, to see where the time of a command goes.
+
+Tracing is enabled with ``rio --trace`` or the RIO_TRACE environment
+variable. Every request made through riocli.utils.http is recorded with
+its method, endpoint, status, size, latency and number of retries, along
+with the time the pollers sleep. RIO_TRACE=1 only enables the summary and
+RIO_TRACE=0 leaves tracing disabled. When RIO_TRACE is a file name, the
+records are written to it as JSON lines as they come. A summary per
+endpoint is printed to stderr when the command exits.
+
+    with trace_request("GET", url) as call:
+        response = send()
+        if call is not None:
+            call.set_response(response.status_code, response.headers)
+
+The endpoints group the URLs of the same API, e.g. every deployment's
+/v2/deployments/{name}/ together, by replacing the GUIDs, numbers and, in
+the v2 API, the resource names in their paths.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import click
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+TRACE_ENV = "RIO_TRACE"
+
+# The values of RIO_TRACE that enable the summary without a trace file,
+# and the ones that leave tracing disabled.
+_FLAG_VALUES = frozenset({"1", "true", "yes", "on"})
+_OFF_VALUES = frozenset({"", "0", "false", "no", "off"})
+
+# The static segments of the v2 API's paths. The other segments are names.
+V2_SEGMENTS = frozenset(
+    {
+        "bindings",
+        "cancel",
+        "clients",
+        "configtrees",
+        "daemons",
+        "deployments",
+        "devices",
+        "disks",
+        "download",
+        "fileuploads",
+        "graph",
+        "history",
+        "keys",
+        "logs",
+        "managedservices",
+        "networks",
+        "oauth2",
+        "organizations",
+        "owner",
+        "packages",
+        "projects",
+        "revisions",
+        "role-bindings",
+        "roles",
+        "secrets",
+        "serviceaccounts",
+        "sharedurls",
+        "staticroutes",
+        "tokens",
+        "uris",
+        "usergroups",
+        "users",
+        "v2",
+    }
+)
+
+# UUIDs, rapyuta.io GUIDs like "dep-cn6aq5a8sh9hhs3u64j0" and numbers.
+_ID = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    r"|[a-z]+-[a-z0-9]{20}"
+    r"|\d+",
+    re.IGNORECASE,
+)
+
+PERCENTILES = (50, 95, 99)
+
+
+class RequestTrace:
+    """An API call being traced."""
+
+    def __init__(self, method: str, url: str):
+        self.method = method.upper()
+        self.url = url
+        self.status: int | None = None
+        self.size: int | None = None
+        self.retries = 0
+        self.error: str | None = None
+
+    def set_response(self, status: int, headers: Mapping[str, str]) -> None:
+        self.status = status
+        length = headers.get("Content-Length")
+        if length is not None and length.isdigit():
+            self.size = int(length)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or (self.status or 0) >= 400
+
+
+class Tracer:
+    """Collects the traced calls and sleeps, and summarizes them."""
+
+    def __init__(self, output: IO[str] | None = None):
+        self.output = output
+        self.latencies: dict[tuple[str, str], list[float]] = defaultdict(list)
+        self.retries: dict[tuple[str, str], int] = defaultdict(int)
+        self.errors: dict[tuple[str, str], int] = defaultdict(int)
+        self.sizes: dict[tuple[str, str], int] = defaultdict(int)
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, call: RequestTrace, started: float, latency: float) -> None:
+        key = (call.method, endpoint(call.url))
+        with self._lock:
+            self.latencies[key].append(latency)
+            self.retries[key] += call.retries
+            self.errors[key] += call.failed
+            self.sizes[key] += call.size or 0
+            self._write(
+                {
+                    "type": "request",
+                    "time": started,
+                    "method": call.method,
+                    "endpoint": key[1],
+                    "url": call.url,
+                    "status": call.status,
+                    "bytes": call.size,
+                    "latency_ms": round(latency * 1000, 3),
+                    "retries": call.retries,
+                    "error": call.error,
+                }
+            )
+
+    def record_sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.slept += seconds
+            self._write({"type": "sleep", "time": time.time(), "seconds": seconds})
+
+    def summary(self) -> list[list[Any]]:
+        """Returns a row per endpoint, the most time consuming first.
+
+        A row holds the method, endpoint, calls, errors, retries, bytes,
+        the latency percentiles in milliseconds and the total seconds.
+        """
+        rows = []
+        with self._lock:
+            for key, latencies in self.latencies.items():
+                ordered = sorted(latencies)
+                rows.append(
+                    [
+                        *key,
+                        len(ordered),
+                        self.errors[key],
+                        self.retries[key],
+                        self.sizes[key],
+                        *(percentile(ordered, p) * 1000 for p in PERCENTILES),
+                        sum(ordered),
+                    ]
+                )
+
+        return sorted(rows, key=lambda r: r[-1], reverse=True)
+
+    def print_summary(self) -> None:
+        from tabulate import tabulate
+
+        rows = self.summary()
+        if not rows and not self.slept:
+            return
+
+        headers = ["Method", "Endpoint", "Calls", "Errors", "Retries", "Bytes"]
+        headers += [f"p{p} (ms)" for p in PERCENTILES] + ["Total (s)"]
+        data = [[*r[:6], *(f"{v:.0f}" for v in r[6:-1]), f"{r[-1]:.2f}"] for r in rows]
+
+        click.echo(err=True)
+        click.echo(tabulate(data, headers=headers), err=True)
+        click.secho(
+            f"\n{sum(r[2] for r in rows)} calls in {sum(r[-1] for r in rows):.2f}s, "
+            f"{sum(r[4] for r in rows)} retries, "
+            f"{self.slept:.2f}s sleeping in pollers",
+            fg="yellow",
+            err=True,
+        )
+
+    def close(self) -> None:
+        if self.output is not None:
+            self.output.close()
+            self.output = None
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self.output is not None:
+            self.output.write(json.dumps(record) + "\n")
+            self.output.flush()
+
+
+_tracer: Tracer | None = None
+_local = threading.local()
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def enable_tracing(path: str | None = None, summary: bool = True) -> Tracer:
+    """Starts tracing the API calls, writing them to the file if given.
+
+    The summary is printed and the file closed when the process exits.
+    Enabling it again returns the running tracer.
+    """
+    global _tracer
+
+    if _tracer is not None:
+        return _tracer
+
+    output = open(path, "a") if path else None  # noqa: SIM115
+    _tracer = Tracer(output)
+
+    if summary:
+        atexit.register(_tracer.print_summary)
+    atexit.register(_tracer.close)
+
+    return _tracer
+
+
+def enable_tracing_from_env(flag: bool = False) -> Tracer | None:
+    """Enables tracing if the flag is set or RIO_TRACE enables it.
+
+    RIO_TRACE is a file name for the records, unless it is one of the flag
+    values, such as 1 or 0.
+    """
+    value = os.environ.get(TRACE_ENV, "").strip()
+    disabled = value.lower() in _OFF_VALUES
+    if not flag and disabled:
+        return None
+
+    path = None if disabled or value.lower() in _FLAG_VALUES else value
+    return enable_tracing(path)
+
+
+@contextmanager
+def trace_request(method: str, url: str) -> Iterator[RequestTrace | None]:
+    """Traces an API call, if tracing is enabled.
+
+    Yields None when tracing is disabled. The retries made during the call
+    by the same thread are counted with count_retry.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+
+    call = RequestTrace(method, str(url))
+    outer = getattr(_local, "call", None)
+    _local.call = call
+    started, start = time.time(), time.perf_counter()
+    try:
+        yield call
+    except BaseException as e:
+        call.error = type(e).__name__
+        raise
+    finally:
+        _local.call = outer
+        tracer.record(call, started, time.perf_counter() - start)
+
+
+def count_retry(count: int = 1) -> None:
+    """Counts retries of the call traced by the current thread."""
+    call = getattr(_local, "call", None)
+    if call is not None:
+        call.retries += count
+
+
+def record_sleep(seconds: float) -> None:
+    """Records the time a poller slept, if tracing is enabled."""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.record_sleep(seconds)
+
+
+def endpoint(url: str) -> str:
+    """Returns the path of the URL with its identifiers replaced."""
+    path = urlsplit(url).path
+    segments = path.split("/")
+    v2 = len(segments) > 1 and segments[1] == "v2"
+
+    for i, segment in enumerate(segments):
+        if not segment:
+            continue
+        if _ID.fullmatch(segment):
+            segments[i] = "{id}"
+        elif v2 and segment not in V2_SEGMENTS:
+            segments[i] = "{name}"
+
+    return "/".join(segments)
+
+
+def percentile(ordered: list[float], p: float) -> float:
+    """Returns the nearest-rank percentile of sorted values."""
+    if not ordered:
+        return 0.0
+
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
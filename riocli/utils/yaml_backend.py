@@ -0,0 +1,67 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The YAML loader and dumper used throughout the CLI.
+
+PyYAML ships a pure Python implementation and, when it is built against
+libyaml, a C implementation that is several times faster. The functions in
+this module mirror the yaml module's API and use the C classes whenever
+they are available, falling back to the Python classes otherwise:
+
+    from riocli.utils import yaml_backend as yaml
+
+    documents = list(yaml.safe_load_all(content))
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import yaml
+from yaml import YAMLError as YAMLError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+try:
+    from yaml import CDumper as Dumper
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+
+    LIBYAML = True
+except ImportError:
+    from yaml import Dumper, SafeDumper, SafeLoader
+
+    LIBYAML = False
+
+
+def safe_load(stream: Any) -> Any:
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_all(stream: Any) -> Iterator[Any]:
+    return yaml.load_all(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def safe_dump_all(documents: Iterable[Any], stream: Any = None, **kwargs: Any) -> Any:
+    return yaml.dump_all(documents, stream, Dumper=SafeDumper, **kwargs)
+
+
+def dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """Dumps arbitrary Python objects, like yaml.dump."""
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
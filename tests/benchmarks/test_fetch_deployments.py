@@ -0,0 +1,114 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for selecting deployments in a large project.
+
+The client replays a listing shaped like the v2 API's, one page of 50 at
+a time. The baseline lists every deployment and matches them in Python,
+as fetch_deployments used to. Run with ``pytest -s -m slow tests/benchmarks``
+to see the timings.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+
+import pytest
+from munch import munchify
+from rapyuta_io_sdk_v2.utils import walk_pages
+
+from riocli.deployment.list import DEFAULT_PHASES
+from riocli.deployment.util import fetch_deployments
+
+DEPLOYMENTS = 5000
+SITES = ("tokyo", "osaka", "berlin", "austin")
+
+
+class RecordedClient:
+    def __init__(self, listing: list[dict]):
+        self.listing = listing
+        self.items_sent = 0
+
+    def list_deployments(
+        self, cont=0, limit=50, names=None, guids=None, name=None, **kwargs
+    ):
+        items = [
+            d
+            for d in self.listing
+            if (names is None or d["metadata"]["name"] in names)
+            and (guids is None or d["metadata"]["guid"] in guids)
+            and (name is None or name in d["metadata"]["name"])
+        ]
+        page = items[cont : cont + limit]
+        self.items_sent += len(page)
+        # Every item is deserialized by the SDK.
+        return munchify({"items": page, "metadata": {"continue": cont + limit}})
+
+
+@pytest.fixture(scope="module")
+def listing():
+    return [
+        {
+            "metadata": {
+                "name": f"{SITES[i % len(SITES)]}-amr{i:04d}",
+                "guid": f"dep-{i:020d}",
+                "labels": {"site": SITES[i % len(SITES)], "fleet": str(i % 10)},
+                "createdAt": "2025-01-01T00:00:00Z",
+            },
+            "spec": {"runtime": "device", "device": {"depends": {"nameOrGUID": "x"}}},
+            "status": {"phase": "Succeeded", "status": "Running"},
+        }
+        for i in range(DEPLOYMENTS)
+    ]
+
+
+def _baseline(client, name_or_regex: str) -> list:
+    deployments = []
+    for page in walk_pages(client.list_deployments, phases=DEFAULT_PHASES):
+        deployments.extend(page)
+
+    return [
+        d
+        for d in deployments
+        if name_or_regex == d.metadata.name
+        or name_or_regex == d.metadata.guid
+        or (
+            name_or_regex not in d.metadata.name
+            and re.search(rf"^{name_or_regex}$", d.metadata.name)
+        )
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("selector", ["tokyo-amr0004", "osaka-amr00.*", "dep-.*"])
+def test_fetch_deployments(listing, selector):
+    baseline_client, client = RecordedClient(listing), RecordedClient(listing)
+
+    start = time.perf_counter()
+    expected = _baseline(baseline_client, selector)
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = fetch_deployments(client, selector, include_all=False)
+    filtered = time.perf_counter() - start
+
+    assert [d.metadata.guid for d in actual] == [d.metadata.guid for d in expected]
+    assert client.items_sent <= baseline_client.items_sent
+
+    print(
+        f"\n{selector}: {len(actual)} of {DEPLOYMENTS} deployments, "
+        f"listing everything {baseline:.3f}s ({baseline_client.items_sent} items), "
+        f"server-side filters {filtered:.3f}s ({client.items_sent} items)"
+    )
@@ -0,0 +1,91 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for loading a large set of manifests.
+
+Run with ``pytest -s -m slow tests/benchmarks`` to see the timings.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from riocli.apply.parse import Applier
+from riocli.exceptions import LoggedOut
+
+DOCUMENTS = 1500
+FILES = 4
+
+MANIFEST = """apiVersion: api.rapyuta.io/v2
+kind: Secret
+metadata:
+  name: secret-{i}-{{{{ rio.project.name }}}}
+  labels:
+    app: app-{i}
+    team: {{{{ team | default('robots') }}}}
+spec:
+  type: Docker
+  docker:
+    registry: https://index.docker.io/v1/
+    username: user-{i}
+    password: password
+    email: user@example.com
+"""
+
+
+class _Config:
+    data: dict = {}
+
+    @property
+    def project_guid(self):
+        raise LoggedOut
+
+
+@pytest.fixture
+def manifests(tmp_path, monkeypatch):
+    # Measure the rendering and parsing, not the template cache.
+    monkeypatch.setattr(Applier, "_get_template_cache", lambda self: None)
+
+    per_file = DOCUMENTS // FILES
+    files = []
+    for n in range(FILES):
+        path = tmp_path / f"manifests-{n}.yaml"
+        docs = (MANIFEST.format(i=n * per_file + i) for i in range(per_file))
+        path.write_text("---\n".join(docs))
+        files.append(str(path))
+
+    return files
+
+
+def _timed_load(files: list[str], workers: int) -> tuple[float, Applier]:
+    start = time.perf_counter()
+    applier = Applier(files, [], [], _Config(), load_workers=workers)  # pyright:ignore[reportArgumentType]
+    return time.perf_counter() - start, applier
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("workers", [2, 4])
+def test_parallel_load(manifests, workers):
+    sequential, expected = _timed_load(manifests, workers=1)
+    parallel, actual = _timed_load(manifests, workers=workers)
+
+    assert list(actual.objects) == list(expected.objects)
+    assert actual.manifests == expected.manifests
+
+    print(
+        f"\n{DOCUMENTS} documents: sequential {sequential:.2f}s, "
+        f"{workers} workers {parallel:.2f}s ({sequential / parallel:.1f}x)"
+    )
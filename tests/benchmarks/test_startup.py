@@ -0,0 +1,88 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the cold start of the CLI.
+
+Every command runs in a new interpreter a few times, and the median of
+its run time minus the interpreter's own startup time has to stay within
+its budget. Run with ``pytest -s -m slow tests/benchmarks`` to see the
+timings, and with ``rio debug startup`` to find the slow imports.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+RUNS = 5
+
+# The seconds each command may add to the interpreter's startup.
+BUDGETS = {
+    "rio version": (["-m", "riocli", "version"], 0.15),
+    "rio deployment list --help": (
+        ["-m", "riocli", "deployment", "list", "--help"],
+        1.5,
+    ),
+    "rio-ssh-ensure-cert": (["-m", "riocli.ssh_ensure_cert"], 0.15),
+}
+
+
+def _median_run_time(args: list[str], env: dict[str, str]) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+
+@pytest.fixture(scope="module")
+def env(tmp_path_factory):
+    # An empty config directory, so that no command reads the user's
+    # config or talks to the API.
+    home = tmp_path_factory.mktemp("home")
+    return {
+        "PATH": os.environ.get("PATH", ""),
+        "PYTHONPATH": os.environ.get("PYTHONPATH", ""),
+        "HOME": str(home),
+        "XDG_CONFIG_HOME": str(home / ".config"),
+    }
+
+
+@pytest.fixture(scope="module")
+def interpreter(env):
+    return _median_run_time(["-c", "pass"], env)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("command", list(BUDGETS))
+def test_cold_start(command, env, interpreter):
+    args, budget = BUDGETS[command]
+
+    overhead = _median_run_time(args, env) - interpreter
+
+    print(f"\n{command}: {overhead * 1000:.0f}ms (budget {budget * 1000:.0f}ms)")
+    assert overhead <= budget
@@ -0,0 +1,111 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks for the YAML backend against the pure Python PyYAML.
+
+Run with ``pytest -s -m slow tests/benchmarks`` to see the timings.
+"""
+
+from __future__ import annotations
+
+import time
+from base64 import b64encode
+
+import pytest
+import yaml
+
+from riocli.configtree.util import combine_metadata
+from riocli.utils import yaml_backend
+
+MANIFEST = """apiVersion: api.rapyuta.io/v2
+kind: Deployment
+metadata:
+  name: deployment-{i}
+  labels:
+    app: app-{i}
+spec:
+  runtime: cloud
+  depends:
+    - kind: package
+      nameOrGUID: package-{i}
+      version: v1.0.0
+  envArgs:
+    - name: VALUE_{i}
+      value: "{i}"
+  rosNetworks:
+    - depends:
+        kind: network
+        nameOrGUID: network
+"""
+
+
+def _report(name: str, baseline: float, backend: float) -> None:
+    print(
+        f"\n{name}: PyYAML {baseline:.2f}s, backend {backend:.2f}s "
+        f"({baseline / backend:.1f}x, libyaml={yaml_backend.LIBYAML})"
+    )
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.slow
+def test_load_large_manifests():
+    content = "---\n".join(MANIFEST.format(i=i) for i in range(1500))
+
+    baseline, expected = _timed(lambda: list(yaml.safe_load_all(content)))
+    backend, actual = _timed(lambda: list(yaml_backend.safe_load_all(content)))
+
+    assert actual == expected
+    _report("Load 1500 manifests", baseline, backend)
+
+
+@pytest.mark.slow
+def test_dump_large_manifests():
+    documents = list(
+        yaml_backend.safe_load_all(
+            "---\n".join(MANIFEST.format(i=i) for i in range(1500))
+        )
+    )
+
+    baseline, expected = _timed(
+        lambda: yaml.safe_dump_all(documents, allow_unicode=True, explicit_start=True)
+    )
+    backend, actual = _timed(
+        lambda: yaml_backend.safe_dump_all(
+            documents, allow_unicode=True, explicit_start=True
+        )
+    )
+
+    assert actual == expected
+    _report("Dump 1500 manifests", baseline, backend)
+
+
+@pytest.mark.slow
+def test_combine_config_tree_metadata(monkeypatch):
+    value = "{'retries': 3, 'hosts': ['a', 'b'], 'timeout': 1.5}"
+    keys = {
+        f"robot/{i}/params": {"data": b64encode(value.encode()).decode()}
+        for i in range(5000)
+    }
+
+    backend, actual = _timed(combine_metadata, keys)
+    monkeypatch.setattr("riocli.configtree.util.yaml.safe_load", yaml.safe_load)
+    baseline, expected = _timed(combine_metadata, keys)
+
+    assert actual == expected
+    _report("Combine 5000 config tree keys", baseline, backend)
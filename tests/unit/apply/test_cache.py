@@ -0,0 +1,119 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the rendered template cache."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import pickle
+
+import jinja2
+
+from riocli.apply import cache as cache_module
+from riocli.apply.cache import TemplateCache
+
+CONTENT = "kind: Secret\nmetadata:\n  name: {{ name }}\n"
+DOCUMENTS = [{"kind": "Secret", "metadata": {"name": "docker"}}]
+
+
+def _environment() -> jinja2.Environment:
+    environment = jinja2.Environment()
+    environment.filters["getenv"] = lambda default, name: default
+    return environment
+
+
+class TestTemplateCache:
+    def test_round_trip(self, tmp_path):
+        cache = TemplateCache(_environment(), {"name": "docker"}, path=tmp_path)
+        key = cache.key(CONTENT, ".yaml")
+
+        assert cache.get(key) is None
+        cache.set(key, CONTENT, DOCUMENTS)
+        assert cache.get(key) == DOCUMENTS
+        assert json.loads((tmp_path / key).read_text()) == DOCUMENTS
+
+    def test_key_depends_on_content_values_and_filters(self, tmp_path):
+        cache = TemplateCache(_environment(), {"name": "docker"}, path=tmp_path)
+        other_values = TemplateCache(_environment(), {"name": "gcr"}, path=tmp_path)
+        other_filters = TemplateCache(
+            jinja2.Environment(), {"name": "docker"}, path=tmp_path
+        )
+
+        key = cache.key(CONTENT, ".yaml")
+        assert cache.key(CONTENT + "\n", ".yaml") != key
+        assert other_values.key(CONTENT, ".yaml") != key
+        assert other_filters.key(CONTENT, ".yaml") != key
+
+    def test_key_depends_on_the_riocli_version(self, tmp_path, monkeypatch):
+        key = TemplateCache(_environment(), {}, path=tmp_path).key(CONTENT, ".yaml")
+        monkeypatch.setattr(cache_module, "__version__", "0.0.0")
+
+        upgraded = TemplateCache(_environment(), {}, path=tmp_path)
+
+        assert upgraded.key(CONTENT, ".yaml") != key
+
+    def test_nondeterministic_templates_are_not_cached(self, tmp_path):
+        cache = TemplateCache(_environment(), {}, path=tmp_path)
+        content = "name: {{ 'x' | getenv('NAME') }}\n"
+        key = cache.key(content, ".yaml")
+
+        cache.set(key, content, [{"name": "x"}])
+
+        assert cache.get(key) is None
+
+    def test_templates_including_others_are_not_cached(self, tmp_path):
+        cache = TemplateCache(_environment(), {}, path=tmp_path)
+
+        for content in (
+            "{% include 'common.yaml' %}",
+            "{% import 'macros.j2' as m %}",
+            "{% from 'macros.j2' import name %}",
+            "{% extends 'base.yaml' %}",
+        ):
+            assert not cache.is_cacheable(content)
+
+    def test_documents_json_cannot_hold_are_not_cached(self, tmp_path):
+        cache = TemplateCache(_environment(), {}, path=tmp_path)
+
+        for documents in ([{"date": datetime.date(2025, 1, 1)}], [{1: "one"}]):
+            key = cache.key(f"{CONTENT}# {documents}\n", ".yaml")
+            cache.set(key, CONTENT, documents)
+
+            assert cache.get(key) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = TemplateCache(_environment(), {}, path=tmp_path)
+        key = cache.key(CONTENT, ".yaml")
+        (tmp_path / key).write_bytes(b"not json")
+
+        assert cache.get(key) is None
+
+    def test_pickles_are_never_loaded(self, tmp_path):
+        cache = TemplateCache(_environment(), {}, path=tmp_path)
+        key = cache.key(CONTENT, ".yaml")
+        (tmp_path / key).write_bytes(pickle.dumps(DOCUMENTS))
+
+        assert cache.get(key) is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = TemplateCache(_environment(), {}, path=tmp_path)
+        cache.MAX_ENTRIES = 2
+
+        for i in range(3):
+            content = f"{CONTENT}# {i}\n"
+            cache.set(cache.key(content, ".yaml"), content, DOCUMENTS)
+
+        assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,90 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lazily loaded Ansible filters of the templates."""
+
+from __future__ import annotations
+
+import importlib
+
+import jinja2
+import pytest
+
+from riocli.apply import util
+from riocli.apply.util import (
+    ANSIBLE_FILTER_MODULES,
+    ANSIBLE_OVERRIDES,
+    FILTERS,
+    init_jinja_environment,
+)
+
+
+def _render(environment: jinja2.Environment, template: str, **values) -> str:
+    return environment.from_string(template).render(**values)
+
+
+class TestLazyFilters:
+    def test_plain_templates_do_not_load_ansible(self):
+        environment = init_jinja_environment()
+
+        rendered = _render(
+            environment,
+            "{{ name | upper }}-{{ missing | default('x') }}",
+            name="amr",
+        )
+
+        assert rendered == "AMR-x"
+        assert not environment.filters._loaded
+
+    def test_unknown_filter_loads_ansible(self):
+        pytest.importorskip("ansible")
+        environment = init_jinja_environment()
+
+        assert _render(environment, "{{ 'a,b' | split(',') | to_json }}") == (
+            '["a", "b"]'
+        )
+        assert environment.filters._loaded
+
+    def test_overridden_filter_loads_ansible(self):
+        pytest.importorskip("ansible")
+        environment = init_jinja_environment()
+
+        assert _render(environment, "{{ [1, 1, 2] | unique | list }}") == "[1, 2]"
+        assert environment.filters._loaded
+
+    def test_default_stays_jinja(self):
+        pytest.importorskip("ansible")
+        environment = init_jinja_environment()
+        environment.filters.load_ansible()
+
+        assert environment.filters["default"] is jinja2.Environment().filters["default"]
+
+    def test_overrides_are_up_to_date(self):
+        pytest.importorskip("ansible")
+        base = set(jinja2.Environment().filters) | set(FILTERS)
+
+        replaced = set()
+        for name in ANSIBLE_FILTER_MODULES:
+            replaced |= set(importlib.import_module(name).FilterModule().filters())
+
+        assert (replaced & base) - {"default"} <= ANSIBLE_OVERRIDES
+
+    def test_without_ansible(self, monkeypatch, capsys):
+        monkeypatch.setattr(util, "ANSIBLE_FILTER_MODULES", ("riocli.missing",))
+        environment = init_jinja_environment()
+
+        with pytest.raises(jinja2.TemplateAssertionError):
+            _render(environment, "{{ x | to_json }}")
+
+        assert "Ansible filters are not supported" in capsys.readouterr().out
@@ -0,0 +1,86 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the apply ledger."""
+
+from __future__ import annotations
+
+from munch import munchify
+
+from riocli.apply.ledger import ApplyLedger, manifest_hash
+
+
+def _remote(guid="secret-abc", updated_at="2025-01-01T00:00:00Z", generation=None):
+    metadata = {"name": "docker", "guid": guid, "updatedAt": updated_at}
+    if generation is not None:
+        metadata["generation"] = generation
+
+    return munchify({"metadata": metadata})
+
+
+class TestManifestHash:
+    def test_ignores_key_order_timestamps_and_private_keys(self):
+        a = {"kind": "Secret", "metadata": {"name": "a", "labels": {"x": "1"}}}
+        b = {
+            "_obj": object(),
+            "metadata": {"labels": {"x": "1"}, "name": "a", "createdAt": "now"},
+            "kind": "Secret",
+        }
+
+        assert manifest_hash(a) == manifest_hash(b)
+
+    def test_changes_with_the_spec(self):
+        a = {"kind": "Secret", "metadata": {"name": "a"}, "spec": {"v": 1}}
+        b = {"kind": "Secret", "metadata": {"name": "a"}, "spec": {"v": 2}}
+
+        assert manifest_hash(a) != manifest_hash(b)
+
+
+class TestApplyLedger:
+    def test_unchanged_after_reload(self, tmp_path):
+        path = tmp_path / "project.json"
+        ledger = ApplyLedger("project-x", path=path)
+        ledger.record("secret:docker", "hash-1", _remote())
+        ledger.save()
+
+        reloaded = ApplyLedger("project-x", path=path)
+        assert reloaded.is_unchanged("secret:docker", "hash-1", _remote())
+
+    def test_changed_manifest_or_server_object(self, tmp_path):
+        ledger = ApplyLedger("project-x", path=tmp_path / "project.json")
+        ledger.record("deployment:a", "hash-1", _remote(generation=1))
+
+        assert ledger.is_unchanged("deployment:a", "hash-1", _remote(generation=1))
+        assert not ledger.is_unchanged("deployment:a", "hash-2", _remote(generation=1))
+        assert not ledger.is_unchanged("deployment:a", "hash-1", _remote(generation=2))
+        assert not ledger.is_unchanged(
+            "deployment:a", "hash-1", _remote(guid="dep-new", generation=1)
+        )
+        assert not ledger.is_unchanged("deployment:a", "hash-1", None)
+
+    def test_object_without_guid_is_not_recorded(self, tmp_path):
+        ledger = ApplyLedger("project-x", path=tmp_path / "project.json")
+        ledger.record("secret:docker", "hash-1", _remote())
+        ledger.record("secret:docker", "hash-1", _remote(guid=None))
+
+        assert not ledger.is_unchanged("secret:docker", "hash-1", _remote(guid=None))
+        assert not ledger.is_unchanged("secret:docker", "hash-1", _remote())
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "project.json"
+        path.write_text("[1, 2")
+
+        assert not ApplyLedger("project-x", path=path).is_unchanged(
+            "secret:docker", "hash-1", _remote()
+        )
@@ -0,0 +1,68 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for loading the manifest files in parallel."""
+
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from riocli.apply.loader import load_parallel, split_documents
+
+
+def _stream(count: int) -> str:
+    return "---\n".join(
+        f"kind: Secret\nmetadata:\n  name: s{i}\nspec:\n  value: |\n    a\n    b\n"
+        for i in range(count)
+    )
+
+
+class TestSplitDocuments:
+    @pytest.mark.parametrize("parts", [1, 2, 3, 7, 100])
+    def test_chunks_parse_to_the_same_documents(self, parts):
+        content = "# header\n---\n" + _stream(20) + "...\n---\nlast: true\n"
+        chunks = split_documents(content, parts)
+
+        assert len(chunks) <= parts + 1
+        assert "".join(chunks) == content
+        assert [d for c in chunks for d in yaml.safe_load_all(c)] == list(
+            yaml.safe_load_all(content)
+        )
+
+    def test_directives_are_not_split(self):
+        content = "%YAML 1.1\n---\na: 1\n---\nb: 2\n"
+
+        assert split_documents(content, 4) == [content]
+
+
+class TestLoadParallel:
+    def test_preserves_order_and_renders_values(self):
+        files = [
+            ("a.yaml", ".yaml", _stream(10)),
+            ("b.json", ".json", '{"name": "{{ name }}"}'),
+            ("c.yaml", ".yaml", "name: {{ name }}\n"),
+        ]
+
+        results = load_parallel(files, {"name": "x"}, workers=2)
+
+        assert [d["metadata"]["name"] for d in results[0]] == [f"s{i}" for i in range(10)]
+        assert results[1] == [{"name": "x"}]
+        assert results[2] == [{"name": "x"}]
+
+    def test_parse_error_names_the_file(self):
+        files = [("bad.yaml", ".yaml", _stream(4) + "---\na: [1\n")]
+
+        with pytest.raises(Exception, match="Failed to parse bad.yaml"):
+            load_parallel(files, {}, workers=2)
@@ -0,0 +1,160 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for running apply and delete over the parsed manifests."""
+
+from __future__ import annotations
+
+import pytest
+
+from riocli.apply import parse
+from riocli.apply.parse import Applier
+from riocli.constants import ApplyResult
+from riocli.utils.spans import SpanRecorder
+
+
+class _Config:
+    def new_client(self):
+        return None
+
+    def new_v2_client(self):
+        return None
+
+
+@pytest.fixture
+def applier(monkeypatch):
+    applier = Applier.__new__(Applier)
+    applier.config = _Config()
+    applier.spans = SpanRecorder("rio")
+    applier.objects = {"secret:a": object(), "secret:b": object()}
+    applier.dependency_graph = {"secret:a": set(), "secret:b": set()}
+    monkeypatch.setattr(applier, "_record_latency", lambda *args: None)
+    monkeypatch.delenv("RIO_TRACE_SPANS", raising=False)
+    return applier
+
+
+class TestResultSummary:
+    def test_printed_after_a_successful_run(self, applier, monkeypatch, capsys):
+        monkeypatch.setattr(applier, "_delete_manifest", lambda key, **kwargs: None)
+
+        applier.delete(dryrun=False, retry_count=1, retry_interval=1)
+
+        assert "Deleted: 2, Failed: 0, Skipped: 0" in capsys.readouterr().out
+
+    def test_printed_after_a_failed_run(self, applier, monkeypatch, capsys):
+        def delete(key, **kwargs):
+            if key == "secret:a":
+                raise Exception("forbidden")
+
+        monkeypatch.setattr(applier, "_delete_manifest", delete)
+
+        with pytest.raises(SystemExit):
+            applier.delete(
+                dryrun=False, retry_count=1, retry_interval=1, on_error="continue"
+            )
+
+        assert "Deleted: 1, Failed: 1, Skipped: 0" in capsys.readouterr().out
+
+    def test_not_printed_on_dry_runs(self, applier, monkeypatch, capsys):
+        monkeypatch.setattr(applier, "_delete_manifest", lambda key, **kwargs: None)
+
+        applier.delete(dryrun=True, retry_count=1, retry_interval=1)
+
+        assert "Deleted:" not in capsys.readouterr().out
+
+
+class _Ledger:
+    def __init__(self, fail_save: bool = False):
+        self.fail_save = fail_save
+        self.recorded: dict[str, object] = {}
+
+    def record(self, key, digest, remote):
+        self.recorded[key] = remote
+
+    def forget(self, key):
+        self.recorded.pop(key, None)
+
+    def save(self):
+        if self.fail_save:
+            raise PermissionError("read-only")
+
+
+class _State:
+    def __init__(self, remotes=None):
+        self.remotes = remotes or {}
+        self.prefetched = []
+
+    def prefetch(self, objects, v2_client, min_objects):
+        self.prefetched = list(objects)
+        self.remotes = {id(o): f"new {id(o)}" for o in objects}
+
+    def get(self, obj):
+        return self.remotes.get(id(obj))
+
+
+class TestLedger:
+    @pytest.fixture
+    def ledger(self, applier, monkeypatch):
+        ledger = _Ledger()
+        updates = []
+        monkeypatch.setattr(applier, "_get_ledger", lambda: ledger)
+        monkeypatch.setattr(applier, "_prefetch_server_state", lambda *a, **kw: None)
+        monkeypatch.setattr(
+            applier, "_update_ledger", lambda *args: updates.append(args[-1])
+        )
+        ledger.updates = updates
+        return ledger
+
+    def test_updated_after_a_successful_run(self, applier, ledger, monkeypatch):
+        monkeypatch.setattr(applier, "_apply_manifest", lambda key, **kwargs: None)
+
+        applier.apply(dryrun=False, retry_count=1, retry_interval=1, skip_unchanged=True)
+
+        assert len(ledger.updates) == 1
+
+    def test_not_updated_after_a_failed_run(self, applier, ledger, monkeypatch):
+        def apply(key, **kwargs):
+            raise Exception("forbidden")
+
+        monkeypatch.setattr(applier, "_apply_manifest", apply)
+
+        with pytest.raises(SystemExit):
+            applier.apply(
+                dryrun=False, retry_count=1, retry_interval=1, skip_unchanged=True
+            )
+
+        assert ledger.updates == []
+
+    def test_only_changed_objects_are_listed_again(self, applier, monkeypatch):
+        refreshed = _State()
+        monkeypatch.setattr(parse, "ServerState", lambda: refreshed)
+        monkeypatch.setattr(parse, "manifest_hash", lambda obj: "hash")
+        a, b = applier.objects["secret:a"], applier.objects["secret:b"]
+        ledger = _Ledger()
+
+        applier._update_ledger(
+            ledger,
+            _State({id(b): "listed b"}),
+            None,
+            results={"secret:a": ApplyResult.CREATED, "secret:b": ApplyResult.EXISTS},
+        )
+
+        assert refreshed.prefetched == [a]
+        assert ledger.recorded == {"secret:a": f"new {id(a)}", "secret:b": "listed b"}
+
+    def test_save_errors_are_logged(self, applier, caplog):
+        with caplog.at_level("DEBUG", logger="riocli.apply.parse"):
+            applier._update_ledger(_Ledger(fail_save=True), _State(), None, results={})
+
+        assert "Failed to save the apply ledger: read-only" in caplog.text
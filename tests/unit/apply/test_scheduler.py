@@ -0,0 +1,233 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the apply dependency graph scheduler."""
+
+from __future__ import annotations
+
+import graphlib
+import threading
+import time
+
+import pytest
+
+from riocli.apply.history import LatencyHistory
+from riocli.apply.scheduler import OnError, Scheduler, critical_path_priorities
+
+
+def _recorder():
+    order: list[str] = []
+    lock = threading.Lock()
+
+    def op(node: str) -> None:
+        with lock:
+            order.append(node)
+
+    return order, op
+
+
+class TestScheduler:
+    def test_dependencies_run_first(self):
+        graph = {"c": {"b"}, "b": {"a"}, "a": set(), "d": {"a"}}
+        order, op = _recorder()
+
+        Scheduler(graph, workers=4).run(op)
+
+        assert sorted(order) == ["a", "b", "c", "d"]
+        assert order.index("a") < order.index("b") < order.index("c")
+        assert order.index("a") < order.index("d")
+
+    def test_slow_node_does_not_block_unrelated_subtree(self):
+        # "slow" and "fast" are both ready at the start. The dependent of
+        # "fast" must start without waiting for "slow" to finish.
+        graph = {"slow": set(), "fast": set(), "after-fast": {"fast"}}
+        started: dict[str, float] = {}
+        release = threading.Event()
+
+        def op(node: str) -> None:
+            started[node] = time.monotonic()
+            if node == "slow":
+                release.wait(timeout=5)
+            if node == "after-fast":
+                release.set()
+
+        Scheduler(graph, workers=2).run(op)
+
+        assert started["after-fast"] < started["slow"] + 5
+        assert release.is_set()
+
+    def test_workers_bound_is_respected(self):
+        graph = {str(i): set() for i in range(20)}
+        lock = threading.Lock()
+        running, peak = 0, 0
+
+        def op(_: str) -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        Scheduler(graph, workers=3).run(op)
+
+        assert peak <= 3
+
+    def test_failure_stops_new_work_and_raises(self):
+        graph = {"a": set(), "b": {"a"}}
+        order, record = _recorder()
+
+        def op(node: str) -> None:
+            record(node)
+            if node == "a":
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            Scheduler(graph, workers=2).run(op)
+
+        assert order == ["a"]
+
+    def test_records_per_node_timings(self):
+        graph = {"a": set(), "b": {"a"}}
+        scheduler = Scheduler(graph, workers=2)
+
+        scheduler.run(lambda _: None)
+
+        assert set(scheduler.timings) == {"a", "b"}
+        assert all(t >= 0 for t in scheduler.timings.values())
+
+    def test_records_when_nodes_are_ready_and_started(self):
+        graph = {"a": set(), "b": {"a"}}
+        scheduler = Scheduler(graph, workers=2)
+
+        scheduler.run(lambda _: time.sleep(0.01))
+
+        assert scheduler.ready_at["a"] <= scheduler.started_at["a"]
+        assert scheduler.ready_at["b"] >= scheduler.started_at["a"] + 0.01
+        assert scheduler.ready_at["b"] <= scheduler.started_at["b"]
+
+
+class TestOnError:
+    # "bad" fails, "child" depends on it, "grandchild" depends on "child",
+    # and "other" is unrelated.
+    GRAPH = {
+        "bad": set(),
+        "child": {"bad"},
+        "grandchild": {"child"},
+        "other": set(),
+    }
+
+    @staticmethod
+    def _failing_op(record):
+        def op(node: str) -> None:
+            record(node)
+            if node == "bad":
+                raise ValueError("boom")
+
+        return op
+
+    def test_fail_fast_leaves_rest_unattempted(self):
+        order, record = _recorder()
+        scheduler = Scheduler(self.GRAPH, workers=1, on_error=OnError.FAIL_FAST)
+
+        with pytest.raises(ValueError):
+            scheduler.run(self._failing_op(record))
+
+        assert set(scheduler.failed) == {"bad"}
+        assert "child" in scheduler.skipped
+        assert "grandchild" in scheduler.skipped
+
+    def test_continue_attempts_everything(self):
+        order, record = _recorder()
+        scheduler = Scheduler(self.GRAPH, workers=2, on_error="continue")
+
+        with pytest.raises(ValueError):
+            scheduler.run(self._failing_op(record))
+
+        assert sorted(order) == ["bad", "child", "grandchild", "other"]
+        assert scheduler.skipped == []
+
+    def test_skip_dependents_only_skips_transitive_dependents(self):
+        order, record = _recorder()
+        scheduler = Scheduler(self.GRAPH, workers=2, on_error=OnError.SKIP_DEPENDENTS)
+
+        with pytest.raises(ValueError):
+            scheduler.run(self._failing_op(record))
+
+        assert sorted(order) == ["bad", "other"]
+        assert scheduler.succeeded == ["other"]
+        assert sorted(scheduler.skipped) == ["child", "grandchild"]
+
+
+class TestCriticalPathPriorities:
+    def test_longest_chain_has_highest_priority(self):
+        # deep-1 <- deep-2 <- deep-3, and a lone leaf.
+        graph = {
+            "deep-1": set(),
+            "deep-2": {"deep-1"},
+            "deep-3": {"deep-2"},
+            "leaf": set(),
+        }
+
+        priorities = critical_path_priorities(graph)
+
+        assert priorities == {"deep-1": 3, "deep-2": 2, "deep-3": 1, "leaf": 1}
+
+    def test_weights_are_applied(self):
+        graph = {"secret": set(), "deployment": {"package"}, "package": set()}
+        weights = {"secret": 1, "deployment": 30, "package": 2}
+
+        priorities = critical_path_priorities(graph, weights)
+
+        assert priorities["package"] == 32
+        assert priorities["secret"] == 1
+
+    def test_scheduler_starts_highest_priority_first(self):
+        graph = {"leaf-1": set(), "leaf-2": set(), "root": set(), "child": {"root"}}
+        order, op = _recorder()
+        priorities = critical_path_priorities(graph)
+
+        Scheduler(graph, workers=1, priorities=priorities).run(op)
+
+        assert order[0] == "root"
+
+    def test_equal_priorities_start_in_ready_order(self):
+        graph = {n: set() for n in "abcdef"}
+        order, op = _recorder()
+
+        Scheduler(graph, workers=1).run(op)
+
+        assert order == list(graphlib.TopologicalSorter(graph).static_order())
+
+
+class TestLatencyHistory:
+    def test_record_and_reload(self, tmp_path):
+        path = tmp_path / "latency.json"
+        history = LatencyHistory("apply", path=path)
+
+        history.record({"deployment:a": 10.0, "secret:b": 1.0})
+        history.record({"deployment:c": 20.0})
+        history.save()
+
+        reloaded = LatencyHistory("apply", path=path)
+        assert reloaded.get("deployment") == pytest.approx(13.0)
+        assert reloaded.get("secret") == 1.0
+        assert LatencyHistory("delete", path=path).known() == {}
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "latency.json"
+        path.write_text("not json")
+
+        assert LatencyHistory("apply", path=path).known() == {}
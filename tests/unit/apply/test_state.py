@@ -0,0 +1,141 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the server state prefetched by apply."""
+
+from __future__ import annotations
+
+import pytest
+from munch import munchify
+from rapyuta_io_sdk_v2.exceptions import UnauthorizedAccessError
+
+from riocli.apply.state import PREFETCH_MIN_OBJECTS, ServerState
+from riocli.constants import ApplyResult
+from riocli.model import Model
+from riocli.static_route.model import StaticRoute
+
+
+class FakeSecret(Model):
+    existing: list[str] = []
+    list_calls = 0
+    fail_listing = False
+
+    def __init__(self, name: str):
+        super().__init__(munchify({"kind": "Secret", "metadata": {"name": name}}))
+        self.calls: list[str] = []
+
+    @classmethod
+    def list_objects(cls, v2_client, names):
+        cls.list_calls += 1
+        if cls.fail_listing:
+            raise UnauthorizedAccessError("forbidden")
+
+        return [munchify({"metadata": {"name": n}}) for n in cls.existing]
+
+    def create_object(self, *args, **kwargs):
+        self.calls.append("create")
+
+    def update_object(self, *args, **kwargs):
+        self.calls.append("update")
+
+    def delete_object(self, *args, **kwargs):
+        pass
+
+    def list_dependencies(self):
+        return []
+
+
+def _secrets(n: int) -> list[FakeSecret]:
+    return [FakeSecret(f"secret-{i}") for i in range(n)]
+
+
+def _apply(obj: Model, state: ServerState) -> ApplyResult:
+    return obj.apply(
+        client=None,
+        v2_client=None,
+        config=None,
+        retry_count=0,
+        retry_interval=0,
+        server_state=state,
+    )
+
+
+class TestServerState:
+    def setup_method(self):
+        FakeSecret.existing = ["secret-0"]
+        FakeSecret.list_calls = 0
+        FakeSecret.fail_listing = False
+
+    def test_existing_objects_are_updated_without_create(self):
+        objects = _secrets(PREFETCH_MIN_OBJECTS)
+        state = ServerState()
+        state.prefetch(objects, v2_client=None)
+
+        assert FakeSecret.list_calls == 1
+        assert _apply(objects[0], state) == ApplyResult.UPDATED
+        assert objects[0].calls == ["update"]
+        assert _apply(objects[1], state) == ApplyResult.CREATED
+        assert objects[1].calls == ["create"]
+
+    def test_few_objects_are_not_prefetched(self):
+        objects = _secrets(PREFETCH_MIN_OBJECTS - 1)
+        state = ServerState()
+        state.prefetch(objects, v2_client=None)
+
+        assert FakeSecret.list_calls == 0
+        assert not state.is_indexed(objects[0])
+
+    def test_listing_failure_falls_back(self):
+        FakeSecret.fail_listing = True
+        objects = _secrets(PREFETCH_MIN_OBJECTS)
+        state = ServerState()
+        state.prefetch(objects, v2_client=None)
+
+        assert not state.is_indexed(objects[0])
+        assert _apply(objects[0], state) == ApplyResult.CREATED
+
+    def test_unexpected_listing_errors_are_raised(self, monkeypatch):
+        def list_objects(v2_client, names):
+            raise KeyError("metadata")
+
+        monkeypatch.setattr(FakeSecret, "list_objects", list_objects)
+        objects = _secrets(PREFETCH_MIN_OBJECTS)
+
+        with pytest.raises(KeyError):
+            ServerState().prefetch(objects, v2_client=None)
+
+    def test_static_routes_match_without_the_org_suffix(self, monkeypatch):
+        routes = [
+            StaticRoute(
+                munchify(
+                    {
+                        "apiVersion": "apiextensions.rapyuta.io/v1",
+                        "kind": "StaticRoute",
+                        "metadata": {"name": f"web-{i}"},
+                        "spec": {},
+                    }
+                )
+            )
+            for i in range(PREFETCH_MIN_OBJECTS)
+        ]
+        listed = munchify([{"metadata": {"name": "web-0-abcd"}}])
+        monkeypatch.setattr(
+            StaticRoute, "list_objects", classmethod(lambda cls, **kwargs: listed)
+        )
+
+        state = ServerState()
+        state.prefetch(routes, v2_client=None)
+
+        assert state.get(routes[0]) is listed[0]
+        assert state.get(routes[1]) is None
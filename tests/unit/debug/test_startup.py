@@ -0,0 +1,100 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the import-time profiling of the startup."""
+
+from __future__ import annotations
+
+import importlib
+
+from click.testing import CliRunner
+
+from riocli.debug.startup import (
+    SORT_CUMULATIVE,
+    ImportProfile,
+    parse_import_times,
+    startup,
+)
+
+# The package exports the command under the same name as the module.
+startup_module = importlib.import_module("riocli.debug.startup")
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+Error: something the command printed
+import time:      2000 |       2000 |     yaml
+import time:       300 |       2300 |   riocli.utils
+import time:       500 |       2920 | riocli.bootstrap
+"""
+
+
+class TestParseImportTimes:
+    def test_parses_the_report(self):
+        modules = parse_import_times(REPORT)
+
+        assert [(m.name, m.self_us, m.cumulative_us, m.depth) for m in modules] == [
+            ("_io", 120, 120, 1),
+            ("yaml", 2000, 2000, 2),
+            ("riocli.utils", 300, 2300, 1),
+            ("riocli.bootstrap", 500, 2920, 0),
+        ]
+
+    def test_top(self):
+        profile = ImportProfile(
+            elapsed=0.1, exit_code=0, modules=parse_import_times(REPORT)
+        )
+
+        assert [m.name for m in profile.top(2)] == ["yaml", "riocli.bootstrap"]
+        assert [m.name for m in profile.top(2, SORT_CUMULATIVE)] == [
+            "riocli.bootstrap",
+            "riocli.utils",
+        ]
+        assert profile.total_ms == 2.92
+
+
+class TestStartupCommand:
+    def test_prints_the_top_modules(self, monkeypatch):
+        calls = []
+
+        def profile(args):
+            calls.append(args)
+            return ImportProfile(
+                elapsed=0.25, exit_code=0, modules=parse_import_times(REPORT)
+            )
+
+        monkeypatch.setattr(startup_module, "profile_imports", profile)
+
+        result = CliRunner().invoke(
+            startup, ["--top", "1", "--", "deployment", "list", "--help"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert calls == [["deployment", "list", "--help"]]
+        assert "yaml" in result.output
+        assert "riocli.bootstrap" not in result.output
+        assert "took 250ms, 3ms of which importing 4 modules" in result.output
+
+    def test_defaults_to_version(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            startup_module,
+            "profile_imports",
+            lambda args: calls.append(args) or ImportProfile(0.1, 0),
+        )
+
+        result = CliRunner().invoke(startup, [])
+
+        assert result.exit_code == 1
+        assert calls == [["version"]]
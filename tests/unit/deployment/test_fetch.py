@@ -0,0 +1,98 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for selecting deployments with server-side filters."""
+
+from __future__ import annotations
+
+from munch import munchify
+
+from riocli.deployment.util import fetch_deployments
+
+
+class FakeClient:
+    """Lists deployments, honouring the filters of the v2 API."""
+
+    def __init__(self, deployments: dict[str, set[str]]):
+        self.deployments = deployments
+        self.calls: list[dict] = []
+
+    def list_deployments(
+        self,
+        cont=0,
+        limit=50,
+        names=None,
+        guids=None,
+        label_selector=None,
+        phases=None,
+    ):
+        self.calls.append({"names": names, "guids": guids, "labels": label_selector})
+
+        items = []
+        for n, labels in self.deployments.items():
+            if names is not None and n not in names:
+                continue
+            if guids is not None and f"dep-{n}" not in guids:
+                continue
+            if label_selector and not set(label_selector) <= labels:
+                continue
+            items.append(
+                {
+                    "metadata": {"name": n, "guid": f"dep-{n}"},
+                    "status": {"phase": "Succeeded"},
+                }
+            )
+
+        page = items[cont : cont + limit]
+        return munchify({"items": page, "metadata": {"continue": cont + limit}})
+
+
+def _names(deployments) -> list[str]:
+    return sorted(d.metadata.name for d in deployments)
+
+
+class TestFetchDeployments:
+    def test_exact_name_uses_names_filter(self):
+        client = FakeClient({"amr-1": set(), "amr-10": set()})
+
+        assert _names(fetch_deployments(client, "amr-1", False)) == ["amr-1"]
+        assert client.calls == [{"names": ["amr-1"], "guids": None, "labels": None}]
+
+    def test_guid_uses_guids_filter(self):
+        client = FakeClient({"amr-1": set()})
+
+        assert _names(fetch_deployments(client, "dep-amr-1", False)) == ["amr-1"]
+        assert [c["guids"] for c in client.calls] == [None, ["dep-amr-1"]]
+
+    def test_regex_lists_everything(self):
+        client = FakeClient({"amr": set(), "amr-1": set(), "amr-2": set()})
+
+        assert _names(fetch_deployments(client, "amr.*", False)) == [
+            "amr",
+            "amr-1",
+            "amr-2",
+        ]
+        assert client.calls == [{"names": None, "guids": None, "labels": None}]
+
+    def test_labels_without_name(self):
+        client = FakeClient({"a": {"app=amr"}, "b": set()})
+
+        assert _names(fetch_deployments(client, "", False, labels=["app=amr"])) == ["a"]
+        assert fetch_deployments(client, "", False) == []
+
+    def test_all_with_many_pages(self):
+        client = FakeClient({f"d{i}": set() for i in range(120)})
+
+        assert len(fetch_deployments(client, "", True)) == 120
+        assert len(client.calls) == 3
@@ -0,0 +1,284 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for multiplexing deployment log streams."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+
+from munch import munchify
+
+from riocli.deployment import logs, logstream
+from riocli.deployment.logs import get_log_sources, resolve_log_sources
+from riocli.deployment.logstream import LogMultiplexer, LogSource, parse_timestamp
+
+
+class FakeClient:
+    def __init__(self, logs: dict[tuple[str, int], list[str]], replicas: int = 1):
+        self.logs = logs
+        self.replicas = replicas
+
+    def stream_deployment_logs(self, name, executable, replica=0):
+        if (executable, replica) not in self.logs:
+            raise Exception(f"no logs for {executable}/{replica}")
+
+        for line in self.logs[(executable, replica)]:
+            time.sleep(0.001)
+            yield line
+
+    def get_deployment(self, name):
+        executables = {e: {"name": e} for e, _ in self.logs}
+        return munchify(
+            {
+                "metadata": {"depends": {"name_or_guid": "pkg", "version": "v1"}},
+                "status": {"executables_status": executables},
+            }
+        )
+
+    def get_package(self, name, version):
+        return munchify({"spec": {"cloud": {"replicas": self.replicas}}})
+
+
+class FlakyClient:
+    """Replays the earlier lines of the stream on every reconnect."""
+
+    def __init__(self, connections: list[list[str]]):
+        self.connections = connections
+        self.count = 0
+
+    def stream_deployment_logs(self, name, executable, replica=0):
+        if self.count < len(self.connections):
+            yield from self.connections[self.count]
+        self.count += 1
+        raise Exception("connection reset")
+
+
+class TestLogMultiplexer:
+    def test_streams_all_sources(self):
+        client = FakeClient({("a", 0): ["a1", "a2"], ("b", 0): ["b1"]})
+        sources = [LogSource("dep", "a"), LogSource("dep", "b")]
+
+        lines = list(LogMultiplexer(client, sources))
+
+        assert sorted(line for _, line in lines) == ["a1", "a2", "b1"]
+        # Lines of a stream keep their order.
+        assert [line for s, line in lines if s.executable == "a"] == ["a1", "a2"]
+
+    def test_merge_by_timestamp(self):
+        client = FakeClient(
+            {
+                ("a", 0): ["2025-01-01T00:00:02Z a", "2025-01-01T00:00:03Z a"],
+                ("b", 0): [
+                    "2025-01-01T00:00:01Z b",
+                    "continued",
+                    "2025-01-01 00:00:04 b",
+                ],
+            }
+        )
+        sources = [LogSource("dep", "a"), LogSource("dep", "b")]
+
+        lines = [line for _, line in LogMultiplexer(client, sources, merge_window=0.2)]
+
+        assert lines == [
+            "2025-01-01T00:00:01Z b",
+            "continued",
+            "2025-01-01T00:00:02Z a",
+            "2025-01-01T00:00:03Z a",
+            "2025-01-01 00:00:04 b",
+        ]
+
+    def test_failed_stream_does_not_stop_others(self):
+        client = FakeClient({("a", 0): ["a1"]})
+        sources = [LogSource("dep", "a"), LogSource("dep", "missing")]
+        multiplexer = LogMultiplexer(client, sources)
+
+        assert [line for _, line in multiplexer] == ["a1"]
+        assert [s.executable for s, _ in multiplexer.errors] == ["missing"]
+
+    def test_grep_filters_before_buffering(self):
+        client = FakeClient({("a", 0): ["INFO ok", "ERROR bad", "ERROR worse"]})
+        multiplexer = LogMultiplexer(
+            client, [LogSource("dep", "a")], grep=re.compile("ERROR")
+        )
+
+        assert [line for _, line in multiplexer] == ["ERROR bad", "ERROR worse"]
+        stats = multiplexer.stats[LogSource("dep", "a")]
+        assert (stats.received, stats.matched) == (3, 2)
+
+    def test_drops_lines_when_buffer_is_full(self):
+        client = FakeClient({("a", 0): [str(i) for i in range(20)]})
+        multiplexer = LogMultiplexer(
+            client, [LogSource("dep", "a")], buffer_lines=1, drop=True
+        )
+
+        lines = []
+        for _, line in multiplexer:
+            lines.append(line)
+            time.sleep(0.02)
+
+        stats = multiplexer.stats[LogSource("dep", "a")]
+        assert stats.dropped > 0
+        assert len(lines) + stats.dropped == 20
+
+    def test_reconnect_skips_replayed_lines(self, monkeypatch):
+        monkeypatch.setattr(logstream, "RECONNECT_INTERVAL", 0)
+        client = FlakyClient(
+            [
+                ["2025-01-01T00:00:01Z a", "2025-01-01T00:00:02Z b"],
+                [
+                    "2025-01-01T00:00:01Z a",
+                    "2025-01-01T00:00:02Z b",
+                    "2025-01-01T00:00:02.5Z more",
+                ],
+                ["2025-01-01T00:00:02Z b", "2025-01-01T00:00:03Z c"],
+            ]
+        )
+        multiplexer = LogMultiplexer(client, [LogSource("dep", "a")], reconnects=1)
+
+        lines = [line for _, line in multiplexer]
+
+        assert lines == [
+            "2025-01-01T00:00:01Z a",
+            "2025-01-01T00:00:02Z b",
+            "2025-01-01T00:00:02.5Z more",
+            "2025-01-01T00:00:03Z c",
+        ]
+        # Reconnects in a row are only counted until new lines arrive.
+        assert multiplexer.stats[LogSource("dep", "a")].reconnects == 3
+        assert [str(e) for _, e in multiplexer.errors] == ["connection reset"]
+
+    def test_reconnect_keeps_unseen_lines_with_the_last_timestamp(self, monkeypatch):
+        monkeypatch.setattr(logstream, "RECONNECT_INTERVAL", 0)
+        client = FlakyClient(
+            [
+                ["2025-01-01T00:00:01Z a", "2025-01-01T00:00:02Z b"],
+                [
+                    "2025-01-01T00:00:01Z a",
+                    "2025-01-01T00:00:02Z b",
+                    "2025-01-01T00:00:02Z c",
+                ],
+            ]
+        )
+        multiplexer = LogMultiplexer(client, [LogSource("dep", "a")], reconnects=1)
+
+        lines = [line for _, line in multiplexer]
+
+        assert lines == [
+            "2025-01-01T00:00:01Z a",
+            "2025-01-01T00:00:02Z b",
+            "2025-01-01T00:00:02Z c",
+        ]
+
+    def test_reconnect_counts_lines_without_timestamps(self, monkeypatch):
+        monkeypatch.setattr(logstream, "RECONNECT_INTERVAL", 0)
+        client = FlakyClient(
+            [
+                ["plain 1", "2025-01-01T00:00:01Z a", "trace 1"],
+                ["plain 1", "2025-01-01T00:00:01Z a", "trace 1", "trace 2"],
+                ["plain 1", "2025-01-01T00:00:01Z a", "trace 1", "trace 2"],
+            ]
+        )
+        multiplexer = LogMultiplexer(client, [LogSource("dep", "a")], reconnects=1)
+
+        lines = [line for _, line in multiplexer]
+
+        assert lines == ["plain 1", "2025-01-01T00:00:01Z a", "trace 1", "trace 2"]
+
+    def test_reconnect_without_any_timestamps(self, monkeypatch):
+        monkeypatch.setattr(logstream, "RECONNECT_INTERVAL", 0)
+        client = FlakyClient([["x", "y"], ["x", "y", "y"]])
+        multiplexer = LogMultiplexer(client, [LogSource("dep", "a")], reconnects=1)
+
+        lines = [line for _, line in multiplexer]
+
+        assert lines == ["x", "y", "y"]
+
+    def test_max_streams(self):
+        client = FakeClient({(str(i), 0): ["x"] * 5 for i in range(10)})
+        sources = [LogSource("dep", str(i)) for i in range(10)]
+
+        lines = list(LogMultiplexer(client, sources, max_streams=2))
+
+        assert len(lines) == 50
+
+    def test_max_streams_bounds_the_threads(self, monkeypatch):
+        client = FakeClient({(str(i), 0): ["x"] for i in range(10)})
+        sources = [LogSource("dep", str(i)) for i in range(10)]
+        started = []
+        start = threading.Thread.start
+
+        def record(thread):
+            started.append(thread)
+            start(thread)
+
+        monkeypatch.setattr(threading.Thread, "start", record)
+
+        lines = list(LogMultiplexer(client, sources, max_streams=2))
+
+        assert len(lines) == 10
+        assert len(started) == 2
+
+    def test_streams_that_end_are_not_reconnected(self):
+        client = FakeClient({("a", 0): ["a1", "a2"]})
+        multiplexer = LogMultiplexer(client, [LogSource("dep", "a")], reconnects=3)
+
+        assert [line for _, line in multiplexer] == ["a1", "a2"]
+        assert multiplexer.stats[LogSource("dep", "a")].reconnects == 0
+
+    def test_parse_timestamp(self):
+        assert parse_timestamp("2025-01-01T00:00:01.5Z x") == 1735689601.5
+        assert parse_timestamp("[2025-01-01T00:00:01+00:00] x") == 1735689601
+        assert parse_timestamp("no timestamp") is None
+
+
+class TestLogSources:
+    def test_default_is_first_executable(self):
+        client = FakeClient({("a", 0): [], ("b", 0): []})
+
+        assert get_log_sources(client, "dep") == [LogSource("dep", "a", 0)]
+
+    def test_all_executables_and_replicas(self):
+        client = FakeClient({("a", 0): [], ("b", 0): []}, replicas=2)
+
+        sources = get_log_sources(client, "dep", all_executables=True, all_replicas=True)
+
+        assert [(s.executable, s.replica) for s in sources] == [
+            ("a", 0),
+            ("a", 1),
+            ("b", 0),
+            ("b", 1),
+        ]
+
+    def test_regex_matches_cloud_deployments(self, monkeypatch):
+        client = FakeClient({("a", 0): []})
+
+        def fetch_deployments(client, name_or_regex, include_all):
+            assert name_or_regex == "amr-.*"
+            return [
+                munchify(
+                    {
+                        "metadata": {"name": name},
+                        "spec": {"runtime": runtime},
+                        "status": {"executables_status": {"a": {"name": "a"}}},
+                    }
+                )
+                for name, runtime in [("amr-1", "cloud"), ("amr-2", "device")]
+            ]
+
+        monkeypatch.setattr(logs, "fetch_deployments", fetch_deployments)
+
+        assert resolve_log_sources(client, "amr-.*") == [LogSource("amr-1", "a", 0)]
@@ -0,0 +1,77 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the shared deployment readiness tracker."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from munch import munchify
+
+from riocli.deployment.tracker import DeploymentTracker, get_tracker
+from riocli.utils.error import RetriesExhausted
+
+
+class FakeClient:
+    """Reports a deployment as running after it was listed `after` times."""
+
+    def __init__(self, after: int = 2):
+        self.after = after
+        self.calls: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def list_deployments(self, names, phases, cont=0, limit=50):
+        with self._lock:
+            self.calls.append(list(names))
+            running = len(self.calls) > self.after
+
+        items = [
+            {"metadata": {"name": n}, "status": {"status": "Running"}}
+            for n in names
+            if running and n != "never"
+        ]
+        return munchify({"items": items, "metadata": {}})
+
+
+class TestDeploymentTracker:
+    def test_waiters_share_polls(self):
+        client = FakeClient(after=2)
+        tracker = DeploymentTracker(client)  # pyright:ignore[reportArgumentType]
+
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            futures = [
+                executor.submit(tracker.wait, ["broker", f"db-{i % 5}"], 20, 0.05)
+                for i in range(50)
+            ]
+            for f in futures:
+                f.result()
+
+        # One poll per interval for everyone, rather than one per waiter.
+        assert len(client.calls) <= 4
+        assert any("broker" in c and "db-4" in c for c in client.calls)
+
+    def test_retries_exhausted(self):
+        tracker = DeploymentTracker(FakeClient(after=0))  # pyright:ignore[reportArgumentType]
+
+        with pytest.raises(RetriesExhausted, match="never"):
+            tracker.wait(["never"], retry_count=2, retry_interval=0)
+
+    def test_tracker_is_shared_per_client(self):
+        client = FakeClient()
+
+        assert get_tracker(client) is get_tracker(client)  # pyright:ignore[reportArgumentType]
+        assert get_tracker(client) is not get_tracker(FakeClient())  # pyright:ignore[reportArgumentType]
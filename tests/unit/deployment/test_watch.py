@@ -0,0 +1,131 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for watching many deployments with batched list calls."""
+
+from __future__ import annotations
+
+from itertools import islice
+
+import pytest
+from munch import munchify
+
+from riocli.deployment.util import (
+    deployment_failure,
+    is_deployment_ready,
+    watch_deployments,
+)
+from riocli.exceptions import ResourceNotFound
+from riocli.utils.error import DeploymentNotRunning
+
+
+class FakeClient:
+    """Serves deployments whose phases advance on every list call."""
+
+    def __init__(self, timelines: dict[str, list[str]], labels=None):
+        self.timelines = timelines
+        self.labels = labels or {}
+        self.calls: list[dict] = []
+
+    def list_deployments(
+        self, names=None, label_selector=None, phases=None, cont=0, limit=50
+    ):
+        self.calls.append({"names": names, "label_selector": label_selector})
+        tick = len(self.calls) - 1
+
+        items = []
+        for name, timeline in self.timelines.items():
+            if names is not None and name not in names:
+                continue
+            if label_selector and not set(label_selector) <= self.labels.get(name, set()):
+                continue
+
+            phase = timeline[min(tick, len(timeline) - 1)]
+            items.append(
+                {
+                    "metadata": {"name": name, "guid": f"dep-{name}"},
+                    "status": {"phase": phase, "status": "Running", "error_codes": []},
+                }
+            )
+
+        return munchify({"items": items, "metadata": {}})
+
+
+def _watch(client, patterns, labels=()):
+    return watch_deployments(
+        client, patterns, labels, retry_count=100, sleep_interval=0.01
+    )
+
+
+class TestWatchDeployments:
+    def test_streams_transitions_until_ready(self):
+        client = FakeClient(
+            {
+                "a": ["InProgress", "Succeeded"],
+                "b": ["InProgress", "Provisioning", "Succeeded"],
+            }
+        )
+
+        transitions = []
+        for changed, deployments in _watch(client, ["a", "b"]):
+            transitions.append(sorted(d.metadata.name for d in changed))
+            if all(is_deployment_ready(d) for d in deployments.values()):
+                break
+
+        assert transitions == [["a", "b"], ["a", "b"], ["b"]]
+        # One batched call per tick.
+        assert len(client.calls) == 3
+        assert all(c["names"] == ["a", "b"] for c in client.calls)
+
+    def test_regex_and_guid(self):
+        client = FakeClient(
+            {"amr-1": ["Succeeded"], "amr-2": ["Succeeded"], "db": ["Succeeded"]}
+        )
+
+        _, deployments = next(_watch(client, ["amr-.*", "dep-db"]))
+
+        assert sorted(deployments) == ["amr-1", "amr-2", "db"]
+
+    def test_labels(self):
+        client = FakeClient(
+            {"a": ["Succeeded"], "b": ["Succeeded"]}, labels={"a": {"app=amr"}}
+        )
+
+        _, deployments = next(_watch(client, [], labels=["app=amr"]))
+
+        assert list(deployments) == ["a"]
+
+    def test_missing_deployment(self):
+        client = FakeClient({"a": ["Succeeded"]})
+
+        with pytest.raises(ResourceNotFound, match="missing"):
+            next(_watch(client, ["a", "missing"]))
+
+    def test_deleted_deployment(self):
+        client = FakeClient({"a": ["InProgress"]})
+        watch = _watch(client, ["a"])
+        next(watch)
+        client.timelines.clear()
+
+        with pytest.raises(DeploymentNotRunning, match="a"):
+            next(watch)
+
+    def test_failure(self):
+        client = FakeClient({"a": ["InProgress", "FailedToStart"]})
+
+        watch = islice(_watch(client, ["a"]), 2)
+        states = [deployment_failure(d["a"]) for _, d in watch]
+
+        assert states[0] is None
+        assert "FailedToStart" in states[1]
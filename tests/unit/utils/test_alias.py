@@ -0,0 +1,93 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lazily loaded command groups."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from riocli.utils.alias import LazyAliasedGroup
+
+hello = click.Command("hello", callback=lambda: click.echo("hello"))
+helper = click.Command("helper", callback=lambda: click.echo("helper"))
+
+
+def _group(**lazy_commands: str) -> LazyAliasedGroup:
+    return LazyAliasedGroup(
+        "root",
+        aliases={"hi": "hello"},
+        lazy_commands=lazy_commands,
+    )
+
+
+class TestLazyAliasedGroup:
+    def test_lists_without_loading(self):
+        group = _group(hello=f"{__name__}:hello", helper=f"{__name__}:helper")
+
+        assert group.list_commands(None) == ["hello", "helper"]
+        assert group.commands == {}
+
+    @pytest.mark.parametrize("args", [["hello"], ["hi"], ["hell"]])
+    def test_loads_when_invoked(self, args):
+        group = _group(hello=f"{__name__}:hello", helper=f"{__name__}:helper")
+
+        result = CliRunner().invoke(group, args)
+
+        assert result.exit_code == 0, result.output
+        assert result.output == "hello\n"
+        assert list(group.commands) == ["hello"]
+
+    def test_ambiguous_abbreviation(self):
+        group = _group(hello=f"{__name__}:hello", helper=f"{__name__}:helper")
+
+        result = CliRunner().invoke(group, ["hel"])
+
+        assert result.exit_code != 0
+        assert "Too many matches: hello, helper" in result.output
+
+    def test_wrong_command_name(self):
+        group = _group(hello=f"{__name__}:helper")
+
+        with pytest.raises(ValueError):
+            group.get_command(None, "hello")
+
+
+class TestBootstrap:
+    def test_commands_match_their_names(self):
+        from riocli.bootstrap import COMMANDS, cli
+
+        for name in COMMANDS:
+            assert cli.get_command(None, name).name == name
+
+    def test_version_does_not_import_the_commands(self):
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from riocli.bootstrap import cli\n"
+            "CliRunner().invoke(cli, ['version'], catch_exceptions=False)\n"
+            "print(sorted(m for m in sys.modules if m.startswith('rapyuta_io')"
+            " or m.startswith('riocli.deployment')))\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,141 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the bulk executor."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from rapyuta_io_sdk_v2.exceptions import ServiceUnavailableError
+
+from riocli.utils import http
+from riocli.utils.execute import apply_func_with_result, bulk_execute
+
+
+def _recording(futures, submit):
+    def wrapper(self, *args, **kwargs):
+        future = submit(self, *args, **kwargs)
+        futures.append(future)
+        return future
+
+    return wrapper
+
+
+class TestBulkExecute:
+    def test_yields_results_as_they_complete(self):
+        release = threading.Event()
+
+        def f(item):
+            if item == "slow":
+                release.wait(5)
+            return item.upper()
+
+        results = bulk_execute(f, ["slow", "fast"], workers=2)
+
+        first = next(results)
+        assert (first.item, first.value, first.ok) == ("fast", "FAST", True)
+        release.set()
+        assert next(results).value == "SLOW"
+
+    def test_does_not_retry_errors(self):
+        calls = []
+
+        def f(item):
+            calls.append(item)
+            raise ServiceUnavailableError("try again")
+
+        (result,) = bulk_execute(f, ["a"])
+
+        assert isinstance(result.error, ServiceUnavailableError)
+        assert calls == ["a"]
+
+    def test_timeout(self):
+        release = threading.Event()
+
+        def f(item):
+            if item == "stuck":
+                release.wait(5)
+            return item
+
+        results = {r.item: r for r in bulk_execute(f, ["stuck", "ok"], timeout=0.1)}
+        release.set()
+
+        assert results["ok"].ok
+        assert not results["ok"].timed_out
+        assert isinstance(results["stuck"].error, TimeoutError)
+        assert results["stuck"].timed_out
+
+    def test_timed_out_item_result_is_dropped(self):
+        release = threading.Event()
+        futures = []
+
+        def f(item):
+            release.wait(5)
+            return item
+
+        results = bulk_execute(f, ["stuck"], workers=1, timeout=0.05)
+        with mock.patch.object(
+            ThreadPoolExecutor, "submit", _recording(futures, ThreadPoolExecutor.submit)
+        ):
+            (result,) = results
+
+        release.set()
+
+        assert result.timed_out
+        assert futures[0].result(timeout=1) is None
+
+    def test_requests_time_out_with_the_item(self):
+        def f(item):
+            return http._time_left()
+
+        (result,) = bulk_execute(f, ["a"], timeout=10)
+
+        assert 0 < result.value <= 10
+        assert http._time_left() is None
+
+    def test_rate_limit(self):
+        start = time.monotonic()
+
+        list(bulk_execute(lambda i: i, range(5), workers=5, rate_limit=50))
+
+        # The first call is free, the other four wait 20ms each.
+        assert time.monotonic() - start >= 0.07
+
+    def test_stops_on_close(self):
+        started = []
+
+        def f(item):
+            started.append(item)
+            time.sleep(0.05)
+
+        results = bulk_execute(f, range(20), workers=1)
+        next(results)
+        results.close()
+        time.sleep(0.1)
+
+        assert len(started) < 20
+
+    def test_apply_func_with_result(self):
+        def f(result, item):
+            result.put((item, item * 2))
+
+        assert apply_func_with_result(f, [3, 1, 2], key=lambda x: x[0]) == [
+            (1, 2),
+            (2, 4),
+            (3, 6),
+        ]
@@ -0,0 +1,379 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the HTTP plumbing shared by the API clients."""
+
+from __future__ import annotations
+
+import io
+
+import httpx
+import pytest
+import requests
+from rapyuta_io.utils.rest_client import HttpMethod, RestClient
+
+from riocli.utils import http, ratelimit
+from riocli.utils.http import (
+    ApiTransport,
+    api_request,
+    configure_pool,
+    deadline,
+    get_session,
+    patch_rest_client,
+    retry_after,
+)
+from riocli.utils.ratelimit import AdaptiveRateLimiter
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = AdaptiveRateLimiter(rate=100, burst=100, sleep=lambda _: None)
+    monkeypatch.setattr(ratelimit, "_limiter", limiter)
+    monkeypatch.setattr(ratelimit, "_configured", True)
+    return limiter
+
+
+@pytest.fixture(autouse=True)
+def pools(monkeypatch):
+    monkeypatch.setattr(http, "_pool_size", http.DEFAULT_POOL_SIZE)
+    monkeypatch.setattr(http, "_session", None)
+    monkeypatch.setattr(http, "_httpx_pool", None)
+    monkeypatch.setattr(http, "_httpx_pool_users", {})
+    monkeypatch.setattr(http.time, "sleep", lambda _: None)
+
+
+def _respond(monkeypatch, *statuses: int, retry_after: str = "0"):
+    """Makes the shared httpx pool answer with the statuses, then 200."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status = statuses[len(calls) - 1] if len(calls) <= len(statuses) else 200
+        return httpx.Response(status, headers={"Retry-After": retry_after})
+
+    monkeypatch.setattr(http, "_httpx_pool", httpx.MockTransport(handler))
+    return calls
+
+
+class _Session:
+    """Answers with the statuses in turn, or raises the exceptions among them."""
+
+    def __init__(self, *statuses: int | Exception):
+        self.statuses = list(statuses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        status = self.statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+
+        response = requests.models.Response()
+        response.status_code = status
+        response.raw = io.BytesIO(b"")
+        return response
+
+
+class TestApiTransport:
+    def test_retries_throttled_requests(self, limiter, monkeypatch):
+        calls = _respond(monkeypatch, 429, 429)
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            response = client.get("https://api.example.com/v2/deployments/")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+        assert limiter.rate < limiter.max_rate
+
+    def test_gives_up_after_max_retries(self, limiter, monkeypatch):
+        calls = _respond(monkeypatch, *[429] * 100)
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            response = client.get("https://api.example.com/v2/deployments/")
+
+        assert response.status_code == 429
+        assert len(calls) == http.MAX_THROTTLE_RETRIES + 1
+
+    def test_retries_idempotent_requests(self, limiter, monkeypatch):
+        calls = _respond(monkeypatch, 503, 502)
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            response = client.delete("https://api.example.com/v2/deployments/a/")
+
+        assert response.status_code == 200
+        assert len(calls) == 3
+
+    def test_retried_delete_of_a_deleted_resource_succeeds(self, limiter, monkeypatch):
+        _respond(monkeypatch, 503, 404)
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            response = client.delete("https://api.example.com/v2/deployments/a/")
+
+        assert response.status_code == http.NO_CONTENT
+
+    def test_retried_delete_after_a_connect_error_fails(self, limiter, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(404)
+
+        monkeypatch.setattr(http, "_httpx_pool", httpx.MockTransport(handler))
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            response = client.delete("https://api.example.com/v2/deployments/a/")
+
+        assert response.status_code == 404
+        assert len(calls) == 2
+
+    def test_delete_of_a_missing_resource_fails(self, limiter, monkeypatch):
+        _respond(monkeypatch, 404)
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            response = client.delete("https://api.example.com/v2/deployments/a/")
+
+        assert response.status_code == 404
+
+    def test_does_not_retry_other_requests(self, limiter, monkeypatch):
+        calls = _respond(monkeypatch, 503)
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            response = client.post("https://api.example.com/v2/deployments/")
+
+        assert response.status_code == 503
+        assert len(calls) == 1
+
+    def test_retries_connection_errors(self, monkeypatch):
+        monkeypatch.setattr(ratelimit, "_limiter", None)
+        monkeypatch.setattr(ratelimit, "_configured", True)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        monkeypatch.setattr(http, "_httpx_pool", httpx.MockTransport(handler))
+
+        with (
+            httpx.Client(transport=ApiTransport()) as client,
+            pytest.raises(httpx.ConnectError),
+        ):
+            client.get("https://api.example.com/v2/deployments/")
+
+        assert len(calls) == http.HTTP_RETRIES + 1
+
+    def test_closing_a_client_keeps_the_pool(self, limiter, monkeypatch):
+        _respond(monkeypatch)
+        pool = http._httpx_pool
+
+        httpx.Client(transport=ApiTransport()).close()
+
+        assert http._get_httpx_pool() is pool
+
+
+class TestDeadline:
+    def test_caps_the_request_timeouts(self, limiter, monkeypatch):
+        calls = _respond(monkeypatch)
+
+        with (
+            httpx.Client(transport=ApiTransport(), timeout=30) as client,
+            deadline(5),
+        ):
+            client.get("https://api.example.com/v2/deployments/")
+
+        assert 0 < calls[0].extensions["timeout"]["read"] <= 5
+
+    def test_nested_deadlines_do_not_extend_the_outer_one(self):
+        with deadline(5), deadline(60):
+            assert http._time_left() <= 5
+
+        assert http._time_left() is None
+
+    def test_does_not_retry_past_the_deadline(self, limiter, monkeypatch):
+        session = _Session(503, 200)
+        monkeypatch.setattr(http, "_session", session)
+
+        with deadline(0):
+            response = api_request("GET", "https://api.example.com/tree")
+
+        assert response.status_code == 503
+        assert session.calls[0][2]["timeout"] == (http.MIN_TIMEOUT, http.MIN_TIMEOUT)
+
+
+class TestPools:
+    def test_session_is_shared(self):
+        assert get_session() is get_session()
+
+    def test_pool_grows_with_workers(self):
+        session = get_session()
+
+        configure_pool(32)
+        configure_pool(4)
+
+        adapter = session.get_adapter("https://api.example.com")
+        assert adapter._pool_maxsize == 32
+        # The requests are retried by api_request instead.
+        assert adapter.max_retries.total == 0
+        assert http._get_httpx_pool()._pool._max_connections == 32
+
+    def test_replaced_pools_are_closed(self):
+        session = get_session()
+        adapter = session.get_adapter("https://api.example.com")
+        pool = http._get_httpx_pool()
+
+        configure_pool(32)
+
+        assert adapter.poolmanager.pools.keys() == set()
+        assert pool._pool.connections == []
+        assert http._get_httpx_pool() is not pool
+
+    def test_replaced_pool_is_closed_after_its_responses(self, monkeypatch):
+        closed = []
+
+        class _Pool(httpx.MockTransport):
+            def close(self):
+                closed.append(self)
+
+        class _Body(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b"ok"
+
+        pool = _Pool(lambda request: httpx.Response(200, stream=_Body()))
+        monkeypatch.setattr(http, "_httpx_pool", pool)
+        client = httpx.Client(transport=ApiTransport())
+
+        with client.stream("GET", "https://api.example.com/v2/") as response:
+            configure_pool(32)
+            assert closed == []
+            assert response.read() == b"ok"
+
+        assert closed == [pool]
+        assert http._httpx_pool_users == {}
+
+    def test_read_responses_release_the_pool(self, limiter, monkeypatch):
+        _respond(monkeypatch, 503)
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            client.get("https://api.example.com/v2/deployments/")
+
+        assert http._httpx_pool_users == {}
+
+
+class TestApiRequest:
+    def test_retries_throttled_requests(self, limiter, monkeypatch):
+        session = _Session(429, 200)
+        monkeypatch.setattr(http, "_session", session)
+
+        response = api_request("GET", "https://api.example.com/tree")
+
+        assert response.status_code == 200
+        assert session.calls[0][2]["timeout"] == http.REQUEST_TIMEOUT
+
+    def test_retries_idempotent_requests(self, limiter, monkeypatch):
+        session = _Session(503, 502, 200)
+        monkeypatch.setattr(http, "_session", session)
+
+        response = api_request("PUT", "https://api.example.com/device")
+
+        assert response.status_code == 200
+        assert len(session.calls) == 3
+
+    def test_does_not_retry_other_requests(self, limiter, monkeypatch):
+        session = _Session(503, 200)
+        monkeypatch.setattr(http, "_session", session)
+
+        response = api_request("POST", "https://api.example.com/device")
+
+        assert response.status_code == 503
+        assert len(session.calls) == 1
+
+    def test_retried_delete_of_a_deleted_resource_succeeds(self, limiter, monkeypatch):
+        session = _Session(504, 404)
+        monkeypatch.setattr(http, "_session", session)
+
+        response = api_request("DELETE", "https://api.example.com/device/d")
+
+        assert response.status_code == http.NO_CONTENT
+        assert response.content == b""
+
+    def test_retried_delete_after_a_read_timeout_succeeds(self, limiter, monkeypatch):
+        monkeypatch.setattr(http, "_session", _Session(requests.ReadTimeout(), 404))
+
+        response = api_request("DELETE", "https://api.example.com/device/d")
+
+        assert response.status_code == http.NO_CONTENT
+
+    def test_retried_delete_after_a_connect_error_fails(self, limiter, monkeypatch):
+        session = _Session(requests.ConnectionError(), 404)
+        monkeypatch.setattr(http, "_session", session)
+
+        response = api_request("DELETE", "https://api.example.com/device/d")
+
+        assert response.status_code == 404
+        assert len(session.calls) == 2
+
+    def test_delete_of_a_missing_resource_fails(self, limiter, monkeypatch):
+        monkeypatch.setattr(http, "_session", _Session(404))
+
+        response = api_request("DELETE", "https://api.example.com/device/d")
+
+        assert response.status_code == 404
+
+    def test_closes_throttled_responses(self, limiter, monkeypatch):
+        session = _Session(429, 200)
+        monkeypatch.setattr(http, "_session", session)
+        closed = []
+        monkeypatch.setattr(
+            requests.Response, "close", lambda r: closed.append(r.status_code)
+        )
+
+        api_request("GET", "https://api.example.com/tree")
+
+        assert closed == [429]
+
+
+class TestPatchRestClient:
+    def test_uses_the_shared_session(self, limiter, monkeypatch):
+        session = _Session(429, 200)
+        monkeypatch.setattr(http, "_session", session)
+        monkeypatch.setattr(RestClient, "_request", RestClient._request)
+        patch_rest_client()
+        patch_rest_client()
+
+        response = (
+            RestClient("https://api.example.com/device")
+            .method(HttpMethod.PUT)
+            .headers({"project": "p"})
+            .execute(payload={"a": 1})
+        )
+
+        assert response.status_code == 200
+        method, url, kwargs = session.calls[-1]
+        assert (method, url) == ("PUT", "https://api.example.com/device")
+        assert kwargs["json"] == {"a": 1}
+        assert kwargs["headers"] == {"project": "p"}
+
+
+class TestRetryAfter:
+    def test_seconds(self):
+        assert retry_after({"Retry-After": "3"}) == 3
+
+    def test_http_date_in_the_past(self):
+        assert retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+
+    def test_missing_or_invalid(self):
+        assert retry_after({}) is None
+        assert retry_after({"Retry-After": "soon"}) is None
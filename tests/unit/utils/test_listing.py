@@ -0,0 +1,243 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the streaming output of the list commands."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import click
+import pytest
+from click.testing import CliRunner
+from munch import munchify
+
+from riocli.static_route import list as static_route_list
+from riocli.utils import inspect_with_format
+from riocli.utils import yaml_backend as yaml
+from riocli.utils.listing import (
+    GLOBAL_OUTPUTS,
+    StreamingTable,
+    iter_items,
+    prefetch,
+    print_list,
+)
+
+
+def _pages(count: int, size: int = 2, delay: float = 0.0, fetched=None):
+    for p in range(count):
+        time.sleep(delay)
+        if fetched is not None:
+            fetched.append(p)
+        yield [f"{p}-{i}" for i in range(size)]
+
+
+class TestPrefetch:
+    def test_keeps_the_order(self):
+        assert [i for page in prefetch(_pages(5)) for i in page] == [
+            f"{p}-{i}" for p in range(5) for i in range(2)
+        ]
+
+    def test_fetches_the_next_page_while_consuming(self):
+        start = time.monotonic()
+        for _ in prefetch(_pages(4, delay=0.05)):
+            time.sleep(0.05)
+
+        # Fetching and consuming sequentially would take 0.4s.
+        assert time.monotonic() - start < 0.35
+
+    def test_raises_errors_in_order(self):
+        def pages():
+            yield [1]
+            raise ValueError("page 2 failed")
+
+        result = []
+        with pytest.raises(ValueError, match="page 2 failed"):
+            for page in prefetch(pages()):
+                result.extend(page)
+
+        assert result == [1]
+
+    def test_stops_fetching_when_stopped(self):
+        fetched: list[int] = []
+        pages = prefetch(_pages(100, fetched=fetched))
+
+        next(pages)
+        pages.close()
+        time.sleep(0.3)
+
+        assert len(fetched) <= 3
+        assert not [t for t in threading.enumerate() if t.name == "prefetch"]
+
+
+class TestIterItems:
+    def test_limit(self):
+        fetched: list[int] = []
+
+        items = list(iter_items(_pages(100, fetched=fetched), limit=3))
+
+        assert items == ["0-0", "0-1", "1-0"]
+        assert len(fetched) < 100
+
+
+class TestStreamingTable:
+    def test_fixed_widths(self, capsys):
+        table = StreamingTable([("Name", 6), ("Phase", 5), ("Status", 0)])
+
+        table.print_row(["amr-01", "Succeeded", "Running for a long time"])
+        table.print_row([click.style("x", fg="red"), None, ""])
+
+        lines = click.unstyle(capsys.readouterr().out).splitlines()
+        assert lines == [
+            "Name    Phase  Status",
+            "------  -----  ------",
+            "amr-01  Suc..  Running for a long time",
+            "x              ",
+        ]
+
+
+def _root(*commands: click.Command) -> click.Group:
+    """A root group with the global --output option of the CLI."""
+
+    @click.group()
+    @click.option("--output", type=click.Choice(GLOBAL_OUTPUTS), default=None)
+    def root(output):
+        pass
+
+    for command in commands:
+        root.add_command(command)
+
+    return root
+
+
+@pytest.fixture
+def routes(monkeypatch):
+    routes = [
+        {"metadata": {"name": f"r{i}", "guid": f"g{i}"}, "spec": {"url": "u"}}
+        for i in range(120)
+    ]
+
+    class Client:
+        def list_staticroutes(self, cont=0, limit=50, label_selector=None):
+            page = routes[cont : cont + limit]
+            return munchify({"items": page, "metadata": {"continue": cont + limit}})
+
+    monkeypatch.setattr(static_route_list, "new_v2_client", lambda **_: Client())
+    return routes
+
+
+class TestStreamingList:
+    def test_static_routes_as_jsonl(self, routes):
+        result = CliRunner().invoke(
+            static_route_list.list_static_routes, ["--output", "jsonl", "--limit", "60"]
+        )
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert len(lines) == 60
+        assert json.loads(lines[59])["metadata"]["name"] == "r59"
+
+    def test_global_ndjson(self, routes):
+        root = _root(static_route_list.list_static_routes)
+
+        result = CliRunner().invoke(root, ["--output", "ndjson", "list", "--limit", "3"])
+
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert [json.loads(line)["metadata"]["name"] for line in lines] == [
+            "r0",
+            "r1",
+            "r2",
+        ]
+
+    def test_command_output_wins(self, routes):
+        root = _root(static_route_list.list_static_routes)
+
+        result = CliRunner().invoke(
+            root, ["--output", "ndjson", "list", "--output", "json", "--limit", "2"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert [r["metadata"]["name"] for r in json.loads(result.output)] == [
+            "r0",
+            "r1",
+        ]
+
+
+class TestGlobalOutput:
+    def test_print_list_records(self):
+        @click.command("list")
+        def list_things():
+            print_list([["a", click.style("Running", fg="green")]], ["Name", "Phase"])
+
+        result = CliRunner().invoke(_root(list_things), ["--output", "yaml", "list"])
+
+        assert result.exit_code == 0, result.output
+        assert yaml.safe_load(result.output) == [{"Name": "a", "Phase": "Running"}]
+
+    def test_print_list_table_by_default(self):
+        @click.command("list")
+        def list_things():
+            print_list([["a", "Running"]], ["Name", "Phase"])
+
+        result = CliRunner().invoke(_root(list_things), ["list"])
+
+        assert result.exit_code == 0, result.output
+        assert "Running" in result.output
+        assert "{" not in result.output
+
+    @pytest.fixture
+    def inspect(self, monkeypatch):
+        monkeypatch.setattr(click, "echo_via_pager", click.echo)
+
+        @click.command("inspect")
+        @click.option("-f", "--format", "format_type", default="yaml")
+        def inspect(format_type):
+            inspect_with_format({"name": "a", "items": [1, 2]}, format_type)
+
+        return _root(inspect)
+
+    def test_inspect_as_ndjson(self, inspect):
+        result = CliRunner().invoke(inspect, ["--output", "ndjson", "inspect"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == '{"name": "a", "items": [1, 2]}\n'
+
+    def test_inspect_format_wins(self, inspect):
+        result = CliRunner().invoke(
+            inspect, ["--output", "ndjson", "inspect", "--format", "yaml"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert result.output.startswith("items:")
+
+    def test_fixed_format_is_kept(self, monkeypatch):
+        monkeypatch.setattr(click, "echo_via_pager", click.echo)
+
+        @click.command("create")
+        def create():
+            inspect_with_format({"name": "a"}, format_type="json")
+
+        result = CliRunner().invoke(_root(create), ["--output", "yaml", "create"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == {"name": "a"}
+
+    def test_inspect_ignores_table(self, inspect):
+        result = CliRunner().invoke(inspect, ["--output", "table", "inspect"])
+
+        assert result.exit_code == 0, result.output
+        assert yaml.safe_load(result.output) == {"name": "a", "items": [1, 2]}
@@ -0,0 +1,48 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for matching resources by name, GUID or regex."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from riocli.utils.matcher import NameMatcher
+
+
+class TestNameMatcher:
+    def test_literal_name(self):
+        matcher = NameMatcher("amr-01")
+
+        assert matcher.literal
+        assert matcher.pattern is None
+        assert matcher.matches("amr-01")
+        assert not matcher.matches("amr-011")
+
+    def test_guid(self):
+        assert NameMatcher("dep-abc").matches("amr-01", guid="dep-abc")
+
+    def test_regex_matches_whole_name(self):
+        matcher = NameMatcher("amr-0[1-3]")
+
+        assert not matcher.literal
+        assert matcher.matches("amr-02")
+        assert not matcher.matches("xamr-02")
+        assert not matcher.matches("amr-024")
+
+    def test_invalid_regex(self):
+        with pytest.raises(re.error):
+            NameMatcher("amr-[")
@@ -0,0 +1,251 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the persistent name to GUID cache."""
+
+from __future__ import annotations
+
+import click
+import pytest
+from munch import Munch
+from rapyuta_io.utils.error import ResourceNotFoundError, UnauthorizedError
+
+from riocli.config.config import Configuration
+from riocli.device import util as device_util
+from riocli.utils import namecache
+from riocli.utils.namecache import DEVICE, NameCache, invalidates_names
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock, monkeypatch):
+    cache = NameCache("org", "project", ttl=60, path=tmp_path / "c.json", clock=clock)
+    monkeypatch.setattr(namecache, "get_name_cache", lambda: cache)
+    monkeypatch.setattr(device_util, "get_name_cache", lambda: cache)
+    return cache
+
+
+class FakeDevice(Munch):
+    def is_online(self) -> bool:
+        return self.status == "ONLINE"
+
+
+class FakeClient:
+    def __init__(self, *devices: FakeDevice):
+        self.devices = {d.uuid: d for d in devices}
+        self.listed = 0
+
+    def get_all_devices(self, device_name=None, online_device=False):
+        self.listed += 1
+        return [
+            d
+            for d in self.devices.values()
+            if (device_name is None or device_name in d.name)
+            and (d.is_online() or not online_device)
+        ]
+
+    def get_device(self, device_id):
+        if device_id not in self.devices:
+            raise ResourceNotFoundError("device not found")
+
+        return self.devices[device_id]
+
+
+def _device(name: str, uuid: str, status: str = "ONLINE") -> FakeDevice:
+    return FakeDevice(name=name, uuid=uuid, status=status)
+
+
+class TestNameCache:
+    def test_persists_across_instances(self, cache, clock, tmp_path):
+        cache.set(DEVICE, "amr-1", "guid-1")
+
+        reloaded = NameCache("org", "project", path=tmp_path / "c.json", clock=clock)
+
+        assert reloaded.get(DEVICE, "amr-1") == "guid-1"
+
+    def test_entries_expire(self, cache, clock):
+        cache.set(DEVICE, "amr-1", "guid-1")
+
+        clock.now += 60
+
+        assert cache.get(DEVICE, "amr-1") is None
+
+    def test_ambiguous_names_are_not_cached(self, cache):
+        cache.update(DEVICE, [("amr", "guid-1"), ("amr", "guid-2"), ("b", "guid-3")])
+
+        assert cache.get(DEVICE, "amr") is None
+        assert cache.get(DEVICE, "b") == "guid-3"
+
+    def test_invalidate(self, cache):
+        cache.set(DEVICE, "amr-1", "guid-1")
+        cache.set("deployment", "dep", "guid-2")
+
+        cache.invalidate(DEVICE)
+        assert cache.get(DEVICE, "amr-1") is None
+        assert cache.get("deployment", "dep") == "guid-2"
+
+        cache.invalidate()
+        assert cache.get("deployment", "dep") is None
+
+    def test_corrupt_file_is_empty(self, tmp_path):
+        path = tmp_path / "c.json"
+        path.write_text("{not json")
+
+        assert NameCache("org", "project", path=path).get(DEVICE, "amr-1") is None
+
+    def test_save_errors_are_logged(self, tmp_path, caplog):
+        path = tmp_path / "file"
+        path.write_text("")
+        cache = NameCache("org", "project", path=path / "c.json")
+
+        with caplog.at_level("DEBUG", logger="riocli.utils.namecache"):
+            cache.set(DEVICE, "amr-1", "guid-1")
+
+        assert "Failed to save the name cache" in caplog.text
+        assert cache.get(DEVICE, "amr-1") == "guid-1"
+
+    def test_invalidates_names_after_failures(self, cache):
+        cache.set(DEVICE, "amr-1", "guid-1")
+
+        @invalidates_names(DEVICE)
+        def delete():
+            raise SystemExit(1)
+
+        with pytest.raises(SystemExit):
+            delete()
+
+        assert cache.get(DEVICE, "amr-1") is None
+
+    def test_disabled_with_zero_ttl(self, monkeypatch):
+        monkeypatch.setattr(namecache, "_ttl", None)
+        monkeypatch.setenv("RIO_NAME_CACHE_TTL", "0")
+
+        assert namecache.get_name_cache() is None
+
+
+class TestGetNameCache:
+    @pytest.fixture(autouse=True)
+    def unconfigured(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(namecache, "_ttl", None)
+        monkeypatch.setattr(namecache, "_caches", {})
+        monkeypatch.setattr(namecache, "get_app_dir", lambda name: str(tmp_path))
+
+    def test_malformed_ttl_is_ignored(self, monkeypatch, capsys):
+        monkeypatch.setenv("RIO_NAME_CACHE_TTL", "5m")
+
+        with _command(_Config("org", "project")):
+            cache = namecache.get_name_cache()
+            assert namecache.get_name_cache() is cache
+
+        assert cache.ttl == namecache.DEFAULT_TTL
+        assert capsys.readouterr().err.count("Ignoring RIO_NAME_CACHE_TTL='5m'") == 1
+
+    def test_project_of_the_loaded_config(self, monkeypatch):
+        monkeypatch.delenv("RIO_NAME_CACHE_TTL", raising=False)
+        monkeypatch.setattr(namecache, "_load_config", _unexpected)
+
+        with _command(_Config("org", "project")):
+            cache = namecache.get_name_cache()
+
+        assert cache.path.parts[-2:] == ("org", "project.json")
+
+    def test_no_project_selected(self, monkeypatch):
+        monkeypatch.delenv("RIO_NAME_CACHE_TTL", raising=False)
+
+        with _command(_Config("org", None)):
+            assert namecache.get_name_cache() is None
+
+
+class _Config(Configuration):
+    def __init__(self, organization, project):
+        self.data = {"organization_id": organization, "project_id": project}
+
+
+def _command(config: Configuration) -> click.Context:
+    return click.Context(click.Command("rio"), obj=config)
+
+
+def _unexpected():
+    raise AssertionError("the config file was read again")
+
+
+class TestDeviceResolution:
+    def test_listing_fills_the_cache(self, cache):
+        client = FakeClient(_device("amr-1", "guid-1"), _device("amr-2", "guid-2"))
+
+        assert device_util.fetch_devices(client, "amr-.*", include_all=False)
+        assert device_util.find_device_guid(client, "amr-2") == "guid-2"
+        assert [d.uuid for d in device_util.fetch_devices(client, "amr-1", False)] == [
+            "guid-1"
+        ]
+        assert client.listed == 1
+
+    def test_regex_is_matched_against_every_device(self, cache, monkeypatch):
+        client = FakeClient(_device("amr", "guid-0"), _device("amr-1", "guid-1"))
+        names = []
+        list_devices = client.get_all_devices
+
+        def get_all_devices(device_name=None, online_device=False):
+            names.append(device_name)
+            return list_devices(device_name, online_device)
+
+        monkeypatch.setattr(client, "get_all_devices", get_all_devices)
+
+        devices = device_util.fetch_devices(client, "amr.*", include_all=False)
+
+        assert sorted(d.uuid for d in devices) == ["guid-0", "guid-1"]
+        assert names == [None]
+
+    def test_cached_device_respects_online_filter(self, cache):
+        client = FakeClient(_device("amr-1", "guid-1", status="OFFLINE"))
+        cache.set(DEVICE, "amr-1", "guid-1")
+
+        assert (
+            device_util.fetch_devices(client, "amr-1", False, online_devices=True) == []
+        )
+        assert client.listed == 0
+
+    def test_stale_guid_is_forgotten(self, cache):
+        client = FakeClient(_device("amr-1", "guid-2"))
+        cache.set(DEVICE, "amr-1", "guid-1")
+
+        assert device_util.find_device_by_name(client, "amr-1").uuid == "guid-2"
+        assert cache.get(DEVICE, "amr-1") is None
+
+    def test_errors_other_than_not_found_are_raised(self, cache, monkeypatch):
+        client = FakeClient(_device("amr-1", "guid-1"))
+        cache.set(DEVICE, "amr-1", "guid-1")
+
+        def get_device(device_id):
+            raise UnauthorizedError("token expired")
+
+        monkeypatch.setattr(client, "get_device", get_device)
+
+        with pytest.raises(UnauthorizedError):
+            device_util.find_device_by_name(client, "amr-1")
+
+        assert cache.get(DEVICE, "amr-1") == "guid-1"
+        assert client.listed == 0
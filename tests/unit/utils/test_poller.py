@@ -0,0 +1,91 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the polling backoff helpers."""
+
+from __future__ import annotations
+
+from riocli.utils.poller import Backoff, Poller
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _poller(clock: FakeClock, **kwargs) -> Poller:
+    kwargs.setdefault("jitter", 0)
+    return Poller(sleep=clock.sleep, clock=clock, **kwargs)
+
+
+class TestBackoff:
+    def test_grows_up_to_maximum(self):
+        backoff = Backoff(maximum=6, initial=0.5, jitter=0)
+
+        assert [backoff.delay(i) for i in range(6)] == [0.5, 1, 2, 4, 6, 6]
+
+    def test_jitter_stays_within_bounds(self):
+        backoff = Backoff(maximum=10, initial=10, jitter=0.2)
+
+        assert all(8 <= backoff.delay(0) <= 12 for _ in range(100))
+
+    def test_initial_is_capped_by_maximum(self):
+        assert Backoff(maximum=0.1, jitter=0).delay(0) == 0.1
+
+
+class TestPoller:
+    def test_first_probe_is_immediate(self):
+        clock = FakeClock()
+
+        for _ in _poller(clock, timeout=10, interval=2):
+            break
+
+        assert clock.sleeps == []
+
+    def test_slow_first_probe(self):
+        clock = FakeClock()
+
+        for _ in _poller(clock, timeout=10, interval=2, fast_first=False):
+            break
+
+        assert clock.sleeps == [0.5]
+
+    def test_backs_off_until_deadline(self):
+        clock = FakeClock()
+
+        attempts = list(_poller(clock, timeout=10, interval=3))
+
+        assert clock.sleeps == [0.5, 1, 2, 3, 3, 0.5]
+        assert len(attempts) == 7
+        assert clock.now == 10
+
+    def test_from_retries(self):
+        poller = Poller.from_retries(50, 6)
+
+        assert poller.timeout == 300
+        assert poller.backoff.maximum == 6
+
+    def test_zero_timeout_probes_once(self):
+        clock = FakeClock()
+
+        assert list(_poller(clock, timeout=0, interval=5)) == [0]
+        assert clock.sleeps == []
@@ -0,0 +1,136 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the token bucket rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from riocli.utils import ratelimit
+from riocli.utils.ratelimit import AdaptiveRateLimiter, RateLimiter, get_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TestRateLimiter:
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=2, burst=3, sleep=clock.sleep, clock=clock)
+
+        waits = [limiter.acquire() for _ in range(5)]
+
+        assert waits == [0, 0, 0, 0.5, 0.5]
+
+    def test_refills_while_idle(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=1, burst=2, sleep=clock.sleep, clock=clock)
+        limiter.acquire()
+        limiter.acquire()
+
+        clock.now += 10
+
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 1
+
+    def test_rate_must_be_positive(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+class TestAdaptiveRateLimiter:
+    def test_throttle_halves_rate_and_pauses(self):
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(rate=8, burst=8, sleep=clock.sleep, clock=clock)
+
+        limiter.throttled(retry_after=2)
+
+        assert limiter.rate == 4
+        assert limiter.acquire() == pytest.approx(2.25)
+
+    def test_success_recovers_rate(self):
+        limiter = AdaptiveRateLimiter(rate=10, min_rate=1)
+        for _ in range(10):
+            limiter.throttled(retry_after=0)
+
+        assert limiter.rate == 1
+
+        for _ in range(100):
+            limiter.succeeded()
+
+        assert limiter.rate == 10
+
+    def test_unlimited_until_throttled(self):
+        clock = FakeClock()
+        limiter = AdaptiveRateLimiter(sleep=clock.sleep, clock=clock)
+
+        for _ in range(21):
+            assert limiter.acquire() == 0
+            clock.now += 0.05
+
+        limiter.throttled(retry_after=0)
+
+        assert limiter.max_rate == pytest.approx(20)
+        assert limiter.rate == pytest.approx(10)
+        assert limiter.acquire() == pytest.approx(0.1)
+
+        for _ in range(100):
+            limiter.succeeded()
+
+        assert limiter.rate is None
+        assert limiter.acquire() == 0
+
+
+@pytest.fixture
+def unconfigured(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_limiter", None)
+    monkeypatch.setattr(ratelimit, "_configured", False)
+
+
+@pytest.mark.usefixtures("unconfigured")
+class TestGetRateLimiter:
+    def test_no_ceiling_by_default(self, monkeypatch):
+        monkeypatch.delenv("RIO_RATE_LIMIT", raising=False)
+
+        assert get_rate_limiter() is get_rate_limiter()
+        assert get_rate_limiter().rate is None
+
+    def test_process_wide_limiter(self, monkeypatch):
+        monkeypatch.setenv("RIO_RATE_LIMIT", "5")
+
+        assert get_rate_limiter() is get_rate_limiter()
+        assert get_rate_limiter().max_rate == 5
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("RIO_RATE_LIMIT", "0")
+
+        assert get_rate_limiter() is None
+
+    @pytest.mark.parametrize("value", ["fast", "inf"])
+    def test_invalid_value_is_reported_once(self, monkeypatch, capsys, value):
+        monkeypatch.setenv("RIO_RATE_LIMIT", value)
+
+        assert get_rate_limiter().rate is None
+        assert get_rate_limiter().rate is None
+        assert capsys.readouterr().err.count(f"Ignoring RIO_RATE_LIMIT='{value}'") == 1
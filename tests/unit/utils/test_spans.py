@@ -0,0 +1,185 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the spans of the apply runs and their export."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from riocli.apply.scheduler import Scheduler
+from riocli.utils.spans import OTLP_ENDPOINT_ENV, OTLP_ENV, SPANS_ENV, SpanRecorder
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture
+def recorder():
+    return SpanRecorder("rio apply", clock=_Clock())
+
+
+def _by_name(recorder: SpanRecorder):
+    return {s.name: s for s in recorder.spans}
+
+
+class TestSpanRecorder:
+    def test_spans_nest_on_the_same_thread(self, recorder):
+        with recorder.span("load"), recorder.span("render", files=2):
+            pass
+        with recorder.span("graph"):
+            pass
+
+        spans = _by_name(recorder)
+        assert spans["load"].parent_id == recorder.root.span_id
+        assert spans["render"].parent_id == spans["load"].span_id
+        assert spans["render"].attributes == {"files": 2}
+        assert spans["graph"].parent_id == recorder.root.span_id
+        assert spans["load"].start < spans["render"].start
+        assert spans["render"].end < spans["load"].end
+
+    def test_records_errors(self, recorder):
+        with pytest.raises(ValueError), recorder.span("load"):
+            raise ValueError("invalid manifest")
+
+        assert _by_name(recorder)["load"].error == "invalid manifest"
+
+    def test_wrap_uses_the_parent_across_threads(self, recorder):
+        with recorder.span("objects") as parent:
+            op = recorder.wrap(lambda key: None, parent, "apply")
+            workers = [threading.Thread(target=op, args=(k,)) for k in "ab"]
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join()
+
+        spans = _by_name(recorder)
+        assert spans["apply a"].parent_id == parent.span_id
+        assert spans["apply b"].parent_id == parent.span_id
+        assert spans["apply a"].attributes == {"key": "a"}
+
+    def test_chrome_trace(self, recorder):
+        with recorder.span("load"):
+            pass
+        recorder.add("wait b", 101.0, 103.5)
+
+        trace = recorder.chrome_trace()
+        events = {(e["name"], e["ph"]): e for e in trace["traceEvents"]}
+
+        load = events[("load", "X")]
+        assert load["ts"] == pytest.approx(1e6)
+        assert load["dur"] == pytest.approx(1e6)
+        assert events[("rio apply", "X")]["ts"] == 0
+        assert events[("wait b", "b")]["ts"] == pytest.approx(0)
+        assert events[("wait b", "e")]["ts"] == pytest.approx(2.5e6)
+        assert events[("wait b", "b")]["id"] == events[("wait b", "e")]["id"]
+        assert events[("thread_name", "M")]["args"]["name"] == "MainThread"
+        json.dumps(trace)
+
+    def test_otlp_payload(self, recorder):
+        with pytest.raises(RuntimeError), recorder.span("apply a", key="a"):
+            raise RuntimeError("conflict")
+
+        payload = recorder.otlp_payload()
+        spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        root, span = spans
+
+        assert "parentSpanId" not in root
+        assert span["parentSpanId"] == root["spanId"]
+        assert span["traceId"] == root["traceId"] == recorder.trace_id
+        assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+        assert span["status"] == {"code": 2, "message": "conflict"}
+        assert {"key": "key", "value": {"stringValue": "a"}} in span["attributes"]
+        assert int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"]) == 10**9
+
+    def test_export_writes_the_trace_file(self, recorder, monkeypatch, tmp_path):
+        path = tmp_path / "apply.json"
+        monkeypatch.setenv(SPANS_ENV, str(path))
+        monkeypatch.delenv(OTLP_ENV, raising=False)
+
+        recorder.export()
+
+        assert json.loads(path.read_text())["traceEvents"]
+
+    def test_export_errors_do_not_fail(self, recorder, monkeypatch, tmp_path, capsys):
+        monkeypatch.setenv(SPANS_ENV, str(tmp_path / "missing" / "apply.json"))
+
+        recorder.export()
+
+        assert "Failed to export the trace" in capsys.readouterr().err
+
+    def test_export_otlp(self, recorder, monkeypatch):
+        sent = {}
+
+        class _Session:
+            def post(self, url, json, timeout):
+                sent.update(url=url, json=json)
+                return self
+
+            def raise_for_status(self):
+                pass
+
+        monkeypatch.setattr("riocli.utils.http.get_session", lambda: _Session())
+
+        recorder.export_otlp("http://localhost:4318/")
+
+        assert sent["url"] == "http://localhost:4318/v1/traces"
+        assert sent["json"]["resourceSpans"]
+
+    def test_otlp_export_is_opt_in(self, recorder, monkeypatch):
+        exported = []
+        monkeypatch.setattr(recorder, "export_otlp", exported.append)
+        monkeypatch.delenv(SPANS_ENV, raising=False)
+        monkeypatch.setenv(OTLP_ENDPOINT_ENV, "http://collector:4318")
+
+        monkeypatch.delenv(OTLP_ENV, raising=False)
+        recorder.export()
+        assert exported == []
+
+        monkeypatch.setenv(OTLP_ENV, "1")
+        recorder.export()
+        assert exported == ["http://collector:4318"]
+
+        monkeypatch.delenv(OTLP_ENDPOINT_ENV)
+        recorder.export()
+        assert exported[-1] == "http://localhost:4318"
+
+
+class TestApplierSpans:
+    def test_wait_spans(self, monkeypatch):
+        from riocli.apply.parse import Applier
+
+        applier = Applier.__new__(Applier)
+        applier.spans = SpanRecorder("rio apply")
+        scheduler = Scheduler({"a": set(), "b": {"a"}}, workers=1)
+
+        applier._run_traced(scheduler, lambda key: None, "apply")
+
+        spans = _by_name(applier.spans)
+        objects = spans["objects"]
+        assert spans["apply a"].parent_id == objects.span_id
+        assert spans["apply b"].parent_id == objects.span_id
+        assert spans["wait b"].detached
+        assert spans["wait b"].attributes == {"dependencies": "a"}
+        assert spans["wait b"].end >= spans["apply a"].end
+        assert "wait a" not in spans
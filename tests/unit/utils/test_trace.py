@@ -0,0 +1,211 @@
+# Copyright 2025 Rapyuta Robotics
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the tracing of the API calls."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import httpx
+import pytest
+import requests
+
+from riocli.utils import http, trace
+from riocli.utils.http import ApiTransport, api_request
+from riocli.utils.poller import Poller
+from riocli.utils.trace import (
+    Tracer,
+    enable_tracing_from_env,
+    endpoint,
+    percentile,
+    trace_request,
+)
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    tracer = Tracer(io.StringIO())
+    monkeypatch.setattr(trace, "_tracer", tracer)
+    return tracer
+
+
+@pytest.fixture(autouse=True)
+def pools(monkeypatch):
+    monkeypatch.setattr(http, "_session", None)
+    monkeypatch.setattr(http, "_httpx_pool", None)
+    monkeypatch.setattr(http.time, "sleep", lambda _: None)
+
+
+def _records(tracer: Tracer) -> list[dict]:
+    return [json.loads(line) for line in tracer.output.getvalue().splitlines()]
+
+
+class TestEndpoint:
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            (
+                "https://api.rapyuta.io/v2/deployments/amr-nav/history/",
+                "/v2/deployments/{name}/history/",
+            ),
+            (
+                "https://api.rapyuta.io/v2/devices/daemons/"
+                "0d5b6c2e-4a36-4c3e-9d52-2d1f7b1c0a9e/",
+                "/v2/devices/daemons/{id}/",
+            ),
+            (
+                "https://api.rapyuta.io/v2/projects/project-cn6aq5a8sh9hhs3u64j0/owner/",
+                "/v2/projects/{id}/owner/",
+            ),
+            (
+                "https://gaapiserver.rapyuta.io/api/device-manager/v0/devices/"
+                "0d5b6c2e-4a36-4c3e-9d52-2d1f7b1c0a9e/?arch=amd64",
+                "/api/device-manager/v0/devices/{id}/",
+            ),
+        ],
+    )
+    def test_replaces_identifiers(self, url, expected):
+        assert endpoint(url) == expected
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([7.0], 95) == 7
+        assert percentile([], 50) == 0
+
+
+class TestTracing:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(trace, "_tracer", None)
+
+        with trace_request("GET", "https://x/v2/roles/") as call:
+            assert call is None
+
+    def test_v2_calls_with_retries(self, tracer, monkeypatch):
+        statuses = [503, 200]
+
+        def handler(request):
+            return httpx.Response(
+                statuses.pop(0), content=b"{}", headers={"Content-Length": "2"}
+            )
+
+        monkeypatch.setattr(http, "_httpx_pool", httpx.MockTransport(handler))
+
+        with httpx.Client(transport=ApiTransport()) as client:
+            client.get("https://api.rapyuta.io/v2/secrets/db/")
+
+        [record] = _records(tracer)
+        assert record["method"] == "GET"
+        assert record["endpoint"] == "/v2/secrets/{name}/"
+        assert record["status"] == 200
+        assert record["bytes"] == 2
+        assert record["retries"] == 1
+
+    def test_v1_calls(self, tracer, monkeypatch):
+        class Session:
+            def request(self, method, url, **kwargs):
+                response = requests.models.Response()
+                response.status_code = 404
+                response._content = b"missing"
+                return response
+
+        monkeypatch.setattr(http, "_session", Session())
+
+        api_request("DELETE", "https://gaapiserver.rapyuta.io/api/device/1234/")
+
+        [record] = _records(tracer)
+        assert (record["method"], record["endpoint"]) == ("DELETE", "/api/device/{id}/")
+        assert record["bytes"] == 7
+        assert tracer.summary()[0][:6] == ["DELETE", "/api/device/{id}/", 1, 1, 0, 7]
+
+    def test_errors_are_recorded(self, tracer):
+        with pytest.raises(httpx.ConnectError):
+            with trace_request("GET", "https://x/v2/roles/"):
+                raise httpx.ConnectError("refused")
+
+        assert _records(tracer)[0]["error"] == "ConnectError"
+
+    def test_poller_sleeps(self, tracer):
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        poller = Poller(
+            timeout=3, interval=1, jitter=0, sleep=sleep, clock=lambda: now[0]
+        )
+        for _ in poller:
+            pass
+
+        assert poller.slept == pytest.approx(3)
+        assert tracer.slept == pytest.approx(3)
+
+    def test_summary(self, tracer, capsys):
+        for latency in (0.1, 0.2, 0.3):
+            call = trace.RequestTrace("GET", "https://x/v2/roles/")
+            call.status = 200
+            tracer.record(call, 0, latency)
+        tracer.record_sleep(1.5)
+
+        tracer.print_summary()
+
+        err = capsys.readouterr().err
+        assert "/v2/roles/" in err
+        assert "3 calls in 0.60s, 0 retries, 1.50s sleeping in pollers" in err
+
+
+class TestEnable:
+    def test_trace_file_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(trace, "_tracer", None)
+        monkeypatch.setattr(trace.atexit, "register", lambda f: None)
+        monkeypatch.setenv("RIO_TRACE", str(tmp_path / "trace.jsonl"))
+
+        tracer = enable_tracing_from_env()
+        tracer.record_sleep(0.5)
+        tracer.close()
+
+        lines = (tmp_path / "trace.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["seconds"] == 0.5
+
+    def test_flag_without_file(self, monkeypatch):
+        monkeypatch.setattr(trace, "_tracer", None)
+        monkeypatch.setattr(trace.atexit, "register", lambda f: None)
+        monkeypatch.delenv("RIO_TRACE", raising=False)
+
+        assert enable_tracing_from_env() is None
+        assert enable_tracing_from_env(flag=True).output is None
+
+    @pytest.mark.parametrize("value", ["0", "false", "No", "off", " "])
+    def test_falsy_values_disable_tracing(self, monkeypatch, tmp_path, value):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(trace, "_tracer", None)
+        monkeypatch.setattr(trace.atexit, "register", lambda f: None)
+        monkeypatch.setenv("RIO_TRACE", value)
+
+        assert enable_tracing_from_env() is None
+        assert enable_tracing_from_env(flag=True).output is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_true_enables_the_summary_only(self, monkeypatch):
+        monkeypatch.setattr(trace, "_tracer", None)
+        monkeypatch.setattr(trace.atexit, "register", lambda f: None)
+        monkeypatch.setenv("RIO_TRACE", "true")
+
+        assert enable_tracing_from_env().output is None